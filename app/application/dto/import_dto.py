@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class ImportProjectRowDTO:
+    line: int
+    title: str
+    deadline: datetime
+    id: UUID | None = None
+    is_completed: bool = False
+
+
+@dataclass
+class ImportTaskRowDTO:
+    line: int
+    title: str
+    deadline: datetime
+    id: UUID | None = None
+    description: str | None = None
+    is_completed: bool = False
+    project_id: UUID | None = None
+
+
+@dataclass
+class ImportRowErrorDTO:
+    line: int
+    error: str
+
+
+@dataclass
+class ImportChunkResultDTO:
+    imported: int
+    errors: list[ImportRowErrorDTO] = field(default_factory=list)
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
+from app.application.dto.task_dto import TaskDTO
+
 
 @dataclass
 class CreateProjectDTO:
@@ -15,6 +17,16 @@ class UpdateProjectDTO:
     deadline: datetime | None = None
 
 
+@dataclass
+class ProjectStatsDTO:
+    project_id: UUID
+    total_tasks: int
+    completed_tasks: int
+    open_tasks: int
+    overdue_tasks: int
+    next_deadline: datetime | None
+
+
 @dataclass
 class ProjectDTO:
     id: UUID
@@ -23,3 +35,11 @@ class ProjectDTO:
     is_completed: bool
     created_at: datetime
     updated_at: datetime
+    stats: ProjectStatsDTO | None = None
+    tasks: list[TaskDTO] | None = None
+
+
+@dataclass
+class ProjectLookupDTO:
+    projects: list[ProjectDTO]
+    missing_ids: list[UUID]
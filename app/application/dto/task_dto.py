@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
+from app.domain.exceptions import DomainError
+
 
 @dataclass
 class CreateTaskDTO:
@@ -10,6 +12,11 @@ class CreateTaskDTO:
     deadline: datetime | None
 
 
+@dataclass
+class CreateTaskBatchItemDTO(CreateTaskDTO):
+    project_id: UUID | None = None
+
+
 @dataclass
 class UpdateTaskDTO:
     title: str | None = None
@@ -30,6 +37,26 @@ class TaskDTO:
     is_overdue: bool
 
 
+@dataclass
+class TaskBatchResultDTO:
+    task: TaskDTO | None = None
+    error: DomainError | None = None
+
+
+@dataclass
+class TaskLookupDTO:
+    tasks: list[TaskDTO]
+    missing_ids: list[UUID]
+
+
+@dataclass
+class TaskChangesDTO:
+    tasks: list[TaskDTO]
+    deleted_ids: list[UUID]
+    next_since: int
+    has_more: bool
+
+
 @dataclass
 class TaskFilterDTO:
     is_completed: bool | None = None
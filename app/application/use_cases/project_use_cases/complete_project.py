@@ -21,5 +21,5 @@ class CompleteProjectUseCase(ProjectUseCase):
             raise NotFoundError("Project not found")
         tasks = self._task_repository.get_by_project_id(project_id)
         project.mark_as_completed(tasks)
-        updated_project = self._project_repository.save(project)
+        updated_project = self._project_repository.update(project)
         return self._to_dto(updated_project)
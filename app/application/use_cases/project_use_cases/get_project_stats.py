@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from app.application.dto.project_dto import ProjectStatsDTO
+from app.application.use_cases.project_use_cases.project_use_case import (
+    ProjectUseCase,
+)
+from app.domain.clock import Clock, SystemClock
+from app.domain.repositories.project_repository import ProjectRepository
+
+
+class GetProjectStatsUseCase(ProjectUseCase):
+
+    def __init__(
+        self, project_repository: ProjectRepository, clock: Clock | None = None
+    ) -> None:
+        self._project_repository = project_repository
+        self._clock = clock or SystemClock()
+
+    def execute(self, project_ids: list[UUID] | None = None) -> list[ProjectStatsDTO]:
+        stats = self._project_repository.get_stats(self._clock.now(), project_ids)
+        return [self._to_stats_dto(s) for s in stats]
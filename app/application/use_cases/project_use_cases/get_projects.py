@@ -0,0 +1,100 @@
+from datetime import datetime
+from uuid import UUID
+
+from app.application.dto.project_dto import ProjectDTO, ProjectLookupDTO
+from app.application.use_cases.project_use_cases.project_use_case import (
+    ProjectUseCase,
+)
+from app.application.use_cases.task_use_cases.task_use_case import to_task_dtos
+from app.domain.clock import Clock, SystemClock
+from app.domain.exceptions import NotFoundError
+from app.domain.repositories.project_repository import (
+    ProjectRepository,
+    ProjectWithTasks,
+)
+
+
+class GetProjectsUseCase(ProjectUseCase):
+
+    def __init__(
+        self, project_repository: ProjectRepository, clock: Clock | None = None
+    ) -> None:
+        self._project_repository = project_repository
+        self._clock = clock or SystemClock()
+
+    def execute(
+        self, include_stats: bool = False, include_tasks: bool = False
+    ) -> list[ProjectDTO]:
+        now = self._clock.now()
+        if include_tasks:
+            projects = [
+                self._with_tasks_to_dto(p, now)
+                for p in self._project_repository.get_all_with_tasks()
+            ]
+        else:
+            projects = [self._to_dto(p) for p in self._project_repository.get_all()]
+        if include_stats and projects:
+            self._attach_stats(projects, now)
+        return projects
+
+    def execute_one(
+        self,
+        project_id: UUID,
+        include_stats: bool = False,
+        include_tasks: bool = False,
+    ) -> ProjectDTO:
+        now = self._clock.now()
+        if include_tasks:
+            found = self._project_repository.get_by_id_with_tasks(project_id)
+            project = self._with_tasks_to_dto(found, now) if found else None
+        else:
+            found = self._project_repository.get_by_id(project_id)
+            project = self._to_dto(found) if found else None
+        if project is None:
+            raise NotFoundError("Project not found")
+        if include_stats:
+            self._attach_stats([project], now, [project_id])
+        return project
+
+    def execute_many(
+        self,
+        project_ids: list[UUID],
+        include_stats: bool = False,
+        include_tasks: bool = False,
+    ) -> ProjectLookupDTO:
+        now = self._clock.now()
+        if include_tasks:
+            found = {
+                p.project.id: self._with_tasks_to_dto(p, now)
+                for p in self._project_repository.get_all_with_tasks(project_ids)
+            }
+            ids = list(dict.fromkeys(project_ids))
+            lookup = ProjectLookupDTO(
+                projects=[found[i] for i in ids if i in found],
+                missing_ids=[i for i in ids if i not in found],
+            )
+        else:
+            result = self._project_repository.get_many(project_ids)
+            lookup = ProjectLookupDTO(
+                projects=[self._to_dto(p) for p in result.projects],
+                missing_ids=result.missing_ids,
+            )
+        if include_stats and lookup.projects:
+            self._attach_stats(lookup.projects, now, [p.id for p in lookup.projects])
+        return lookup
+
+    def _attach_stats(
+        self,
+        projects: list[ProjectDTO],
+        now: datetime,
+        project_ids: list[UUID] | None = None,
+    ) -> None:
+        stats = self._project_repository.get_stats(now, project_ids)
+        by_project = {s.project_id: self._to_stats_dto(s) for s in stats}
+        for project in projects:
+            project.stats = by_project.get(project.id)
+
+    def _with_tasks_to_dto(self, found: ProjectWithTasks, now: datetime) -> ProjectDTO:
+        project = self._to_dto(found.project)
+        project.tasks = to_task_dtos(found.tasks, now)
+        return project
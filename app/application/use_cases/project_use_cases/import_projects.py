@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.application.dto.import_dto import (
+    ImportChunkResultDTO,
+    ImportProjectRowDTO,
+    ImportRowErrorDTO,
+)
+from app.application.use_cases.project_use_cases.project_use_case import (
+    ProjectUseCase,
+)
+from app.domain.entities.project import Project
+from app.domain.repositories.project_repository import ProjectRepository
+
+
+class ImportProjectsUseCase(ProjectUseCase):
+    """Imports one chunk of projects with a single bulk insert.
+
+    Rows that break a rule are reported by line and skipped. Imported
+    data is historical, so past deadlines and completed projects are
+    accepted.
+    """
+
+    def __init__(self, project_repository: ProjectRepository) -> None:
+        self._project_repository = project_repository
+
+    def execute(self, rows: list[ImportProjectRowDTO]) -> ImportChunkResultDTO:
+        now = datetime.now(timezone.utc)
+        existing = {
+            p.id
+            for p in self._project_repository.get_many(
+                [row.id for row in rows if row.id]
+            ).projects
+        }
+        projects: dict = {}
+        errors = []
+        for row in rows:
+            project_id = row.id or uuid4()
+            if project_id in existing or project_id in projects:
+                errors.append(ImportRowErrorDTO(row.line, "Project already exists"))
+                continue
+            projects[project_id] = Project(
+                id=project_id,
+                title=row.title,
+                deadline=row.deadline,
+                is_completed=row.is_completed,
+                created_at=now,
+                updated_at=now,
+            )
+        self._project_repository.save_many(list(projects.values()))
+        return ImportChunkResultDTO(imported=len(projects), errors=errors)
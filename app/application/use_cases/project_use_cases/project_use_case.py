@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 
-from app.application.dto.project_dto import ProjectDTO
+from app.application.dto.project_dto import ProjectDTO, ProjectStatsDTO
 from app.domain.entities.project import Project
+from app.domain.repositories.project_repository import ProjectStats
 
 
 @dataclass
@@ -16,3 +17,14 @@ class ProjectUseCase:
             created_at=project.created_at,
             updated_at=project.updated_at,
         )
+
+    @staticmethod
+    def _to_stats_dto(stats: ProjectStats) -> ProjectStatsDTO:
+        return ProjectStatsDTO(
+            project_id=stats.project_id,
+            total_tasks=stats.total_tasks,
+            completed_tasks=stats.completed_tasks,
+            open_tasks=stats.open_tasks,
+            overdue_tasks=stats.overdue_tasks,
+            next_deadline=stats.next_deadline,
+        )
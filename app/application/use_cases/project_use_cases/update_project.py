@@ -3,7 +3,7 @@ from uuid import UUID
 
 from app.application.dto.project_dto import UpdateProjectDTO, ProjectDTO
 from app.application.use_cases.project_use_cases.project_use_case import ProjectUseCase
-from app.domain.event_handlers import ProjectDeadlineChangedHandler
+from app.domain.event_bus import EventBus
 from app.domain.exceptions import NotFoundError, ValidationError
 from app.domain.repositories.project_repository import ProjectRepository
 
@@ -12,12 +12,10 @@ class UpdateProjectUseCase(ProjectUseCase):
     def __init__(
         self,
         project_repository: ProjectRepository,
-        deadline_handler: ProjectDeadlineChangedHandler,
-        auto_adjust_task_deadlines: bool = True,
+        event_bus: EventBus,
     ) -> None:
         self._project_repository = project_repository
-        self._deadline_handler = deadline_handler
-        self._auto_adjust = auto_adjust_task_deadlines
+        self._event_bus = event_bus
 
     def execute(self, dto: UpdateProjectDTO, project_id: UUID) -> ProjectDTO:
         project = self._project_repository.get_by_id(project_id)
@@ -27,9 +25,8 @@ class UpdateProjectUseCase(ProjectUseCase):
             if dto.deadline < datetime.now(timezone.utc):
                 raise ValidationError("Project deadline has passed")
             project.update_deadline(dto.deadline)
-            events = project.collect_domain_events()
-            for event in events:
-                self._deadline_handler.handle(event, auto_adjust=self._auto_adjust)
+            self._event_bus.collect(project)
         [setattr(project, k, v) for k, v in dto.__dict__.items() if v is not None]
+        self._event_bus.flush()
         self._project_repository.update(project)
         return self._to_dto(project)
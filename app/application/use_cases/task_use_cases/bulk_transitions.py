@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from app.application.dto.task_dto import TaskBatchResultDTO
+from app.application.use_cases.task_use_cases.task_use_case import TaskUseCase
+from app.domain.entities.project import Project
+from app.domain.entities.task import Task
+from app.domain.exceptions import ConflictError, DomainError, NotFoundError
+from app.domain.repositories.project_repository import ProjectRepository
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.services.project_completion_service import ProjectCompletionService
+
+C = TypeVar("C")
+
+
+class BulkTaskUseCase(TaskUseCase, ABC, Generic[C]):
+    """Applies one state transition to many tasks.
+
+    Tasks and their projects are loaded once, the domain rules run in
+    memory and the changes to both tables are written back in a single
+    commit. A task that fails its transition is reported and left
+    unchanged.
+    Whatever else a transition needs is loaded by ``_prepare`` and passed
+    to the hooks as ``context``, so instances keep no per-call state.
+    """
+
+    def __init__(
+        self, task_repository: TaskRepository, project_repository: ProjectRepository
+    ) -> None:
+        self._task_repository = task_repository
+        self._project_repository = project_repository
+
+    def execute(self, task_ids: list[UUID]) -> list[TaskBatchResultDTO]:
+        found = self._load(task_ids)
+        return self._transition(task_ids, found, self._prepare(list(found.values())))
+
+    def _load(self, task_ids: list[UUID]) -> dict[UUID, Task]:
+        return {
+            task.id: task for task in self._task_repository.get_many(task_ids).tasks
+        }
+
+    def _transition(
+        self, task_ids: list[UUID], found: dict[UUID, Task], context: C
+    ) -> list[TaskBatchResultDTO]:
+        results = []
+        changed: dict[UUID, Task] = {}
+        for task_id in task_ids:
+            task = found.get(task_id)
+            try:
+                if task is None:
+                    raise NotFoundError("Task not found")
+                if task_id not in changed and self._apply(task, context):
+                    changed[task_id] = task
+                results.append(TaskBatchResultDTO(task=self._to_dto(task)))
+            except DomainError as e:
+                results.append(TaskBatchResultDTO(error=e))
+        tasks = list(changed.values())
+        # Projects only change along with their tasks, so committing the
+        # task update also commits the projects written just before it.
+        self._project_repository.update_many(self._finish(tasks, context), commit=False)
+        self._task_repository.update_many(tasks)
+        return results
+
+    def _prepare(self, tasks: list[Task]) -> C:
+        """Load whatever the transition needs for ``tasks`` in bulk."""
+        return None
+
+    @abstractmethod
+    def _apply(self, task: Task, context: C) -> bool:
+        """Apply the transition to ``task``; return whether it changed."""
+
+    def _finish(self, changed: list[Task], context: C) -> list[Project]:
+        """Return the projects that changed as a consequence."""
+        return []
+
+
+class BulkCompleteTasksUseCase(BulkTaskUseCase[None]):
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        project_repository: ProjectRepository,
+        completion_service: ProjectCompletionService,
+    ) -> None:
+        super().__init__(task_repository, project_repository)
+        self._completion_service = completion_service
+
+    def _apply(self, task: Task, context: None) -> bool:
+        task.mark_as_completed()
+        return True
+
+    def _finish(self, changed: list[Task], context: None) -> list[Project]:
+        project_ids = list({t.project_id for t in changed if t.project_id})
+        if not project_ids:
+            return []
+        updated = {task.id: task for task in changed}
+        completed = []
+        for found in self._project_repository.get_all_with_tasks(project_ids):
+            tasks = [updated.get(task.id, task) for task in found.tasks]
+            was_completed = found.project.is_completed
+            self._completion_service.handle_task_completed(found.project, tasks)
+            if found.project.is_completed != was_completed:
+                completed.append(found.project)
+        return completed
+
+
+class BulkReopenTasksUseCase(BulkTaskUseCase[dict[UUID, Project]]):
+    def _prepare(self, tasks: list[Task]) -> dict[UUID, Project]:
+        project_ids = list({t.project_id for t in tasks if t.project_id})
+        lookup = self._project_repository.get_many(project_ids)
+        return {project.id: project for project in lookup.projects}
+
+    def _apply(self, task: Task, context: dict[UUID, Project]) -> bool:
+        if task.project_id and task.project_id not in context:
+            raise NotFoundError("The project associated with task not found")
+        task.reopen()
+        return True
+
+    def _finish(
+        self, changed: list[Task], context: dict[UUID, Project]
+    ) -> list[Project]:
+        reopened = []
+        for project_id in dict.fromkeys(t.project_id for t in changed if t.project_id):
+            project = context[project_id]
+            if project.is_completed:
+                project.reopen()
+                reopened.append(project)
+        return reopened
+
+
+class BulkProjectTaskUseCase(BulkTaskUseCase[Project], ABC):
+    def execute(
+        self, project_id: UUID, task_ids: list[UUID]
+    ) -> list[TaskBatchResultDTO]:
+        project = self._project_repository.get_by_id(project_id)
+        if not project:
+            raise NotFoundError("Project not found")
+        return self._transition(task_ids, self._load(task_ids), project)
+
+
+class BulkLinkTasksUseCase(BulkProjectTaskUseCase):
+    def _apply(self, task: Task, context: Project) -> bool:
+        task.assign_to_project(context.id, context.deadline)
+        return True
+
+
+class BulkUnlinkTasksUseCase(BulkProjectTaskUseCase):
+    def _apply(self, task: Task, context: Project) -> bool:
+        if task.project_id is None:
+            return False
+        if task.project_id != context.id:
+            raise ConflictError("Task is assigned to another project")
+        task.unassign_from_project()
+        return True
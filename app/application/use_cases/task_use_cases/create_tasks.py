@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from app.application.dto.task_dto import CreateTaskBatchItemDTO, TaskBatchResultDTO
+from app.application.use_cases.task_use_cases.task_use_case import TaskUseCase
+from app.domain.entities.project import Project
+from app.domain.entities.task import Task
+from app.domain.exceptions import DomainError, NotFoundError, ValidationError
+from app.domain.repositories.project_repository import ProjectRepository
+from app.domain.repositories.task_repository import TaskRepository
+
+
+class CreateTasksUseCase(TaskUseCase):
+    """Creates a batch of tasks in one transaction.
+
+    Every item is validated before anything is written; items that fail
+    are reported individually and the rest are inserted together.
+    """
+
+    def __init__(
+        self, task_repository: TaskRepository, project_repository: ProjectRepository
+    ) -> None:
+        self._task_repository = task_repository
+        self._project_repository = project_repository
+
+    def execute(self, dtos: list[CreateTaskBatchItemDTO]) -> list[TaskBatchResultDTO]:
+        now = datetime.now(timezone.utc)
+        project_ids = list({dto.project_id for dto in dtos if dto.project_id})
+        projects = {
+            p.id: p for p in self._project_repository.get_many(project_ids).projects
+        }
+
+        results = [TaskBatchResultDTO() for _ in dtos]
+        valid: list[tuple[TaskBatchResultDTO, Task]] = []
+        for result, dto in zip(results, dtos):
+            try:
+                valid.append((result, self._build_task(dto, projects, now)))
+            except DomainError as e:
+                result.error = e
+
+        saved = self._task_repository.save_many([task for _, task in valid])
+        for (result, _), task in zip(valid, saved):
+            result.task = self._to_dto(task)
+        return results
+
+    @staticmethod
+    def _build_task(
+        dto: CreateTaskBatchItemDTO, projects: dict[UUID, Project], now: datetime
+    ) -> Task:
+        if dto.deadline < now:
+            raise ValidationError("The task deadline has passed")
+        task = Task(
+            id=uuid4(),
+            title=dto.title,
+            description=dto.description,
+            deadline=dto.deadline,
+            is_completed=False,
+            project_id=None,
+            created_at=now,
+            updated_at=now,
+        )
+        if dto.project_id is not None:
+            project = projects.get(dto.project_id)
+            if project is None:
+                raise NotFoundError("Project not found")
+            task.assign_to_project(project.id, project.deadline)
+        return task
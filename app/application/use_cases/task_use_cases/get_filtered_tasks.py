@@ -1,18 +1,21 @@
-from copy import deepcopy
-
 from app.application.use_cases.task_use_cases.task_use_case import TaskUseCase
+from app.domain.clock import Clock, SystemClock
 from app.domain.repositories.task_repository import TaskRepository
+from app.domain.services.overdue_service import OverdueService
 from app.application.dto.task_dto import TaskDTO, TaskFilterDTO
 
 
 class GetFilteredTasksUseCase(TaskUseCase):
 
-    def __init__(self, task_repository: TaskRepository) -> None:
+    def __init__(
+        self, task_repository: TaskRepository, clock: Clock | None = None
+    ) -> None:
         self._task_repository = task_repository
+        self._clock = clock or SystemClock()
 
     def execute(self, filters: TaskFilterDTO) -> list[TaskDTO]:
-        tasks = self._task_repository.get_all()
-        filtered_tasks = deepcopy(tasks)
+        now = self._clock.now()
+        filtered_tasks = self._task_repository.get_all()
         if filters.project_id is not None:
             filtered_tasks = [
                 t for t in filtered_tasks if t.project_id == filters.project_id
@@ -21,9 +24,11 @@ class GetFilteredTasksUseCase(TaskUseCase):
             filtered_tasks = [
                 t for t in filtered_tasks if t.is_completed == filters.is_completed
             ]
-        if filters.is_overdue is not None:
-            if filters.is_overdue:
-                filtered_tasks = [t for t in filtered_tasks if t.is_overdue()]
-            else:
-                filtered_tasks = [t for t in filtered_tasks if not t.is_overdue()]
-        return [self._to_dto(task) for task in filtered_tasks]
+        if filters.is_overdue is None:
+            return self._to_dtos(filtered_tasks, now)
+        flags = OverdueService.evaluate(filtered_tasks, now)
+        return [
+            self._to_dto(t, f)
+            for t, f in zip(filtered_tasks, flags)
+            if f == filters.is_overdue
+        ]
@@ -0,0 +1,22 @@
+from app.application.dto.task_dto import TaskChangesDTO
+from app.application.use_cases.task_use_cases.task_use_case import TaskUseCase
+from app.domain.clock import Clock, SystemClock
+from app.domain.repositories.task_repository import TaskRepository
+
+
+class GetTaskChangesUseCase(TaskUseCase):
+
+    def __init__(
+        self, task_repository: TaskRepository, clock: Clock | None = None
+    ) -> None:
+        self._task_repository = task_repository
+        self._clock = clock or SystemClock()
+
+    def execute(self, since: int, limit: int) -> TaskChangesDTO:
+        change_set = self._task_repository.get_changes_since(since, limit)
+        return TaskChangesDTO(
+            tasks=self._to_dtos(change_set.tasks, self._clock.now()),
+            deleted_ids=change_set.deleted_ids,
+            next_since=change_set.last_seq,
+            has_more=change_set.has_more,
+        )
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from app.application.dto.task_dto import TaskLookupDTO
+from app.application.use_cases.task_use_cases.task_use_case import TaskUseCase
+from app.domain.clock import Clock, SystemClock
+from app.domain.repositories.task_repository import TaskRepository
+
+
+class GetTasksByIdsUseCase(TaskUseCase):
+
+    def __init__(
+        self, task_repository: TaskRepository, clock: Clock | None = None
+    ) -> None:
+        self._task_repository = task_repository
+        self._clock = clock or SystemClock()
+
+    def execute(self, task_ids: list[UUID]) -> TaskLookupDTO:
+        lookup = self._task_repository.get_many(task_ids)
+        return TaskLookupDTO(
+            tasks=self._to_dtos(lookup.tasks, self._clock.now()),
+            missing_ids=lookup.missing_ids,
+        )
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from app.application.dto.import_dto import (
+    ImportChunkResultDTO,
+    ImportRowErrorDTO,
+    ImportTaskRowDTO,
+)
+from app.application.use_cases.task_use_cases.task_use_case import TaskUseCase
+from app.domain.entities.task import Task
+from app.domain.exceptions import ConflictError, DomainError, NotFoundError
+from app.domain.repositories.project_repository import ProjectRepository
+from app.domain.repositories.task_repository import TaskRepository
+
+
+class ImportTasksUseCase(TaskUseCase):
+    """Imports one chunk of tasks with a single bulk insert.
+
+    Every row goes through the same ``Task`` rules as a regular create;
+    rows that break one are reported by line and skipped. Imported data
+    is historical, so past deadlines are accepted.
+    """
+
+    def __init__(
+        self, task_repository: TaskRepository, project_repository: ProjectRepository
+    ) -> None:
+        self._task_repository = task_repository
+        self._project_repository = project_repository
+
+    def execute(self, rows: list[ImportTaskRowDTO]) -> ImportChunkResultDTO:
+        now = datetime.now(timezone.utc)
+        existing = {
+            task.id
+            for task in self._task_repository.get_many(
+                [row.id for row in rows if row.id]
+            ).tasks
+        }
+        lookup = self._project_repository.get_many(
+            list({row.project_id for row in rows if row.project_id})
+        )
+        projects = {project.id: project for project in lookup.projects}
+        tasks: dict[UUID, Task] = {}
+        errors = []
+        for row in rows:
+            try:
+                task_id = row.id or uuid4()
+                if task_id in existing or task_id in tasks:
+                    raise ConflictError("Task already exists")
+                task = Task(
+                    id=task_id,
+                    title=row.title,
+                    description=row.description,
+                    deadline=row.deadline,
+                    is_completed=row.is_completed,
+                    project_id=None,
+                    created_at=now,
+                    updated_at=now,
+                )
+                if row.project_id:
+                    project = projects.get(row.project_id)
+                    if not project:
+                        raise NotFoundError("Project not found")
+                    task.assign_to_project(project.id, project.deadline)
+                tasks[task_id] = task
+            except DomainError as e:
+                errors.append(ImportRowErrorDTO(row.line, e.message))
+        self._task_repository.save_many(list(tasks.values()))
+        return ImportChunkResultDTO(imported=len(tasks), errors=errors)
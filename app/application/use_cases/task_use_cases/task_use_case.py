@@ -1,22 +1,37 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from app.application.dto.task_dto import TaskDTO
 from app.domain.entities.task import Task
+from app.domain.services.overdue_service import OverdueService
+
+
+def to_task_dto(task: Task, is_overdue: bool | None = None) -> TaskDTO:
+    return TaskDTO(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        deadline=task.deadline,
+        is_completed=task.is_completed,
+        project_id=task.project_id,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        is_overdue=task.is_overdue() if is_overdue is None else is_overdue,
+    )
+
+
+def to_task_dtos(tasks: list[Task], now: datetime) -> list[TaskDTO]:
+    flags = OverdueService.evaluate(tasks, now)
+    return [to_task_dto(task, flag) for task, flag in zip(tasks, flags)]
 
 
 @dataclass
 class TaskUseCase:
 
     @staticmethod
-    def _to_dto(task: Task) -> TaskDTO:
-        return TaskDTO(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            deadline=task.deadline,
-            is_completed=task.is_completed,
-            project_id=task.project_id,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            is_overdue=task.is_overdue(),
-        )
+    def _to_dto(task: Task, is_overdue: bool | None = None) -> TaskDTO:
+        return to_task_dto(task, is_overdue)
+
+    @staticmethod
+    def _to_dtos(tasks: list[Task], now: datetime) -> list[TaskDTO]:
+        return to_task_dtos(tasks, now)
@@ -0,0 +1,260 @@
+"""Command line tools for moving data in and out of the database.
+
+python -m app.cli import tasks tasks.ndjson
+python -m app.cli import projects projects.csv --chunk-size 5000
+python -m app.cli export dump/
+python -m app.cli export dump/ --format parquet --entities tasks
+python -m app.cli seed --tasks 1000000 --seed 42
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.domain.exceptions import DomainError
+from app.infrastructure.config import get_settings
+from app.infrastructure.persistence.engine import (
+    create_db_and_tables,
+    get_engine,
+    get_read_engine,
+)
+from app.infrastructure.persistence.repositories.exceptions import (
+    SQLAlchemyRepositoryError,
+)
+from app.infrastructure.persistence.seeding import SeedConfig, seed_database
+from app.infrastructure.persistence.snapshot import read_snapshot
+from app.infrastructure.transfer.exporter import (
+    COLUMNS,
+    ColumnarFormat,
+    create_record_encoder,
+    export_batches,
+    write_columnar,
+)
+from app.infrastructure.transfer.formats import TransferFormat
+from app.infrastructure.transfer.importer import (
+    ImportChunk,
+    StreamingImport,
+    TransferEntity,
+    import_chunk,
+)
+
+READ_SIZE = 64 * 1024
+
+SUFFIX_FORMATS = {
+    ".csv": TransferFormat.CSV,
+    ".ndjson": TransferFormat.NDJSON,
+    ".jsonl": TransferFormat.NDJSON,
+}
+
+
+def import_stream(
+    engine: Engine,
+    entity: TransferEntity,
+    source: BinaryIO,
+    transfer_format: TransferFormat,
+    chunk_size: int,
+    out: TextIO = sys.stdout,
+    err: TextIO = sys.stderr,
+) -> StreamingImport:
+    """Import rows from ``source``, one transaction per chunk.
+
+    Rejected rows are written to ``out`` as NDJSON error events; progress
+    and the summary go to ``err``.
+    """
+    upload = StreamingImport(entity, transfer_format, chunk_size)
+
+    def write(chunk: ImportChunk) -> None:
+        try:
+            with Session(engine) as session:
+                events = upload.record(chunk, import_chunk(entity, session, chunk))
+        except (DomainError, SQLAlchemyRepositoryError) as e:
+            events = upload.record_failure(chunk, str(e))
+        for event in events:
+            print(json.dumps(event), file=out if event["type"] == "error" else err)
+
+    while data := source.read(READ_SIZE):
+        for chunk in upload.feed(data):
+            write(chunk)
+    for chunk in upload.close():
+        write(chunk)
+    print(json.dumps(upload.summary()), file=err)
+    return upload
+
+
+def export_to_directory(
+    engine: Engine,
+    directory: Path,
+    export_format: TransferFormat | ColumnarFormat,
+    batch_size: int,
+    entities: list[TransferEntity],
+) -> dict[TransferEntity, int]:
+    """Write one file per entity, all read from the same snapshot. Returns
+    the number of rows written per entity."""
+    directory.mkdir(parents=True, exist_ok=True)
+    written = {}
+    with read_snapshot(engine) as session:
+        for entity in entities:
+            path = directory / f"{entity.value}.{export_format.value}"
+            batches = export_batches(entity, session, batch_size)
+            if isinstance(export_format, ColumnarFormat):
+                written[entity] = write_columnar(path, export_format, entity, batches)
+                continue
+            encoder = create_record_encoder(export_format, COLUMNS[entity])
+            written[entity] = 0
+            with open(path, "w", encoding="utf-8", newline="") as target:
+                target.write(encoder.start())
+                for records in batches:
+                    target.write(encoder.encode(records))
+                    written[entity] += len(records)
+    return written
+
+
+def _format_for(path: str, transfer_format: TransferFormat | None) -> TransferFormat:
+    if transfer_format is not None:
+        return transfer_format
+    try:
+        return SUFFIX_FORMATS[Path(path).suffix.lower()]
+    except KeyError:
+        raise SystemExit(f"Cannot tell the format of {path}; pass --format") from None
+
+
+def _run_import(args: argparse.Namespace) -> int:
+    create_db_and_tables()
+    transfer_format = _format_for(args.file, args.format)
+    if args.file == "-":
+        upload = import_stream(
+            get_engine(),
+            args.entity,
+            sys.stdin.buffer,
+            transfer_format,
+            args.chunk_size,
+        )
+    else:
+        with open(args.file, "rb") as source:
+            upload = import_stream(
+                get_engine(), args.entity, source, transfer_format, args.chunk_size
+            )
+    return 1 if upload.failed else 0
+
+
+def _export_format(value: str) -> TransferFormat | ColumnarFormat:
+    for format_type in (TransferFormat, ColumnarFormat):
+        try:
+            return format_type(value)
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"unknown export format: {value}")
+
+
+def _run_export(args: argparse.Namespace) -> int:
+    try:
+        written = export_to_directory(
+            get_read_engine(),
+            Path(args.directory),
+            args.format,
+            args.batch_size,
+            args.entities,
+        )
+    except RuntimeError as e:
+        raise SystemExit(str(e)) from None
+    for entity, rows in written.items():
+        print(json.dumps({"entity": entity.value, "rows": rows}), file=sys.stderr)
+    return 0
+
+
+def _run_seed(args: argparse.Namespace) -> int:
+    create_db_and_tables()
+    config = SeedConfig(
+        tasks=args.tasks,
+        projects=args.projects,
+        unassigned_ratio=args.unassigned_ratio,
+        completed_ratio=args.completed_ratio,
+        project_size_skew=args.skew,
+        batch_size=args.batch_size,
+        seed=args.seed,
+    )
+    summary = seed_database(
+        get_engine(),
+        config,
+        on_batch=lambda written: print(
+            json.dumps({"type": "progress", "tasks": written}), file=sys.stderr
+        ),
+    )
+    print(json.dumps({"type": "summary", **asdict(summary)}), file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser(
+        "import", help="import projects or tasks from NDJSON or CSV"
+    )
+    import_parser.add_argument("entity", type=TransferEntity)
+    import_parser.add_argument("file", help="path to the file, or - for stdin")
+    import_parser.add_argument("--format", type=TransferFormat, default=None)
+    import_parser.add_argument(
+        "--chunk-size", type=int, default=get_settings().IMPORT_CHUNK_SIZE
+    )
+    import_parser.set_defaults(handler=_run_import)
+
+    export_parser = commands.add_parser(
+        "export", help="export projects and tasks from one consistent snapshot"
+    )
+    export_parser.add_argument("directory")
+    export_parser.add_argument(
+        "--format",
+        type=_export_format,
+        default=TransferFormat.NDJSON,
+        help="ndjson, csv, parquet or arrow (the last two need pyarrow)",
+    )
+    export_parser.add_argument(
+        "--batch-size", type=int, default=get_settings().EXPORT_BATCH_SIZE
+    )
+    export_parser.add_argument(
+        "--entities",
+        type=TransferEntity,
+        nargs="+",
+        default=list(TransferEntity),
+    )
+    export_parser.set_defaults(handler=_run_export)
+
+    seed_parser = commands.add_parser(
+        "seed", help="bulk insert a synthetic dataset for scale testing"
+    )
+    seed_parser.add_argument("--tasks", type=int, default=SeedConfig.tasks)
+    seed_parser.add_argument(
+        "--projects", type=int, default=None, help="defaults to tasks / 20"
+    )
+    seed_parser.add_argument(
+        "--unassigned-ratio", type=float, default=SeedConfig.unassigned_ratio
+    )
+    seed_parser.add_argument(
+        "--completed-ratio", type=float, default=SeedConfig.completed_ratio
+    )
+    seed_parser.add_argument(
+        "--skew",
+        type=float,
+        default=SeedConfig.project_size_skew,
+        help="Zipf exponent of tasks per project; higher means bigger giants",
+    )
+    seed_parser.add_argument("--batch-size", type=int, default=SeedConfig.batch_size)
+    seed_parser.add_argument("--seed", type=int, default=None)
+    seed_parser.set_defaults(handler=_run_seed)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
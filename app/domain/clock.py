@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+
+
+class Clock(ABC):
+
+    @abstractmethod
+    def now(self) -> datetime:
+        pass
+
+
+class SystemClock(Clock):
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+
+class FixedClock(Clock):
+    def __init__(self, instant: datetime) -> None:
+        self._instant = instant
+
+    def now(self) -> datetime:
+        return self._instant
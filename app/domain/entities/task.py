@@ -54,10 +54,10 @@ class Task:
             self.deadline = project_deadline
             self.updated_at = datetime.now(timezone.utc)
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now: datetime | None = None) -> bool:
         if not self.deadline or self.is_completed:
             return False
-        return datetime.now(timezone.utc) > self.deadline
+        return (now or datetime.now(timezone.utc)) > self.deadline
 
     def _validate_deadline_against_project(
         self, project_deadline: datetime | None
@@ -0,0 +1,113 @@
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timedelta
+from functools import reduce
+from typing import Protocol
+
+from app.domain.events import DomainEvent
+
+EventSubscriber = Callable[[DomainEvent], None]
+ErrorCallback = Callable[[list[DomainEvent], Exception], None]
+GroupScope = Callable[[], AbstractContextManager]
+
+
+class EventSource(Protocol):
+    def collect_domain_events(self) -> list[DomainEvent]: ...
+
+
+class EventBus:
+    """Buffers published events and dispatches them to subscribers on flush.
+
+    Events sharing a coalesce key whose occurrences are no more than
+    ``coalesce_window`` apart are merged, so subscribers see one event
+    carrying the final state of the aggregate.
+    """
+
+    def __init__(self, coalesce_window: timedelta = timedelta(0)) -> None:
+        self._coalesce_window = coalesce_window
+        self._subscribers: dict[type[DomainEvent], list[EventSubscriber]] = defaultdict(
+            list
+        )
+        self._pending: list[list[DomainEvent]] = []
+        self._open_groups: dict[Hashable, list[DomainEvent]] = {}
+
+    def subscribe(
+        self, event_type: type[DomainEvent], subscriber: EventSubscriber
+    ) -> None:
+        self._subscribers[event_type].append(subscriber)
+
+    def publish(self, event: DomainEvent) -> None:
+        key = event.coalesce_key()
+        group = self._open_groups.get(key) if key is not None else None
+        if group and event.occurred_at - group[-1].occurred_at <= self._coalesce_window:
+            group.append(event)
+            return
+        group = [event]
+        self._pending.append(group)
+        if key is not None:
+            self._open_groups[key] = group
+
+    def collect(self, source: EventSource) -> None:
+        for event in source.collect_domain_events():
+            self.publish(event)
+
+    def pending_events(self) -> list[DomainEvent]:
+        return [event for group in self._pending for event in group]
+
+    def flush(
+        self,
+        on_error: ErrorCallback | None = None,
+        now: datetime | None = None,
+        scope: GroupScope = nullcontext,
+    ) -> None:
+        """Dispatch pending events.
+
+        When ``now`` is given, groups that may still receive events within
+        the coalesce window stay pending. When ``on_error`` is given, a
+        failing subscriber is reported with the source events of its group
+        and dispatch continues; otherwise the error propagates. The
+        subscribers of each group run inside ``scope()``, which sees their
+        error and can undo the group's work.
+        """
+        ready, self._pending = self._split_ready(now)
+        self._open_groups = {
+            group[0].coalesce_key(): group
+            for group in self._pending
+            if group[0].coalesce_key() is not None
+        }
+        for group in ready:
+            event = reduce(lambda earlier, later: earlier.merge(later), group)
+            try:
+                with scope():
+                    for subscriber in self._subscribers_for(event):
+                        subscriber(event)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(group, e)
+
+    def discard(self) -> None:
+        self._pending = []
+        self._open_groups = {}
+
+    def _split_ready(
+        self, now: datetime | None
+    ) -> tuple[list[list[DomainEvent]], list[list[DomainEvent]]]:
+        if now is None:
+            return self._pending, []
+        ready, waiting = [], []
+        for group in self._pending:
+            settled = (
+                group[0].coalesce_key() is None
+                or now - group[-1].occurred_at > self._coalesce_window
+            )
+            (ready if settled else waiting).append(group)
+        return ready, waiting
+
+    def _subscribers_for(self, event: DomainEvent) -> list[EventSubscriber]:
+        return [
+            subscriber
+            for event_type in type(event).__mro__
+            for subscriber in self._subscribers.get(event_type, ())
+        ]
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
+from collections.abc import Hashable
+from dataclasses import dataclass, replace
 from datetime import datetime
+from typing import Self
 from uuid import UUID
 
 
@@ -7,9 +9,28 @@ from uuid import UUID
 class DomainEvent:
     occurred_at: datetime
 
+    def coalesce_key(self) -> Hashable | None:
+        return None
+
+    def merge(self, later: Self) -> Self:
+        return later
+
 
 @dataclass
 class ProjectDeadlineChangedEvent(DomainEvent):
     project_id: UUID
     old_deadline: datetime | None
     new_deadline: datetime | None
+
+    def coalesce_key(self) -> Hashable | None:
+        return type(self), self.project_id
+
+    def merge(self, later: Self) -> Self:
+        return replace(later, old_deadline=self.old_deadline)
+
+
+@dataclass
+class TaskBecameOverdueEvent(DomainEvent):
+    task_id: UUID
+    project_id: UUID | None
+    deadline: datetime
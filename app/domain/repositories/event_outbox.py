@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from app.domain.events import DomainEvent
+
+
+class EventOutbox(ABC):
+
+    @abstractmethod
+    def add(self, events: list[DomainEvent]) -> None:
+        pass
@@ -1,6 +1,32 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 from app.domain.entities.project import Project
+from app.domain.entities.task import Task
+
+
+@dataclass
+class ProjectStats:
+    project_id: UUID
+    total_tasks: int
+    completed_tasks: int
+    open_tasks: int
+    overdue_tasks: int
+    next_deadline: datetime | None
+
+
+@dataclass
+class ProjectWithTasks:
+    project: Project
+    tasks: list[Task]
+
+
+@dataclass
+class ProjectLookup:
+    projects: list[Project]
+    missing_ids: list[UUID]
 
 
 class ProjectRepository(ABC):
@@ -13,14 +39,49 @@ class ProjectRepository(ABC):
     def get_all(self) -> list[Project]:
         pass
 
+    @abstractmethod
+    def iter_batches(self, batch_size: int) -> Iterator[list[Project]]:
+        pass
+
+    @abstractmethod
+    def get_by_id_with_tasks(self, project_id: UUID) -> ProjectWithTasks | None:
+        pass
+
+    @abstractmethod
+    def get_many(self, project_ids: list[UUID]) -> ProjectLookup:
+        pass
+
+    @abstractmethod
+    def get_all_with_tasks(
+        self, project_ids: list[UUID] | None = None
+    ) -> list[ProjectWithTasks]:
+        pass
+
+    @abstractmethod
+    def get_stats(
+        self, now: datetime, project_ids: list[UUID] | None = None
+    ) -> list[ProjectStats]:
+        pass
+
     @abstractmethod
     def save(self, project: Project) -> Project:
         pass
 
+    @abstractmethod
+    def save_many(self, projects: list[Project]) -> list[Project]:
+        pass
+
     @abstractmethod
     def update(self, project: Project) -> Project:
         pass
 
+    @abstractmethod
+    def update_many(
+        self, projects: list[Project], commit: bool = True
+    ) -> list[Project]:
+        """Write ``projects`` back; with ``commit=False`` the changes are
+        left for the next commit of the same unit of work."""
+
     @abstractmethod
     def delete(self, project_id: UUID) -> None:
         pass
@@ -1,30 +1,67 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
 from uuid import UUID
 from app.domain.entities.task import Task
 
 
+@dataclass
+class TaskChangeSet:
+    tasks: list[Task]
+    deleted_ids: list[UUID]
+    last_seq: int
+    has_more: bool
+
+
+@dataclass
+class TaskLookup:
+    tasks: list[Task]
+    missing_ids: list[UUID]
+
+
 class TaskRepository(ABC):
 
     @abstractmethod
     def get_by_id(self, task_id: UUID) -> Task | None:
         pass
 
+    @abstractmethod
+    def get_many(self, task_ids: list[UUID]) -> TaskLookup:
+        pass
+
     @abstractmethod
     def get_all(self) -> list[Task]:
         pass
 
+    @abstractmethod
+    def iter_batches(self, batch_size: int) -> Iterator[list[Task]]:
+        pass
+
     @abstractmethod
     def get_by_project_id(self, project_id: UUID) -> list[Task]:
         pass
 
+    @abstractmethod
+    def get_changes_since(self, since: int, limit: int) -> TaskChangeSet:
+        pass
+
     @abstractmethod
     def save(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    def save_many(self, tasks: list[Task]) -> list[Task]:
+        pass
+
     @abstractmethod
     def update(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    def update_many(self, tasks: list[Task], commit: bool = True) -> list[Task]:
+        """Write ``tasks`` back; with ``commit=False`` the changes are left
+        for the next commit of the same unit of work."""
+
     @abstractmethod
     def delete(self, task_id: UUID) -> None:
         pass
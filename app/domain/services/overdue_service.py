@@ -0,0 +1,10 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.domain.entities.task import Task
+
+
+class OverdueService:
+    @staticmethod
+    def evaluate(tasks: Sequence[Task], now: datetime) -> list[bool]:
+        return [task.is_overdue(now) for task in tasks]
@@ -0,0 +1,111 @@
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.executors import (
+    BoundedExecutor,
+    get_read_executor,
+    get_write_executor,
+)
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.persistence.write_coordinator import (
+    WriteCoordinator,
+    running_write_coordinator,
+)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    max_in_flight: int
+    max_queue_wait: float
+
+
+class AdmissionControlMiddleware:
+    """Sheds load with ``503 Service Unavailable`` before the database
+    saturates.
+
+    Reads and writes are admitted against separate limits: the number of
+    requests of that kind already in flight, and how long the oldest call
+    has been queued on the matching executor. While the write coordinator
+    is running, writes queue there instead, so its wait counts as well.
+    Rejection is cheap, so admitted requests keep a bounded latency instead
+    of queueing behind the writer until clients time out.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        read_limits: AdmissionLimits,
+        write_limits: AdmissionLimits,
+        retry_after: int = 1,
+        exempt_paths: tuple[str, ...] = (),
+        read_executor: Callable[[], BoundedExecutor] = get_read_executor,
+        write_executor: Callable[[], BoundedExecutor] = get_write_executor,
+        write_coordinator: Callable[
+            [], WriteCoordinator | None
+        ] = running_write_coordinator,
+    ) -> None:
+        self._app = app
+        self._limits = {"read": read_limits, "write": write_limits}
+        self._executors = {"read": read_executor, "write": write_executor}
+        self._write_coordinator = write_coordinator
+        self._retry_after = retry_after
+        self._exempt_paths = exempt_paths
+        self._in_flight = {"read": 0, "write": 0}
+        metrics = get_metrics_registry()
+        self._in_flight_gauges = {
+            kind: metrics.gauge(f"admission.{kind}.in_flight") for kind in self._limits
+        }
+        self._rejected = {
+            kind: metrics.counter(f"admission.{kind}.rejected") for kind in self._limits
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self._exempt_paths):
+            await self._app(scope, receive, send)
+            return
+        kind = "read" if scope["method"] in READ_METHODS else "write"
+        if not self._admit(kind):
+            self._rejected[kind].inc()
+            await self._reject(send)
+            return
+        self._in_flight[kind] += 1
+        self._in_flight_gauges[kind].set(self._in_flight[kind])
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            self._in_flight[kind] -= 1
+            self._in_flight_gauges[kind].set(self._in_flight[kind])
+
+    def _admit(self, kind: str) -> bool:
+        limits = self._limits[kind]
+        if self._in_flight[kind] >= limits.max_in_flight:
+            return False
+        return self._queue_wait(kind) <= limits.max_queue_wait
+
+    def _queue_wait(self, kind: str) -> float:
+        wait = self._executors[kind]().queue_wait
+        if kind == "write":
+            coordinator = self._write_coordinator()
+            if coordinator is not None:
+                wait = max(wait, coordinator.queue_wait)
+        return wait
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "Service is overloaded, retry later"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(self._retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.persistence.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+
+
+class RequestDeadlineMiddleware:
+    """Bounds each request by a deadline and cancels its work early.
+
+    Every request gets a ``CancellationToken`` in a context variable. The
+    token expires after the route's deadline (``route_timeouts`` is keyed
+    by ``"METHOD /route/template"``, falling back to ``default_timeout``)
+    and is cancelled as soon as the client disconnects. Running SQLite
+    statements poll the token and are interrupted; the handler itself is
+    cancelled too. A request that misses its deadline before responding
+    gets ``504 Gateway Timeout``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float | None,
+        route_timeouts: dict[str, float | None] | None = None,
+        exempt_paths: tuple[str, ...] = (),
+    ) -> None:
+        self._app = app
+        self._default_timeout = default_timeout
+        self._route_timeouts = route_timeouts or {}
+        self._exempt_paths = exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self._exempt_paths):
+            await self._app(scope, receive, send)
+            return
+        token = CancellationToken(self._timeout_for(scope))
+        reset = set_current_token(token)
+        response_started = False
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        disconnected = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def receive_wrapper() -> Message:
+            if disconnected and messages.empty():
+                return {"type": "http.disconnect"}
+            return await messages.get()
+
+        app_task = asyncio.ensure_future(
+            self._app(scope, receive_wrapper, send_wrapper)
+        )
+
+        async def watch_disconnect() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    disconnected = True
+                    token.cancel()
+                    app_task.cancel()
+                    return
+
+        watcher = asyncio.ensure_future(watch_disconnect())
+        try:
+            await asyncio.wait({app_task}, timeout=token.remaining())
+            if not app_task.done():
+                token.cancel()
+                app_task.cancel()
+                await asyncio.wait({app_task})
+                if not response_started:
+                    await self._timeout_response(send)
+                return
+            if app_task.cancelled() and token.cancelled:
+                return
+            app_task.result()
+        finally:
+            watcher.cancel()
+            reset_current_token(reset)
+
+    def _timeout_for(self, scope: Scope) -> float | None:
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                key = f"{scope['method']} {route.path}"
+                return self._route_timeouts.get(key, self._default_timeout)
+        return self._default_timeout
+
+    @staticmethod
+    async def _timeout_response(send: Send) -> None:
+        body = json.dumps({"detail": "Request deadline exceeded"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 504,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
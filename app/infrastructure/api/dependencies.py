@@ -1,5 +1,10 @@
-from typing import Annotated
-from fastapi import Depends
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import partial
+from typing import Annotated, TypeVar
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import Engine
 from sqlmodel import Session
 
 from app.application.use_cases.project_use_cases.update_project import (
@@ -13,8 +18,38 @@ from app.application.use_cases.task_use_cases.unlink_task_from_project import (
     UnlinkTaskToProjectUseCase,
 )
 from app.application.use_cases.task_use_cases.update_task import UpdateTaskUseCase
+from app.domain.clock import Clock, FixedClock
+from app.domain.event_bus import EventBus
 from app.domain.event_handlers import ProjectDeadlineChangedHandler
-from app.infrastructure.persistence.engine import get_session
+from app.domain.events import DomainEvent, ProjectDeadlineChangedEvent
+from app.domain.repositories.event_outbox import EventOutbox
+from app.domain.repositories.project_repository import ProjectRepository
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.executors import (
+    BoundedExecutor,
+    get_read_executor,
+    get_write_executor,
+)
+from app.infrastructure.persistence.engine import (
+    get_engine,
+    get_read_session,
+    get_session,
+)
+from app.infrastructure.single_flight import (
+    CoalescingReader,
+    SingleFlight,
+    get_single_flight,
+)
+from app.infrastructure.persistence.write_coordinator import (
+    InlineRunner,
+    UnitOfWorkRunner,
+    WriteCoordinator,
+    current_shared_transaction,
+    get_write_coordinator,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_event_outbox import (
+    SQLAlchemyEventOutbox,
+)
 from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
     SQLAlchemyProjectRepository,
 )
@@ -31,33 +66,155 @@ from app.application.use_cases.project_use_cases.create_project import (
 from app.application.use_cases.project_use_cases.complete_project import (
     CompleteProjectUseCase,
 )
+from app.application.use_cases.project_use_cases.get_project_stats import (
+    GetProjectStatsUseCase,
+)
+from app.application.use_cases.project_use_cases.get_projects import (
+    GetProjectsUseCase,
+)
+from app.application.use_cases.task_use_cases.bulk_transitions import (
+    BulkCompleteTasksUseCase,
+    BulkLinkTasksUseCase,
+    BulkReopenTasksUseCase,
+    BulkUnlinkTasksUseCase,
+)
 from app.application.use_cases.task_use_cases.create_task import CreateTaskUseCase
+from app.application.use_cases.task_use_cases.create_tasks import CreateTasksUseCase
 from app.application.use_cases.task_use_cases.complete_task import CompleteTaskUseCase
 from app.application.use_cases.task_use_cases.get_filtered_tasks import (
     GetFilteredTasksUseCase,
 )
+from app.application.use_cases.task_use_cases.get_task_changes import (
+    GetTaskChangesUseCase,
+)
+from app.application.use_cases.task_use_cases.get_tasks_by_ids import (
+    GetTasksByIdsUseCase,
+)
 
-SessionDep = Annotated[Session, Depends(get_session)]
 
+T = TypeVar("T")
 
-def get_project_repository(
-    session: SessionDep,
+
+def get_scoped_session(session: Annotated[Session, Depends(get_session)]) -> Session:
+    # Sub-requests of an atomic batch all work in the batch's transaction.
+    shared = current_shared_transaction()
+    return shared.session if shared else session
+
+
+def get_scoped_read_session(
+    session: Annotated[Session, Depends(get_read_session)],
+) -> Session:
+    shared = current_shared_transaction()
+    return shared.session if shared else session
+
+
+SessionDep = Annotated[Session, Depends(get_scoped_session)]
+ReadSessionDep = Annotated[Session, Depends(get_scoped_read_session)]
+EngineDep = Annotated[Engine, Depends(get_engine)]
+
+
+# Writes run on whichever session the unit-of-work runner hands them (the
+# request's own, the write coordinator's or a shared batch transaction), so
+# write-side dependencies are factories that build their object from it.
+SessionBound = Callable[[Session], T]
+
+
+def get_project_repository() -> SessionBound[ProjectRepository]:
+    return lambda session: SQLAlchemyProjectRepository(session=session)
+
+
+def get_task_repository() -> SessionBound[TaskRepository]:
+    return lambda session: SQLAlchemyTaskRepository(session=session)
+
+
+def get_project_read_repository(
+    session: ReadSessionDep,
 ) -> SQLAlchemyProjectRepository:
     return SQLAlchemyProjectRepository(session=session)
 
 
-def get_task_repository(
-    session: SessionDep,
+def get_task_read_repository(
+    session: ReadSessionDep,
 ) -> SQLAlchemyTaskRepository:
     return SQLAlchemyTaskRepository(session=session)
 
 
+def get_event_outbox() -> SessionBound[EventOutbox]:
+    return lambda session: SQLAlchemyEventOutbox(session=session)
+
+
+ProjectReadRepositoryDep = Annotated[
+    SQLAlchemyProjectRepository, Depends(get_project_read_repository)
+]
 ProjectRepositoryDep = Annotated[
-    SQLAlchemyProjectRepository, Depends(get_project_repository)
+    SessionBound[ProjectRepository], Depends(get_project_repository)
 ]
-TaskRepositoryDep = Annotated[SQLAlchemyTaskRepository, Depends(get_task_repository)]
+TaskRepositoryDep = Annotated[
+    SessionBound[TaskRepository], Depends(get_task_repository)
+]
+TaskReadRepositoryDep = Annotated[
+    SQLAlchemyTaskRepository, Depends(get_task_read_repository)
+]
+EventOutboxDep = Annotated[SessionBound[EventOutbox], Depends(get_event_outbox)]
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 
+
+def check_batch_size(size: int, settings: Settings) -> None:
+    if size > settings.TASK_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"A batch accepts at most {settings.TASK_BATCH_MAX_SIZE} tasks",
+        )
+
+
+def get_unit_of_work_runner(
+    session: SessionDep,
+    settings: SettingsDep,
+    write_coordinator: Annotated[WriteCoordinator, Depends(get_write_coordinator)],
+    write_executor: Annotated[BoundedExecutor, Depends(get_write_executor)],
+) -> UnitOfWorkRunner:
+    shared = current_shared_transaction()
+    if shared is not None:
+        return shared
+    if settings.WRITE_COORDINATOR_ENABLED:
+        return write_coordinator
+    return InlineRunner(session, write_executor)
+
+
+UnitOfWorkRunnerDep = Annotated[UnitOfWorkRunner, Depends(get_unit_of_work_runner)]
+ReadExecutorDep = Annotated[BoundedExecutor, Depends(get_read_executor)]
+
+
+def get_reader(
+    request: Request,
+    executor: ReadExecutorDep,
+    single_flight: Annotated[SingleFlight, Depends(get_single_flight)],
+    settings: SettingsDep,
+) -> CoalescingReader:
+    request_key = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+    )
+    # Reads inside a shared transaction may see its uncommitted writes, so
+    # they are never coalesced with other requests.
+    coalesce = settings.SINGLE_FLIGHT_ENABLED and current_shared_transaction() is None
+    return CoalescingReader(
+        executor,
+        single_flight if coalesce else None,
+        request_key,
+    )
+
+
+ReaderDep = Annotated[CoalescingReader, Depends(get_reader)]
+
+
+def get_clock() -> Clock:
+    return FixedClock(datetime.now(timezone.utc))
+
+
+ClockDep = Annotated[Clock, Depends(get_clock)]
+
+
 def get_completion_service(settings: SettingsDep) -> ProjectCompletionService:
     return ProjectCompletionService(
         auto_complete_enabled=settings.AUTO_COMPLETE_PROJECTS
@@ -70,16 +227,18 @@ def get_deadline_service() -> DeadlineEnforcementService:
 
 def get_create_project_use_case(
     project_repo: ProjectRepositoryDep,
-) -> CreateProjectUseCase:
-    return CreateProjectUseCase(project_repository=project_repo)
+) -> SessionBound[CreateProjectUseCase]:
+    return lambda session: CreateProjectUseCase(
+        project_repository=project_repo(session)
+    )
 
 
 def get_complete_project_use_case(
     project_repo: ProjectRepositoryDep,
     task_repo: TaskRepositoryDep,
-) -> CompleteProjectUseCase:
-    return CompleteProjectUseCase(
-        project_repository=project_repo, task_repository=task_repo
+) -> SessionBound[CompleteProjectUseCase]:
+    return lambda session: CompleteProjectUseCase(
+        project_repository=project_repo(session), task_repository=task_repo(session)
     )
 
 
@@ -88,31 +247,60 @@ def get_project_deadline_changed_handler(
     deadline_service: Annotated[
         DeadlineEnforcementService, Depends(get_deadline_service)
     ],
-) -> ProjectDeadlineChangedHandler:
-    return ProjectDeadlineChangedHandler(
-        task_repository=task_repo, deadline_service=deadline_service
+) -> SessionBound[ProjectDeadlineChangedHandler]:
+    return lambda session: ProjectDeadlineChangedHandler(
+        task_repository=task_repo(session), deadline_service=deadline_service
     )
 
 
-def get_update_project_use_case(
-    project_repo: ProjectRepositoryDep,
+def get_event_bus(
+    event_outbox: EventOutboxDep,
     deadline_handler: Annotated[
-        ProjectDeadlineChangedHandler, Depends(get_project_deadline_changed_handler)
+        SessionBound[ProjectDeadlineChangedHandler],
+        Depends(get_project_deadline_changed_handler),
     ],
     settings: SettingsDep,
-) -> UpdateProjectUseCase:
-    return UpdateProjectUseCase(
-        project_repository=project_repo,
-        deadline_handler=deadline_handler,
-        auto_adjust_task_deadlines=settings.AUTO_ADJUST_TASK_DEADLINES,
+) -> SessionBound[EventBus]:
+    def build(session: Session) -> EventBus:
+        event_bus = EventBus()
+        if settings.AUTO_ADJUST_TASK_DEADLINES:
+            outbox = event_outbox(session)
+            event_bus.subscribe(DomainEvent, lambda event: outbox.add([event]))
+        else:
+            event_bus.subscribe(
+                ProjectDeadlineChangedEvent,
+                partial(deadline_handler(session).handle, auto_adjust=False),
+            )
+        return event_bus
+
+    return build
+
+
+def get_update_project_use_case(
+    project_repo: ProjectRepositoryDep,
+    event_bus: Annotated[SessionBound[EventBus], Depends(get_event_bus)],
+) -> SessionBound[UpdateProjectUseCase]:
+    return lambda session: UpdateProjectUseCase(
+        project_repository=project_repo(session), event_bus=event_bus(session)
     )
 
 
 def get_create_task_use_case(
     task_repo: TaskRepositoryDep,
     project_repo: ProjectRepositoryDep,
-) -> CreateTaskUseCase:
-    return CreateTaskUseCase(task_repository=task_repo, project_repository=project_repo)
+) -> SessionBound[CreateTaskUseCase]:
+    return lambda session: CreateTaskUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
+
+
+def get_create_tasks_use_case(
+    task_repo: TaskRepositoryDep,
+    project_repo: ProjectRepositoryDep,
+) -> SessionBound[CreateTasksUseCase]:
+    return lambda session: CreateTasksUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
 
 
 def get_complete_task_use_case(
@@ -121,47 +309,121 @@ def get_complete_task_use_case(
     completion_service: Annotated[
         ProjectCompletionService, Depends(get_completion_service)
     ],
-) -> CompleteTaskUseCase:
-    return CompleteTaskUseCase(
-        task_repository=task_repo,
-        project_repository=project_repo,
+) -> SessionBound[CompleteTaskUseCase]:
+    return lambda session: CompleteTaskUseCase(
+        task_repository=task_repo(session),
+        project_repository=project_repo(session),
         completion_service=completion_service,
     )
 
 
+def get_projects_use_case(
+    project_repo: ProjectReadRepositoryDep,
+    clock: ClockDep,
+) -> GetProjectsUseCase:
+    return GetProjectsUseCase(project_repository=project_repo, clock=clock)
+
+
+def get_project_stats_use_case(
+    project_repo: ProjectReadRepositoryDep,
+    clock: ClockDep,
+) -> GetProjectStatsUseCase:
+    return GetProjectStatsUseCase(project_repository=project_repo, clock=clock)
+
+
 def get_filtered_tasks_use_case(
-    task_repo: TaskRepositoryDep,
+    task_repo: TaskReadRepositoryDep,
+    clock: ClockDep,
 ) -> GetFilteredTasksUseCase:
-    return GetFilteredTasksUseCase(task_repository=task_repo)
+    return GetFilteredTasksUseCase(task_repository=task_repo, clock=clock)
+
+
+def get_tasks_by_ids_use_case(
+    task_repo: TaskReadRepositoryDep,
+    clock: ClockDep,
+) -> GetTasksByIdsUseCase:
+    return GetTasksByIdsUseCase(task_repository=task_repo, clock=clock)
+
+
+def get_task_changes_use_case(
+    task_repo: TaskReadRepositoryDep,
+    clock: ClockDep,
+) -> GetTaskChangesUseCase:
+    return GetTaskChangesUseCase(task_repository=task_repo, clock=clock)
 
 
 def get_update_task_use_case(
     task_repo: TaskRepositoryDep,
     project_repo: ProjectRepositoryDep,
-) -> UpdateTaskUseCase:
-    return UpdateTaskUseCase(task_repository=task_repo, project_repository=project_repo)
+) -> SessionBound[UpdateTaskUseCase]:
+    return lambda session: UpdateTaskUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
 
 
 def get_link_task_to_project_use_case(
     task_repo: TaskRepositoryDep,
     project_repo: ProjectRepositoryDep,
-) -> LinkTaskToProjectUseCase:
-    return LinkTaskToProjectUseCase(
-        task_repository=task_repo, project_repository=project_repo
+) -> SessionBound[LinkTaskToProjectUseCase]:
+    return lambda session: LinkTaskToProjectUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
     )
 
 
 def get_unlink_task_from_project_use_case(
     task_repo: TaskRepositoryDep,
     project_repo: ProjectRepositoryDep,
-) -> UnlinkTaskToProjectUseCase:
-    return UnlinkTaskToProjectUseCase(
-        task_repository=task_repo, project_repository=project_repo
+) -> SessionBound[UnlinkTaskToProjectUseCase]:
+    return lambda session: UnlinkTaskToProjectUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
     )
 
 
 def get_reopen_task_use_case(
     task_repo: TaskRepositoryDep,
     project_repo: ProjectRepositoryDep,
-) -> ReopenTaskUseCase:
-    return ReopenTaskUseCase(task_repository=task_repo, project_repository=project_repo)
+) -> SessionBound[ReopenTaskUseCase]:
+    return lambda session: ReopenTaskUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
+
+
+def get_bulk_complete_tasks_use_case(
+    task_repo: TaskRepositoryDep,
+    project_repo: ProjectRepositoryDep,
+    completion_service: Annotated[
+        ProjectCompletionService, Depends(get_completion_service)
+    ],
+) -> SessionBound[BulkCompleteTasksUseCase]:
+    return lambda session: BulkCompleteTasksUseCase(
+        task_repository=task_repo(session),
+        project_repository=project_repo(session),
+        completion_service=completion_service,
+    )
+
+
+def get_bulk_reopen_tasks_use_case(
+    task_repo: TaskRepositoryDep,
+    project_repo: ProjectRepositoryDep,
+) -> SessionBound[BulkReopenTasksUseCase]:
+    return lambda session: BulkReopenTasksUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
+
+
+def get_bulk_link_tasks_use_case(
+    task_repo: TaskRepositoryDep,
+    project_repo: ProjectRepositoryDep,
+) -> SessionBound[BulkLinkTasksUseCase]:
+    return lambda session: BulkLinkTasksUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
+
+
+def get_bulk_unlink_tasks_use_case(
+    task_repo: TaskRepositoryDep,
+    project_repo: ProjectRepositoryDep,
+) -> SessionBound[BulkUnlinkTasksUseCase]:
+    return lambda session: BulkUnlinkTasksUseCase(
+        task_repository=task_repo(session), project_repository=project_repo(session)
+    )
@@ -2,6 +2,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from app.domain.exceptions import DomainError
+from app.infrastructure.persistence.cancellation import current_token
 from app.infrastructure.persistence.repositories.exceptions import (
     SQLAlchemyRepositoryError,
 )
@@ -17,6 +18,13 @@ async def domain_exception_handler(_request: Request, exc: DomainError) -> JSONR
 async def repository_exception_handler(
     _request: Request, exc: SQLAlchemyRepositoryError
 ) -> JSONResponse:
+    token = current_token()
+    if token is not None and token.should_abort():
+        # The statement was interrupted because the request ran out of time.
+        return JSONResponse(
+            status_code=504,
+            content={"detail": "Request deadline exceeded"},
+        )
     return JSONResponse(
         status_code=500,
         content={"detail": str(exc)},
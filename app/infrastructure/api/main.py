@@ -1,26 +1,144 @@
+import asyncio
+
 from fastapi import FastAPI
+from sqlmodel import Session
 
 from app.domain.exceptions import DomainError
+from app.infrastructure.api.admission import AdmissionControlMiddleware, AdmissionLimits
+from app.infrastructure.api.deadline import RequestDeadlineMiddleware
 from app.infrastructure.api.exception_handler import (
     domain_exception_handler,
     repository_exception_handler,
 )
-from app.infrastructure.api.routers import project_router, task_router
-from app.infrastructure.persistence.engine import create_db_and_tables
+from app.infrastructure.api.routers import (
+    batch_router,
+    event_router,
+    export_router,
+    import_router,
+    metrics_router,
+    project_router,
+    task_router,
+)
+from app.infrastructure.config import get_settings
+from app.infrastructure.events.change_feed import get_change_feed
+from app.infrastructure.events.handlers import (
+    create_outbox_dispatcher,
+    register_overdue_subscribers,
+)
+from app.infrastructure.events.overdue_engine import get_overdue_engine
+from app.infrastructure.executors import shutdown_executors
+from app.infrastructure.persistence.change_tracking import (
+    add_change_listener,
+    remove_change_listener,
+)
+from app.infrastructure.persistence.engine import create_db_and_tables, get_engine
 from app.infrastructure.persistence.repositories.exceptions import (
     SQLAlchemyRepositoryError,
 )
+from app.infrastructure.persistence.write_coordinator import get_write_coordinator
 
 app = FastAPI(title="Task Management API")
 
+outbox_dispatcher = create_outbox_dispatcher(get_engine(), get_settings())
+register_overdue_subscribers(get_overdue_engine().event_bus)
+
 
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
 
 
+@app.on_event("startup")
+def start_write_coordinator():
+    if get_settings().WRITE_COORDINATOR_ENABLED:
+        get_write_coordinator().start()
+
+
+@app.on_event("shutdown")
+def stop_write_coordinator():
+    if get_settings().WRITE_COORDINATOR_ENABLED:
+        get_write_coordinator().stop()
+
+
+@app.on_event("startup")
+async def start_outbox_dispatcher():
+    if get_settings().OUTBOX_DISPATCH_ENABLED:
+        outbox_dispatcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_outbox_dispatcher():
+    await outbox_dispatcher.stop()
+
+
+@app.on_event("startup")
+async def start_overdue_engine():
+    if not get_settings().OVERDUE_ENGINE_ENABLED:
+        return
+    overdue_engine = get_overdue_engine()
+    add_change_listener(overdue_engine.apply_changes)
+    with Session(get_engine()) as session:
+        overdue_engine.load(session)
+    overdue_engine.start()
+
+
+@app.on_event("shutdown")
+async def stop_overdue_engine():
+    overdue_engine = get_overdue_engine()
+    remove_change_listener(overdue_engine.apply_changes)
+    await overdue_engine.stop()
+
+
+@app.on_event("startup")
+async def start_change_feed():
+    change_feed = get_change_feed()
+    change_feed.bind(asyncio.get_running_loop())
+    add_change_listener(change_feed.apply_changes)
+
+
+@app.on_event("shutdown")
+async def stop_change_feed():
+    change_feed = get_change_feed()
+    remove_change_listener(change_feed.apply_changes)
+    change_feed.close()
+
+
+@app.on_event("shutdown")
+def stop_executors():
+    shutdown_executors()
+
+
 app.include_router(project_router.router)
 app.include_router(task_router.router)
+app.include_router(event_router.router)
+app.include_router(metrics_router.router)
+app.include_router(batch_router.router)
+app.include_router(import_router.router)
+app.include_router(export_router.router)
+
+settings = get_settings()
+app.add_middleware(
+    RequestDeadlineMiddleware,
+    default_timeout=settings.REQUEST_DEADLINE,
+    route_timeouts={
+        "POST /import/{entity}": settings.IMPORT_DEADLINE,
+        "GET /export/{entity}": settings.EXPORT_DEADLINE,
+        **settings.ROUTE_DEADLINES,
+    },
+    exempt_paths=("/events",),
+)
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        read_limits=AdmissionLimits(
+            settings.ADMISSION_MAX_READS, settings.ADMISSION_MAX_READ_QUEUE_WAIT
+        ),
+        write_limits=AdmissionLimits(
+            settings.ADMISSION_MAX_WRITES, settings.ADMISSION_MAX_WRITE_QUEUE_WAIT
+        ),
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+        exempt_paths=("/events", "/metrics", "/docs", "/openapi.json"),
+    )
 
 app.add_exception_handler(DomainError, domain_exception_handler)
 app.add_exception_handler(SQLAlchemyRepositoryError, repository_exception_handler)
@@ -0,0 +1,29 @@
+from dataclasses import asdict
+
+from app.application.dto.task_dto import TaskBatchResultDTO
+from app.infrastructure.api.schemas.task_schemas import TaskBatchItemRead, TaskRead
+
+
+def batch_items(
+    results: list[TaskBatchResultDTO], success_status: int
+) -> list[TaskBatchItemRead]:
+    return [
+        _batch_item(index, result, success_status)
+        for index, result in enumerate(results)
+    ]
+
+
+def _batch_item(
+    index: int, result: TaskBatchResultDTO, success_status: int
+) -> TaskBatchItemRead:
+    if result.error is not None:
+        return TaskBatchItemRead(
+            index=index,
+            status=result.error.http_status_code,
+            error=result.error.message,
+        )
+    return TaskBatchItemRead(
+        index=index,
+        status=success_status,
+        task=TaskRead.model_validate(asdict(result.task)),
+    )
@@ -0,0 +1,142 @@
+import asyncio
+import json
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request, status
+from starlette.types import Message, Scope
+
+from app.infrastructure.api.dependencies import EngineDep, SettingsDep
+from app.infrastructure.api.schemas.batch_schemas import (
+    BatchRequest,
+    BatchSubRequest,
+    BatchSubResponse,
+)
+from app.infrastructure.persistence.write_coordinator import (
+    SharedTransaction,
+    reset_shared_transaction,
+    set_shared_transaction,
+)
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+UNBATCHABLE_PATHS = ("/batch", "/events")
+
+
+@router.post("", response_model=list[BatchSubResponse])
+async def execute_batch(
+    batch: BatchRequest,
+    request: Request,
+    engine: EngineDep,
+    settings: SettingsDep,
+):
+    """Run sub-requests against the API in order, in one round trip.
+
+    With ``atomic`` set, all sub-requests share one transaction: the first
+    one failing rolls back everything done so far, and the remaining
+    sub-requests are not executed.
+    """
+    if len(batch.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"A batch accepts at most {settings.BATCH_MAX_REQUESTS} requests",
+        )
+    for sub_request in batch.requests:
+        if not sub_request.path.startswith("/") or sub_request.path.startswith(
+            UNBATCHABLE_PATHS
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"{sub_request.path} cannot be part of a batch",
+            )
+    if not batch.atomic or not batch.requests:
+        return [await _dispatch(request, sub) for sub in batch.requests]
+
+    transaction = SharedTransaction(engine)
+    await transaction.begin()
+    reset = set_shared_transaction(transaction)
+    responses: list[BatchSubResponse] = []
+    try:
+        for sub_request in batch.requests:
+            responses.append(await _dispatch(request, sub_request))
+            if responses[-1].status >= 400:
+                break
+    except BaseException:
+        await asyncio.shield(transaction.rollback())
+        raise
+    finally:
+        reset_shared_transaction(reset)
+    failed = len(responses) - 1
+    if responses[failed].status < 400:
+        await transaction.commit()
+        return responses
+    await transaction.rollback()
+    aborted = BatchSubResponse(
+        status=status.HTTP_424_FAILED_DEPENDENCY,
+        body={"detail": f"Rolled back: request {failed} of the atomic batch failed"},
+    )
+    return (
+        [aborted] * failed
+        + [responses[failed]]
+        + [aborted] * (len(batch.requests) - failed - 1)
+    )
+
+
+async def _dispatch(request: Request, sub_request: BatchSubRequest) -> BatchSubResponse:
+    """Run one sub-request through the full ASGI app, in process."""
+    path, _, query = sub_request.path.partition("?")
+    body = b"" if sub_request.body is None else json.dumps(sub_request.body).encode()
+    scope: Scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method,
+        "scheme": request.scope["scheme"],
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    body_sent = False
+    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # The sub-request's client never goes away on its own.
+        await asyncio.Event().wait()
+
+    async def send(message: Message) -> None:
+        nonlocal response_status
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The error response has been sent already; the exception is only
+        # re-raised for the server to log.
+        return BatchSubResponse(
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            body={"detail": "Internal Server Error"},
+        )
+    return BatchSubResponse(status=response_status, body=_decode(b"".join(chunks)))
+
+
+def _decode(content: bytes) -> Any:
+    if not content:
+        return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content.decode(errors="replace")
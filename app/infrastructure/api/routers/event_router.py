@@ -0,0 +1,47 @@
+import json
+from collections.abc import AsyncIterator
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from app.infrastructure.api.dependencies import SettingsDep
+from app.infrastructure.events.change_feed import (
+    ChangeFeed,
+    ChangeNotification,
+    get_change_feed,
+)
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream_events(
+    feed: Annotated[ChangeFeed, Depends(get_change_feed)],
+    settings: SettingsDep,
+    project_id: UUID | None = Query(None),
+    last_event_id: int | None = Header(None),
+):
+    notifications = feed.subscribe(
+        last_event_id=last_event_id,
+        project_id=project_id,
+        heartbeat=settings.CHANGE_FEED_HEARTBEAT,
+    )
+    return StreamingResponse(
+        _format_stream(notifications),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _format_stream(
+    notifications: AsyncIterator[ChangeNotification | None],
+) -> AsyncIterator[str]:
+    async for notification in notifications:
+        if notification is None:
+            yield ": keep-alive\n\n"
+            continue
+        data = json.dumps(jsonable_encoder(notification.data))
+        yield f"id: {notification.id}\nevent: {notification.type}\ndata: {data}\n\n"
@@ -0,0 +1,53 @@
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from app.infrastructure.api.dependencies import (
+    ReadExecutorDep,
+    ReadSessionDep,
+    SettingsDep,
+)
+from app.infrastructure.transfer.exporter import (
+    COLUMNS,
+    create_record_encoder,
+    export_batches,
+)
+from app.infrastructure.transfer.formats import MEDIA_TYPES, TransferFormat
+from app.infrastructure.transfer.importer import TransferEntity
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+@router.get("/{entity}")
+async def export_rows(
+    entity: TransferEntity,
+    session: ReadSessionDep,
+    executor: ReadExecutorDep,
+    settings: SettingsDep,
+    format: TransferFormat = Query(TransferFormat.NDJSON),
+):
+    """Stream every project or task as NDJSON or CSV.
+
+    Rows are read through one cursor, ``EXPORT_BATCH_SIZE`` at a time, so
+    the export is a consistent snapshot and memory does not grow with the
+    table.
+    """
+    batches = export_batches(entity, session, settings.EXPORT_BATCH_SIZE)
+    encoder = create_record_encoder(format, COLUMNS[entity])
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            yield encoder.start()
+            while (records := await executor.run(next, batches, None)) is not None:
+                yield encoder.encode(records)
+        finally:
+            batches.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "content-disposition": f'attachment; filename="{entity.value}.{format.value}"'
+        },
+    )
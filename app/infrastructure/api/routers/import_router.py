@@ -0,0 +1,94 @@
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from app.application.dto.import_dto import ImportChunkResultDTO
+from app.domain.exceptions import DomainError
+from app.infrastructure.api.dependencies import SettingsDep, UnitOfWorkRunnerDep
+from app.infrastructure.persistence.repositories.exceptions import (
+    SQLAlchemyRepositoryError,
+)
+from app.infrastructure.transfer.formats import (
+    MEDIA_TYPES,
+    TransferFormat,
+    format_for_media_type,
+)
+from app.infrastructure.transfer.importer import (
+    ImportChunk,
+    StreamingImport,
+    TransferEntity,
+    import_chunk,
+)
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+
+class UploadStreamingResponse(StreamingResponse):
+    """Streams the response while the request body is still being read.
+
+    The stock response watches for a disconnect by consuming ``receive``,
+    which would swallow the rest of the upload; here a disconnect surfaces
+    from ``request.stream()`` instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
+
+
+@router.post("/{entity}")
+async def import_rows(
+    entity: TransferEntity,
+    request: Request,
+    runner: UnitOfWorkRunnerDep,
+    settings: SettingsDep,
+    format: TransferFormat | None = Query(None),
+):
+    """Import projects or tasks from an NDJSON or CSV request body.
+
+    The body is parsed as it arrives and written in chunks of
+    ``IMPORT_CHUNK_SIZE`` rows, one transaction each. The response streams
+    NDJSON events: an ``error`` per rejected row, a ``progress`` event per
+    chunk and a final ``summary``. Rejected rows never abort the import.
+    """
+    transfer_format = format or format_for_media_type(
+        request.headers.get("content-type")
+    )
+    if transfer_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send the rows as " + " or ".join(MEDIA_TYPES.values()),
+        )
+    upload = StreamingImport(entity, transfer_format, settings.IMPORT_CHUNK_SIZE)
+
+    async def write(chunk: ImportChunk) -> list[dict]:
+        def work(session: Session) -> ImportChunkResultDTO:
+            return import_chunk(entity, session, chunk)
+
+        try:
+            return upload.record(chunk, await runner.run(work))
+        except (DomainError, SQLAlchemyRepositoryError) as e:
+            return upload.record_failure(chunk, str(e))
+
+    async def events() -> AsyncIterator[str]:
+        async for data in request.stream():
+            for chunk in upload.feed(data):
+                for event in await write(chunk):
+                    yield json.dumps(event) + "\n"
+        for chunk in upload.close():
+            for event in await write(chunk):
+                yield json.dumps(event) + "\n"
+        yield json.dumps(upload.summary()) + "\n"
+
+    return UploadStreamingResponse(
+        events(), media_type=MEDIA_TYPES[TransferFormat.NDJSON]
+    )
@@ -0,0 +1,14 @@
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends
+
+from app.infrastructure.metrics import MetricsRegistry, get_metrics_registry
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", response_model=dict[str, Any])
+def get_metrics(
+    registry: Annotated[MetricsRegistry, Depends(get_metrics_registry)],
+):
+    return registry.snapshot()
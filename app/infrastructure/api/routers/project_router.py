@@ -1,130 +1,284 @@
+from dataclasses import asdict
 from typing import Annotated
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlmodel import Session
 
-from app.application.use_cases.project_use_cases.update_project import (
-    UpdateProjectUseCase,
-)
-from app.application.use_cases.task_use_cases.link_task_to_project import (
-    LinkTaskToProjectUseCase,
-)
-from app.application.use_cases.task_use_cases.unlink_task_from_project import (
-    UnlinkTaskToProjectUseCase,
-)
-from app.domain.repositories.project_repository import ProjectRepository
 from app.domain.repositories.task_repository import TaskRepository
 from app.infrastructure.api.schemas.project_schemas import (
     ProjectCreate,
+    ProjectExpandedRead,
+    ProjectInclude,
+    ProjectStatsRead,
     ProjectUpdate,
     ProjectRead,
 )
 from app.infrastructure.api.dependencies import (
+    ProjectRepositoryDep,
+    ReaderDep,
+    SessionBound,
+    SettingsDep,
+    UnitOfWorkRunnerDep,
+    check_batch_size,
+    get_bulk_link_tasks_use_case,
+    get_bulk_unlink_tasks_use_case,
     get_create_project_use_case,
-    get_project_repository,
+    get_project_stats_use_case,
+    get_projects_use_case,
     get_update_project_use_case,
-    get_task_repository,
+    get_task_read_repository,
     get_link_task_to_project_use_case,
     get_unlink_task_from_project_use_case,
 )
+from app.application.dto.project_dto import (
+    CreateProjectDTO,
+    ProjectDTO,
+    UpdateProjectDTO,
+)
+from app.application.dto.task_dto import TaskBatchResultDTO, TaskDTO
 from app.application.use_cases.project_use_cases.create_project import (
     CreateProjectUseCase,
 )
-from app.application.dto.project_dto import CreateProjectDTO, UpdateProjectDTO
-from app.infrastructure.api.schemas.task_schemas import TaskRead
+from app.application.use_cases.project_use_cases.get_project_stats import (
+    GetProjectStatsUseCase,
+)
+from app.application.use_cases.project_use_cases.get_projects import (
+    GetProjectsUseCase,
+)
+from app.application.use_cases.project_use_cases.update_project import (
+    UpdateProjectUseCase,
+)
+from app.application.use_cases.task_use_cases.bulk_transitions import (
+    BulkLinkTasksUseCase,
+    BulkUnlinkTasksUseCase,
+)
+from app.application.use_cases.task_use_cases.link_task_to_project import (
+    LinkTaskToProjectUseCase,
+)
+from app.application.use_cases.task_use_cases.unlink_task_from_project import (
+    UnlinkTaskToProjectUseCase,
+)
+from app.infrastructure.api.routers._batch import batch_items
+from app.infrastructure.api.schemas.task_schemas import (
+    TaskBatchItemRead,
+    TaskIdsRequest,
+    TaskRead,
+)
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("/", response_model=list[ProjectRead])
-def get_all_projects(
-    repo: Annotated[ProjectRepository, Depends(get_project_repository)],
-):
-    return repo.get_all()
+def _expanded(project: ProjectDTO) -> dict:
+    # Only requested expansions are set, so the response is serialized with
+    # ``response_model_exclude_unset`` and plain reads keep their shape.
+    data = asdict(project)
+    for expansion in ("stats", "tasks"):
+        if data[expansion] is None:
+            del data[expansion]
+    return data
 
 
-@router.get("/{project_id}", response_model=ProjectRead)
-def get_project(
-    project_id: UUID,
-    repo: Annotated[ProjectRepository, Depends(get_project_repository)],
+@router.get(
+    "/",
+    response_model=list[ProjectExpandedRead],
+    response_model_exclude_unset=True,
+)
+async def get_all_projects(
+    use_case: Annotated[GetProjectsUseCase, Depends(get_projects_use_case)],
+    reader: ReaderDep,
+    response: Response,
+    include: list[ProjectInclude] = Query([]),
+    ids: list[UUID] | None = Query(None),
 ):
-    project = repo.get_by_id(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+    include_stats = ProjectInclude.STATS in include
+    include_tasks = ProjectInclude.TASKS in include
+    if ids is not None:
+        lookup = await reader.run(
+            use_case.execute_many,
+            ids,
+            include_stats=include_stats,
+            include_tasks=include_tasks,
         )
+        if lookup.missing_ids:
+            response.headers["X-Missing-Ids"] = ",".join(map(str, lookup.missing_ids))
+        return [_expanded(p) for p in lookup.projects]
+    projects = await reader.run(
+        use_case.execute, include_stats=include_stats, include_tasks=include_tasks
+    )
+    return [_expanded(p) for p in projects]
+
+
+@router.get("/stats", response_model=list[ProjectStatsRead])
+async def get_project_stats(
+    use_case: Annotated[GetProjectStatsUseCase, Depends(get_project_stats_use_case)],
+    reader: ReaderDep,
+):
+    return await reader.run(use_case.execute)
+
 
-    return project
+@router.get(
+    "/{project_id}",
+    response_model=ProjectExpandedRead,
+    response_model_exclude_unset=True,
+)
+async def get_project(
+    project_id: UUID,
+    use_case: Annotated[GetProjectsUseCase, Depends(get_projects_use_case)],
+    reader: ReaderDep,
+    include: list[ProjectInclude] = Query([]),
+):
+    project = await reader.run(
+        use_case.execute_one,
+        project_id,
+        include_stats=ProjectInclude.STATS in include,
+        include_tasks=ProjectInclude.TASKS in include,
+    )
+    return _expanded(project)
 
 
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
-def create_project(
+async def create_project(
     project_data: ProjectCreate,
-    use_case: Annotated[CreateProjectUseCase, Depends(get_create_project_use_case)],
+    use_case: Annotated[
+        SessionBound[CreateProjectUseCase], Depends(get_create_project_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
 ):
     dto = CreateProjectDTO(
         title=project_data.title,
         deadline=project_data.deadline,
     )
-    return use_case.execute(dto)
+
+    def work(session: Session) -> ProjectDTO:
+        return use_case(session).execute(dto)
+
+    return await runner.run(work)
 
 
 @router.put("/{project_id}", response_model=ProjectRead)
-def update_project(
+async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    use_case: Annotated[UpdateProjectUseCase, Depends(get_update_project_use_case)],
+    use_case: Annotated[
+        SessionBound[UpdateProjectUseCase], Depends(get_update_project_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
 ):
     dto = UpdateProjectDTO(
         title=project_data.title,
         deadline=project_data.deadline,
     )
-    return use_case.execute(dto, project_id)
+
+    def work(session: Session) -> ProjectDTO:
+        return use_case(session).execute(dto, project_id)
+
+    return await runner.run(work)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(
+async def delete_project(
+    project_id: UUID, project_repo: ProjectRepositoryDep, runner: UnitOfWorkRunnerDep
+):
+    def work(session: Session) -> None:
+        repo = project_repo(session)
+        project = repo.get_by_id(project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+        repo.delete(project_id)
+
+    await runner.run(work)
+
+
+@router.post(
+    "/{project_id}/tasks/bulk/link",
+    response_model=list[TaskBatchItemRead],
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def link_tasks(
     project_id: UUID,
-    repo: Annotated[ProjectRepository, Depends(get_project_repository)],
+    request: TaskIdsRequest,
+    use_case: Annotated[
+        SessionBound[BulkLinkTasksUseCase], Depends(get_bulk_link_tasks_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
+    settings: SettingsDep,
 ):
-    project = repo.get_by_id(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-        )
-    repo.delete(project_id)
+    check_batch_size(len(request.task_ids), settings)
+
+    def work(session: Session) -> list[TaskBatchResultDTO]:
+        return use_case(session).execute(project_id, request.task_ids)
+
+    results = await runner.run(work)
+    return batch_items(results, status.HTTP_200_OK)
+
+
+@router.post(
+    "/{project_id}/tasks/bulk/unlink",
+    response_model=list[TaskBatchItemRead],
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def unlink_tasks(
+    project_id: UUID,
+    request: TaskIdsRequest,
+    use_case: Annotated[
+        SessionBound[BulkUnlinkTasksUseCase], Depends(get_bulk_unlink_tasks_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
+    settings: SettingsDep,
+):
+    check_batch_size(len(request.task_ids), settings)
+
+    def work(session: Session) -> list[TaskBatchResultDTO]:
+        return use_case(session).execute(project_id, request.task_ids)
+
+    results = await runner.run(work)
+    return batch_items(results, status.HTTP_200_OK)
 
 
 @router.post(
     "/{project_id}/tasks/{task_id}/link",
     response_model=TaskRead,
 )
-def link_task(
+async def link_task(
     project_id: UUID,
     task_id: UUID,
     use_case: Annotated[
-        LinkTaskToProjectUseCase, Depends(get_link_task_to_project_use_case)
+        SessionBound[LinkTaskToProjectUseCase],
+        Depends(get_link_task_to_project_use_case),
     ],
+    runner: UnitOfWorkRunnerDep,
 ):
-    return use_case.execute(task_id, project_id)
+    def work(session: Session) -> TaskDTO:
+        return use_case(session).execute(task_id, project_id)
+
+    return await runner.run(work)
 
 
 @router.delete(
     "/{project_id}/tasks/{task_id}/unlink",
     response_model=TaskRead,
 )
-def unlink_task(
+async def unlink_task(
     project_id: UUID,
     task_id: UUID,
     use_case: Annotated[
-        UnlinkTaskToProjectUseCase, Depends(get_unlink_task_from_project_use_case)
+        SessionBound[UnlinkTaskToProjectUseCase],
+        Depends(get_unlink_task_from_project_use_case),
     ],
+    runner: UnitOfWorkRunnerDep,
 ):
-    return use_case.execute(task_id, project_id)
+    def work(session: Session) -> TaskDTO:
+        return use_case(session).execute(task_id, project_id)
+
+    return await runner.run(work)
 
 
 @router.get("/{project_id}/tasks", response_model=list[TaskRead])
-def retrieve_tasks(
+async def retrieve_tasks(
     project_id: UUID,
-    repo: Annotated[TaskRepository, Depends(get_task_repository)],
+    repo: Annotated[TaskRepository, Depends(get_task_read_repository)],
+    reader: ReaderDep,
 ):
-    return repo.get_by_project_id(project_id)
+    return await reader.run(repo.get_by_project_id, project_id)
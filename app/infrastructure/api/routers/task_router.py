@@ -1,29 +1,67 @@
+from datetime import timedelta
 from typing import Annotated
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlmodel import Session
 
-from app.application.use_cases.task_use_cases.reopen_task import ReopenTaskUseCase
-from app.application.use_cases.task_use_cases.update_task import UpdateTaskUseCase
 from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.api.routers._batch import batch_items
 from app.infrastructure.api.schemas.task_schemas import (
+    TaskBatchItemCreate,
+    TaskBatchItemRead,
+    TaskChangesRead,
     TaskCreate,
+    TaskIdsRequest,
     TaskRead,
     TaskUpdate,
+    UpcomingTaskRead,
 )
+from app.infrastructure.events.overdue_engine import OverdueEngine, get_overdue_engine
 from app.infrastructure.api.dependencies import (
+    ReaderDep,
+    SessionBound,
+    SettingsDep,
+    TaskRepositoryDep,
+    UnitOfWorkRunnerDep,
+    check_batch_size,
+    get_bulk_complete_tasks_use_case,
+    get_bulk_reopen_tasks_use_case,
     get_create_task_use_case,
+    get_create_tasks_use_case,
     get_complete_task_use_case,
     get_filtered_tasks_use_case,
-    get_task_repository,
+    get_task_changes_use_case,
+    get_tasks_by_ids_use_case,
+    get_task_read_repository,
     get_update_task_use_case,
     get_reopen_task_use_case,
 )
-from app.application.use_cases.task_use_cases.create_task import CreateTaskUseCase
+from app.application.use_cases.task_use_cases.bulk_transitions import (
+    BulkCompleteTasksUseCase,
+    BulkReopenTasksUseCase,
+)
 from app.application.use_cases.task_use_cases.complete_task import CompleteTaskUseCase
+from app.application.use_cases.task_use_cases.create_task import CreateTaskUseCase
+from app.application.use_cases.task_use_cases.create_tasks import CreateTasksUseCase
 from app.application.use_cases.task_use_cases.get_filtered_tasks import (
     GetFilteredTasksUseCase,
 )
-from app.application.dto.task_dto import CreateTaskDTO, TaskFilterDTO, UpdateTaskDTO
+from app.application.use_cases.task_use_cases.get_task_changes import (
+    GetTaskChangesUseCase,
+)
+from app.application.use_cases.task_use_cases.get_tasks_by_ids import (
+    GetTasksByIdsUseCase,
+)
+from app.application.use_cases.task_use_cases.reopen_task import ReopenTaskUseCase
+from app.application.use_cases.task_use_cases.update_task import UpdateTaskUseCase
+from app.application.dto.task_dto import (
+    CreateTaskBatchItemDTO,
+    CreateTaskDTO,
+    TaskBatchResultDTO,
+    TaskDTO,
+    TaskFilterDTO,
+    UpdateTaskDTO,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -31,21 +69,58 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 @router.get("/", response_model=list[TaskRead])
 async def get_tasks(
     use_case: Annotated[GetFilteredTasksUseCase, Depends(get_filtered_tasks_use_case)],
+    by_ids_use_case: Annotated[
+        GetTasksByIdsUseCase, Depends(get_tasks_by_ids_use_case)
+    ],
+    reader: ReaderDep,
+    response: Response,
     is_completed: bool | None = Query(None),
     is_overdue: bool | None = Query(None),
     project_id: UUID | None = Query(None),
+    ids: list[UUID] | None = Query(None),
 ):
+    if ids is not None:
+        if (is_completed, is_overdue, project_id) != (None, None, None):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="ids cannot be combined with other filters",
+            )
+        lookup = await reader.run(by_ids_use_case.execute, ids)
+        if lookup.missing_ids:
+            response.headers["X-Missing-Ids"] = ",".join(map(str, lookup.missing_ids))
+        return lookup.tasks
     filters = TaskFilterDTO(
         is_completed=is_completed, is_overdue=is_overdue, project_id=project_id
     )
-    return use_case.execute(filters)
+    return await reader.run(use_case.execute, filters)
+
+
+@router.get("/upcoming", response_model=list[UpcomingTaskRead])
+async def get_upcoming_tasks(
+    overdue_engine: Annotated[OverdueEngine, Depends(get_overdue_engine)],
+    within: timedelta = Query(timedelta(days=1)),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    return overdue_engine.upcoming(within=within, limit=limit)
+
+
+@router.get("/changes", response_model=TaskChangesRead)
+async def get_task_changes(
+    use_case: Annotated[GetTaskChangesUseCase, Depends(get_task_changes_use_case)],
+    reader: ReaderDep,
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+):
+    return await reader.run(use_case.execute, since=since, limit=limit)
 
 
 @router.get("/{task_id}", response_model=TaskRead)
 async def get_task(
-    task_id: UUID, repo: Annotated[TaskRepository, Depends(get_task_repository)]
+    task_id: UUID,
+    repo: Annotated[TaskRepository, Depends(get_task_read_repository)],
+    reader: ReaderDep,
 ):
-    task = repo.get_by_id(task_id=task_id)
+    task = await reader.run(repo.get_by_id, task_id=task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
@@ -56,53 +131,159 @@ async def get_task(
 @router.post("/", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
 async def create_task(
     request: TaskCreate,
-    use_case: Annotated[CreateTaskUseCase, Depends(get_create_task_use_case)],
+    use_case: Annotated[
+        SessionBound[CreateTaskUseCase], Depends(get_create_task_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
 ):
     dto = CreateTaskDTO(
         title=request.title,
         description=request.description,
         deadline=request.deadline,
     )
-    return use_case.execute(dto=dto)
+
+    def work(session: Session) -> TaskDTO:
+        return use_case(session).execute(dto=dto)
+
+    return await runner.run(work)
+
+
+@router.post(
+    "/batch",
+    response_model=list[TaskBatchItemRead],
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def create_tasks(
+    items: list[TaskBatchItemCreate],
+    use_case: Annotated[
+        SessionBound[CreateTasksUseCase], Depends(get_create_tasks_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
+    settings: SettingsDep,
+):
+    check_batch_size(len(items), settings)
+    dtos = [
+        CreateTaskBatchItemDTO(
+            title=item.title,
+            description=item.description,
+            deadline=item.deadline,
+            project_id=item.project_id,
+        )
+        for item in items
+    ]
+
+    def work(session: Session) -> list[TaskBatchResultDTO]:
+        return use_case(session).execute(dtos)
+
+    results = await runner.run(work)
+    return batch_items(results, status.HTTP_201_CREATED)
 
 
 @router.put("/{task_id}", response_model=TaskRead)
 async def update_existing_task(
     task_id: UUID,
     task: TaskUpdate,
-    use_case: Annotated[UpdateTaskUseCase, Depends(get_update_task_use_case)],
+    use_case: Annotated[
+        SessionBound[UpdateTaskUseCase], Depends(get_update_task_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
 ):
     dto = UpdateTaskDTO(
         title=task.title,
         description=task.description,
         deadline=task.deadline,
     )
-    return use_case.execute(dto, task_id)
+
+    def work(session: Session) -> TaskDTO:
+        return use_case(session).execute(dto, task_id)
+
+    return await runner.run(work)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
-    task_id: UUID, repo: Annotated[TaskRepository, Depends(get_task_repository)]
+    task_id: UUID, task_repo: TaskRepositoryDep, runner: UnitOfWorkRunnerDep
 ):
-    task = repo.get_by_id(task_id=task_id)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
-        )
-    repo.delete(task_id)
+    def work(session: Session) -> None:
+        repo = task_repo(session)
+        task = repo.get_by_id(task_id=task_id)
+        if not task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            )
+        repo.delete(task_id)
+
+    await runner.run(work)
+
+
+@router.post(
+    "/bulk/complete",
+    response_model=list[TaskBatchItemRead],
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def complete_tasks(
+    request: TaskIdsRequest,
+    use_case: Annotated[
+        SessionBound[BulkCompleteTasksUseCase],
+        Depends(get_bulk_complete_tasks_use_case),
+    ],
+    runner: UnitOfWorkRunnerDep,
+    settings: SettingsDep,
+):
+    check_batch_size(len(request.task_ids), settings)
+
+    def work(session: Session) -> list[TaskBatchResultDTO]:
+        return use_case(session).execute(request.task_ids)
+
+    results = await runner.run(work)
+    return batch_items(results, status.HTTP_200_OK)
+
+
+@router.post(
+    "/bulk/reopen",
+    response_model=list[TaskBatchItemRead],
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def reopen_tasks(
+    request: TaskIdsRequest,
+    use_case: Annotated[
+        SessionBound[BulkReopenTasksUseCase], Depends(get_bulk_reopen_tasks_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
+    settings: SettingsDep,
+):
+    check_batch_size(len(request.task_ids), settings)
+
+    def work(session: Session) -> list[TaskBatchResultDTO]:
+        return use_case(session).execute(request.task_ids)
+
+    results = await runner.run(work)
+    return batch_items(results, status.HTTP_200_OK)
 
 
 @router.patch("/{task_id}/complete", response_model=TaskRead)
 async def complete_task(
     task_id: UUID,
-    use_case: Annotated[CompleteTaskUseCase, Depends(get_complete_task_use_case)],
+    use_case: Annotated[
+        SessionBound[CompleteTaskUseCase], Depends(get_complete_task_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
 ):
-    return use_case.execute(task_id=task_id)
+    def work(session: Session) -> TaskDTO:
+        return use_case(session).execute(task_id=task_id)
+
+    return await runner.run(work)
 
 
 @router.patch("/{task_id}/reopen", response_model=TaskRead)
 async def reopen_task(
     task_id: UUID,
-    use_case: Annotated[ReopenTaskUseCase, Depends(get_reopen_task_use_case)],
+    use_case: Annotated[
+        SessionBound[ReopenTaskUseCase], Depends(get_reopen_task_use_case)
+    ],
+    runner: UnitOfWorkRunnerDep,
 ):
-    return use_case.execute(task_id=task_id)
+    def work(session: Session) -> TaskDTO:
+        return use_case(session).execute(task_id=task_id)
+
+    return await runner.run(work)
@@ -0,0 +1,19 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+
+class BatchSubRequest(BaseModel):
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+    path: str
+    body: Any = None
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchSubRequest]
+    atomic: bool = False
+
+
+class BatchSubResponse(BaseModel):
+    status: int
+    body: Any = None
@@ -1,8 +1,11 @@
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.infrastructure.api.schemas.task_schemas import TaskRead
+
 
 class ProjectBase(BaseModel):
     title: str
@@ -23,3 +26,22 @@ class ProjectRead(ProjectBase):
     is_completed: bool
     created_at: datetime
     updated_at: datetime
+
+
+class ProjectInclude(str, Enum):
+    STATS = "stats"
+    TASKS = "tasks"
+
+
+class ProjectStatsRead(BaseModel):
+    project_id: UUID
+    total_tasks: int
+    completed_tasks: int
+    open_tasks: int
+    overdue_tasks: int
+    next_deadline: datetime | None
+
+
+class ProjectExpandedRead(ProjectRead):
+    stats: ProjectStatsRead | None = None
+    tasks: list[TaskRead] | None = None
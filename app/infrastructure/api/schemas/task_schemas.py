@@ -14,6 +14,10 @@ class TaskCreate(TaskBase):
     pass
 
 
+class TaskBatchItemCreate(TaskCreate):
+    project_id: UUID | None = None
+
+
 class TaskUpdate(TaskBase):
     title: str | None = None
     description: str | None = None
@@ -26,3 +30,27 @@ class TaskRead(TaskBase):
     created_at: datetime
     updated_at: datetime
     project_id: UUID | None = None
+
+
+class TaskIdsRequest(BaseModel):
+    task_ids: list[UUID]
+
+
+class TaskBatchItemRead(BaseModel):
+    index: int
+    status: int
+    task: TaskRead | None = None
+    error: str | None = None
+
+
+class UpcomingTaskRead(BaseModel):
+    task_id: UUID
+    project_id: UUID | None = None
+    deadline: datetime
+
+
+class TaskChangesRead(BaseModel):
+    tasks: list[TaskRead]
+    deleted_ids: list[UUID]
+    next_since: int
+    has_more: bool
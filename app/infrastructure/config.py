@@ -8,8 +8,44 @@ from app import PROJECT_DIR
 class Settings(BaseSettings):
     DATABASE_FILE_PATH: Path = "app.db"
     DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = -1
     AUTO_COMPLETE_PROJECTS: bool = True
     AUTO_ADJUST_TASK_DEADLINES: bool = True
+    OUTBOX_DISPATCH_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL: float = 0.5
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BACKOFF: float = 1.0
+    OUTBOX_CLAIM_LEASE: float = 60.0
+    EVENT_COALESCE_WINDOW: float = 1.0
+    OVERDUE_ENGINE_ENABLED: bool = True
+    CHANGE_FEED_HISTORY_SIZE: int = 1000
+    CHANGE_FEED_QUEUE_SIZE: int = 1000
+    CHANGE_FEED_HEARTBEAT: float = 15.0
+    WRITE_COORDINATOR_ENABLED: bool = False
+    WRITE_BATCH_MAX_SIZE: int = 64
+    WRITE_BATCH_MAX_DELAY: float = 0.002
+    TASK_BATCH_MAX_SIZE: int = 1000
+    BATCH_MAX_REQUESTS: int = 50
+    IMPORT_CHUNK_SIZE: int = 1000
+    IMPORT_DEADLINE: float | None = None
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_DEADLINE: float | None = None
+    READ_POOL_SIZE: int = 10
+    READ_EXECUTOR_WORKERS: int = 8
+    WRITE_EXECUTOR_WORKERS: int = 1
+    SINGLE_FLIGHT_ENABLED: bool = True
+    REQUEST_DEADLINE: float | None = 30.0
+    ROUTE_DEADLINES: dict[str, float] = {}
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_READS: int = 256
+    ADMISSION_MAX_WRITES: int = 64
+    ADMISSION_MAX_READ_QUEUE_WAIT: float = 2.0
+    ADMISSION_MAX_WRITE_QUEUE_WAIT: float = 1.0
+    ADMISSION_RETRY_AFTER: int = 1
 
     model_config = SettingsConfigDict(
         env_file=PROJECT_DIR / ".env",
@@ -23,6 +59,10 @@ class Settings(BaseSettings):
             self.DATABASE_FILE_PATH.mkdir(exist_ok=True)
         return f"sqlite:///{str(self.DATABASE_FILE_PATH)}"
 
+    @property
+    def read_only_database_url(self) -> str:
+        return f"sqlite:///file:{str(self.DATABASE_FILE_PATH)}?mode=ro&uri=true"
+
 
 _settings = None
 
@@ -0,0 +1,157 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.persistence.change_tracking import ChangeAction, RowChange
+
+RESET_EVENT = "feed.reset"
+
+
+@dataclass(frozen=True)
+class ChangeNotification:
+    id: int
+    type: str
+    entity_id: UUID | None
+    project_ids: frozenset[UUID]
+    data: dict[str, Any]
+
+    def concerns(self, project_id: UUID | None) -> bool:
+        return (
+            project_id is None
+            or self.type == RESET_EVENT
+            or project_id in self.project_ids
+        )
+
+
+class ChangeFeed:
+    """Fans committed row changes out to every open stream of this worker.
+
+    Notifications are numbered and published on the event loop, and the
+    most recent ones are retained so a reconnecting client can resume
+    from its ``Last-Event-ID``. A subscriber that falls too far behind is
+    disconnected instead of buffering without bound.
+    """
+
+    def __init__(self, history_size: int = 1000, queue_size: int = 1000) -> None:
+        self._history: deque[ChangeNotification] = deque(maxlen=history_size)
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._last_id = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def close(self) -> None:
+        for queue in list(self._subscribers):
+            self._disconnect(queue)
+        self._loop = None
+
+    def apply_changes(self, changes: list[RowChange]) -> None:
+        if self._loop is None:
+            return
+        pending = [_describe(change) for change in changes]
+        self._loop.call_soon_threadsafe(self._publish, pending)
+
+    async def subscribe(
+        self,
+        last_event_id: int | None = None,
+        project_id: UUID | None = None,
+        heartbeat: float | None = None,
+    ) -> AsyncIterator[ChangeNotification | None]:
+        """Yield notifications, or ``None`` when ``heartbeat`` seconds pass
+        without one."""
+        queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+        backlog = self._backlog(last_event_id)
+        self._subscribers.add(queue)
+        try:
+            for notification in backlog:
+                if notification.concerns(project_id):
+                    yield notification
+            while True:
+                try:
+                    notification = await asyncio.wait_for(queue.get(), heartbeat)
+                except TimeoutError:
+                    yield None
+                    continue
+                if notification is None:
+                    return
+                if notification.concerns(project_id):
+                    yield notification
+        finally:
+            self._subscribers.discard(queue)
+
+    def _publish(self, pending: list[tuple[str, UUID, frozenset, dict]]) -> None:
+        for event_type, entity_id, project_ids, data in pending:
+            self._last_id += 1
+            notification = ChangeNotification(
+                self._last_id, event_type, entity_id, project_ids, data
+            )
+            self._history.append(notification)
+            for queue in list(self._subscribers):
+                try:
+                    queue.put_nowait(notification)
+                except asyncio.QueueFull:
+                    self._disconnect(queue)
+
+    def _backlog(self, last_event_id: int | None) -> list[ChangeNotification]:
+        if last_event_id is None:
+            return []
+        oldest_id = self._history[0].id if self._history else self._last_id + 1
+        if last_event_id > self._last_id or last_event_id < oldest_id - 1:
+            # The client missed notifications that are no longer retained
+            # (or were numbered by a previous process): it has to resync.
+            reset = ChangeNotification(
+                self._last_id, RESET_EVENT, None, frozenset(), {}
+            )
+            return [reset, *self._history]
+        return [n for n in self._history if n.id > last_event_id]
+
+    def _disconnect(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+
+def _describe(change: RowChange) -> tuple[str, UUID, frozenset, dict]:
+    values = change.values
+    if change.entity == "task":
+        project_ids = {values.get("project_id"), change.previous.get("project_id")}
+    else:
+        project_ids = {change.row_id}
+    project_ids.discard(None)
+    return (
+        f"{change.entity}.{_action_name(change)}",
+        change.row_id,
+        frozenset(project_ids),
+        values,
+    )
+
+
+def _action_name(change: RowChange) -> str:
+    if change.action is not ChangeAction.UPDATED:
+        return change.action.value
+    if "is_completed" in change.changed:
+        return "completed" if change.values["is_completed"] else "reopened"
+    if "project_id" in change.changed:
+        return "linked" if change.values["project_id"] else "unlinked"
+    return ChangeAction.UPDATED.value
+
+
+_change_feed: ChangeFeed | None = None
+
+
+def get_change_feed() -> ChangeFeed:
+    global _change_feed
+    if _change_feed is None:
+        settings = get_settings()
+        _change_feed = ChangeFeed(
+            history_size=settings.CHANGE_FEED_HISTORY_SIZE,
+            queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+        )
+    return _change_feed
@@ -0,0 +1,50 @@
+import logging
+from datetime import timedelta
+from functools import partial
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.domain.event_bus import EventBus
+from app.domain.event_handlers import ProjectDeadlineChangedHandler
+from app.domain.events import ProjectDeadlineChangedEvent, TaskBecameOverdueEvent
+from app.domain.services.deadline_enforcement_service import DeadlineEnforcementService
+from app.infrastructure.config import Settings
+from app.infrastructure.events.outbox_dispatcher import OutboxDispatcher
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def register_subscribers(event_bus: EventBus, session: Session) -> None:
+    deadline_handler = ProjectDeadlineChangedHandler(
+        task_repository=SQLAlchemyTaskRepository(session),
+        deadline_service=DeadlineEnforcementService(),
+    )
+    event_bus.subscribe(
+        ProjectDeadlineChangedEvent,
+        partial(deadline_handler.handle, auto_adjust=True),
+    )
+
+
+def register_overdue_subscribers(event_bus: EventBus) -> None:
+    event_bus.subscribe(TaskBecameOverdueEvent, _log_task_became_overdue)
+
+
+def _log_task_became_overdue(event: TaskBecameOverdueEvent) -> None:
+    logger.info("Task %s became overdue at %s", event.task_id, event.deadline)
+
+
+def create_outbox_dispatcher(engine: Engine, settings: Settings) -> OutboxDispatcher:
+    return OutboxDispatcher(
+        engine=engine,
+        register_subscribers=register_subscribers,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_POLL_INTERVAL,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        retry_backoff=settings.OUTBOX_RETRY_BACKOFF,
+        claim_lease=timedelta(seconds=settings.OUTBOX_CLAIM_LEASE),
+        coalesce_window=timedelta(seconds=settings.EVENT_COALESCE_WINDOW),
+    )
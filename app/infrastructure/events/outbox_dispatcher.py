@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import Connection, Engine, or_, update
+from sqlmodel import Session, col, select
+
+from app.domain.clock import Clock, SystemClock
+from app.domain.event_bus import EventBus
+from app.domain.events import DomainEvent
+from app.infrastructure.events.serialization import deserialize_event
+from app.infrastructure.persistence.models.models import OutboxMessageModel
+
+logger = logging.getLogger(__name__)
+
+SubscriberRegistration = Callable[[EventBus, Session], None]
+
+
+class OutboxDispatcher:
+    """Delivers outbox messages to the event bus subscribers.
+
+    Several dispatchers may poll the same database (one per server
+    worker). Each batch is claimed first with a single ``UPDATE ...
+    RETURNING``, so a message is handled by one dispatcher at a time; a
+    claim lapses after ``claim_lease`` in case its dispatcher died.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        register_subscribers: SubscriberRegistration,
+        batch_size: int = 100,
+        poll_interval: float = 0.5,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        coalesce_window: timedelta = timedelta(0),
+        claim_lease: timedelta = timedelta(seconds=60),
+        clock: Clock | None = None,
+        dispatcher_id: str | None = None,
+    ) -> None:
+        self._engine = engine
+        self._register_subscribers = register_subscribers
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._coalesce_window = coalesce_window
+        self._claim_lease = claim_lease
+        self._dispatcher_id = dispatcher_id or uuid4().hex
+        self._clock = clock or SystemClock()
+        self._task: asyncio.Task | None = None
+
+    def dispatch_batch(self) -> int:
+        with Session(self._engine) as session:
+            now = self._clock.now()
+            ids = self._claim(session, now)
+            if not ids:
+                return 0
+            messages = session.exec(
+                select(OutboxMessageModel)
+                .where(col(OutboxMessageModel.id).in_(ids))
+                .order_by(OutboxMessageModel.created_at)
+            ).all()
+            succeeded, waiting = self._dispatch(messages, now)
+            for message in succeeded:
+                message.processed_at = now
+            for message in messages:
+                message.claimed_by = message.claimed_until = None
+            session.commit()
+            return len(messages) - waiting
+
+    def _claim(self, session: Session, now: datetime) -> list[UUID]:
+        claimable = (
+            select(OutboxMessageModel.id)
+            .where(
+                OutboxMessageModel.processed_at.is_(None),
+                OutboxMessageModel.failed_at.is_(None),
+                OutboxMessageModel.available_at <= now,
+                or_(
+                    OutboxMessageModel.claimed_until.is_(None),
+                    OutboxMessageModel.claimed_until <= now,
+                ),
+            )
+            .order_by(OutboxMessageModel.created_at)
+            .limit(self._batch_size)
+        )
+        # One statement, so SQLite runs the select and the claim under the
+        # same write lock and two dispatchers never claim the same row.
+        claimed = session.exec(
+            update(OutboxMessageModel)
+            .where(col(OutboxMessageModel.id).in_(claimable.scalar_subquery()))
+            .values(
+                claimed_by=self._dispatcher_id,
+                claimed_until=now + self._claim_lease,
+            )
+            .returning(OutboxMessageModel.id)
+        ).all()
+        session.commit()
+        return [row.id for row in claimed]
+
+    def _dispatch(
+        self, messages: list[OutboxMessageModel], now: datetime
+    ) -> tuple[list[OutboxMessageModel], int]:
+        sources: dict[int, OutboxMessageModel] = {}
+        with self._engine.connect() as connection:
+            # pysqlite only opens a transaction before DML; open it
+            # explicitly so the savepoints below nest inside it.
+            connection.exec_driver_sql("BEGIN")
+            # Repository commits only release the session's savepoint.
+            handler_session = Session(
+                bind=connection, join_transaction_mode="create_savepoint"
+            )
+            event_bus = EventBus(self._coalesce_window)
+            self._register_subscribers(event_bus, handler_session)
+            for message in messages:
+                try:
+                    event = deserialize_event(message.event_type, message.payload)
+                except Exception as e:
+                    self._schedule_retry(message, e, now)
+                    continue
+                sources[id(event)] = message
+                event_bus.publish(event)
+
+            def on_error(events: list[DomainEvent], error: Exception) -> None:
+                for event in events:
+                    self._schedule_retry(sources.pop(id(event)), error, now)
+
+            event_bus.flush(
+                on_error=on_error,
+                now=now,
+                scope=lambda: self._group_savepoint(connection, handler_session),
+            )
+            handler_session.close()
+            connection.commit()
+            # Groups still inside the coalesce window are left pending and
+            # picked up again once they settle.
+            waiting = event_bus.pending_events()
+            for event in waiting:
+                sources.pop(id(event))
+        return list(sources.values()), len(waiting)
+
+    @staticmethod
+    @contextmanager
+    def _group_savepoint(connection: Connection, session: Session) -> Iterator[None]:
+        """Undo everything a group's handlers wrote if one of them fails, so
+        a retried message does not apply its cascade twice."""
+        savepoint = connection.begin_nested()
+        try:
+            yield
+            session.commit()
+        except Exception:
+            session.rollback()
+            savepoint.rollback()
+            raise
+        savepoint.commit()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                dispatched = await asyncio.to_thread(self.dispatch_batch)
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                dispatched = 0
+            if dispatched < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    def _schedule_retry(
+        self, message: OutboxMessageModel, error: Exception, now: datetime
+    ) -> None:
+        message.attempts += 1
+        message.last_error = repr(error)
+        if message.attempts >= self._max_attempts:
+            message.failed_at = now
+            logger.error(
+                "Outbox message %s failed after %s attempts",
+                message.id,
+                message.attempts,
+            )
+            return
+        delay = self._retry_backoff * 2 ** (message.attempts - 1)
+        message.available_at = now + timedelta(seconds=delay)
@@ -0,0 +1,208 @@
+import asyncio
+import heapq
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from app.domain.clock import Clock, SystemClock
+from app.domain.event_bus import EventBus
+from app.domain.events import TaskBecameOverdueEvent
+from app.infrastructure.persistence.change_tracking import ChangeAction, RowChange
+from app.infrastructure.persistence.models.models import TaskModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UpcomingDeadline:
+    task_id: UUID
+    project_id: UUID | None
+    deadline: datetime
+
+
+class OverdueEngine:
+    """Keeps a min-heap of open task deadlines and emits
+    ``TaskBecameOverdueEvent`` when each of them passes.
+
+    Heap entries are invalidated lazily: an entry is live only while it
+    matches the deadline recorded for its task in ``_tracked``.
+    """
+
+    def __init__(self, event_bus: EventBus, clock: Clock | None = None) -> None:
+        self._event_bus = event_bus
+        self._clock = clock or SystemClock()
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._tracked: dict[UUID, UpcomingDeadline] = {}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def event_bus(self) -> EventBus:
+        return self._event_bus
+
+    def load(self, session: Session) -> None:
+        statement = select(
+            TaskModel.id, TaskModel.project_id, TaskModel.deadline
+        ).where(
+            TaskModel.is_completed == False,  # noqa: E712
+            TaskModel.deadline > self._clock.now(),
+        )
+        with self._lock:
+            self._tracked = {
+                task_id: UpcomingDeadline(task_id, project_id, deadline)
+                for task_id, project_id, deadline in session.exec(statement)
+            }
+            self._heap = [(d.deadline, d.task_id) for d in self._tracked.values()]
+            heapq.heapify(self._heap)
+
+    def apply_changes(self, changes: list[RowChange]) -> None:
+        now = self._clock.now()
+        earliest_changed = False
+        with self._lock:
+            for change in changes:
+                if change.entity != "task":
+                    continue
+                previous = self._tracked.pop(change.row_id, None)
+                values = change.values
+                if (
+                    change.action is ChangeAction.DELETED
+                    or values.get("is_completed")
+                    or values.get("deadline") is None
+                    or values["deadline"] <= now
+                ):
+                    continue
+                entry = UpcomingDeadline(
+                    change.row_id, values.get("project_id"), values["deadline"]
+                )
+                self._tracked[entry.task_id] = entry
+                if previous is not None and previous.deadline == entry.deadline:
+                    # Its heap entry is still live.
+                    continue
+                if not self._heap or entry.deadline < self._heap[0][0]:
+                    earliest_changed = True
+                heapq.heappush(self._heap, (entry.deadline, entry.task_id))
+            self._compact()
+        if earliest_changed:
+            self._wake()
+
+    def upcoming(
+        self, within: timedelta, limit: int | None = None
+    ) -> list[UpcomingDeadline]:
+        now = self._clock.now()
+        horizon = now + within
+        result: list[UpcomingDeadline] = []
+        # A task completed and reopened with the same deadline has two
+        # matching heap entries.
+        seen: set[UUID] = set()
+        with self._lock:
+            # Walk the heap in order without popping: children of a node are
+            # only explored while the node itself is inside the horizon.
+            frontier = [(self._heap[0], 0)] if self._heap else []
+            while frontier and (limit is None or len(result) < limit):
+                (deadline, task_id), index = heapq.heappop(frontier)
+                if deadline > horizon:
+                    break
+                entry = self._tracked.get(task_id)
+                if (
+                    entry is not None
+                    and entry.deadline == deadline
+                    and deadline > now
+                    and task_id not in seen
+                ):
+                    seen.add(task_id)
+                    result.append(entry)
+                for child in (2 * index + 1, 2 * index + 2):
+                    if child < len(self._heap):
+                        heapq.heappush(frontier, (self._heap[child], child))
+        return result
+
+    def emit_due(self) -> list[TaskBecameOverdueEvent]:
+        now = self._clock.now()
+        due: list[UpcomingDeadline] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, task_id = heapq.heappop(self._heap)
+                entry = self._tracked.get(task_id)
+                if entry is None or entry.deadline != deadline:
+                    continue
+                del self._tracked[task_id]
+                due.append(entry)
+        events = [
+            TaskBecameOverdueEvent(
+                occurred_at=now,
+                task_id=entry.task_id,
+                project_id=entry.project_id,
+                deadline=entry.deadline,
+            )
+            for entry in due
+        ]
+        for event in events:
+            self._event_bus.publish(event)
+        self._event_bus.flush(on_error=self._log_error)
+        return events
+
+    def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._seconds_until_next())
+            except TimeoutError:
+                pass
+            try:
+                self.emit_due()
+            except Exception:
+                logger.exception("Failed to emit overdue task events")
+
+    def _seconds_until_next(self) -> float | None:
+        with self._lock:
+            if not self._heap:
+                return None
+            next_deadline = self._heap[0][0]
+        return max((next_deadline - self._clock.now()).total_seconds(), 0)
+
+    def _wake(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _compact(self) -> None:
+        if len(self._heap) <= 2 * len(self._tracked) + 64:
+            return
+        self._heap = [(d.deadline, d.task_id) for d in self._tracked.values()]
+        heapq.heapify(self._heap)
+
+    @staticmethod
+    def _log_error(events: list, error: Exception) -> None:
+        logger.error("Overdue event subscriber failed for %s: %r", events, error)
+
+
+_overdue_engine: OverdueEngine | None = None
+
+
+def get_overdue_engine() -> OverdueEngine:
+    global _overdue_engine
+    if _overdue_engine is None:
+        _overdue_engine = OverdueEngine(EventBus())
+    return _overdue_engine
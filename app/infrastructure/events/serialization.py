@@ -0,0 +1,44 @@
+import json
+from dataclasses import asdict, fields
+from datetime import datetime
+from typing import Any, get_type_hints
+from uuid import UUID
+
+from app.domain.events import DomainEvent, ProjectDeadlineChangedEvent
+
+EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    cls.__name__: cls for cls in (ProjectDeadlineChangedEvent,)
+}
+
+
+def serialize_event(event: DomainEvent) -> str:
+    return json.dumps(asdict(event), default=_encode)
+
+
+def deserialize_event(event_type: str, payload: str) -> DomainEvent:
+    try:
+        cls = EVENT_TYPES[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
+    data = json.loads(payload)
+    hints = get_type_hints(cls)
+    values = {f.name: _decode(hints[f.name], data.get(f.name)) for f in fields(cls)}
+    return cls(**values)
+
+
+def _encode(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _decode(hint: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    if hint is datetime or datetime in getattr(hint, "__args__", ()):
+        return datetime.fromisoformat(value)
+    if hint is UUID or UUID in getattr(hint, "__args__", ()):
+        return UUID(value)
+    return value
@@ -0,0 +1,119 @@
+import asyncio
+import contextvars
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.metrics import MetricsRegistry, get_metrics_registry
+
+T = TypeVar("T")
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class BoundedExecutor:
+    """A fixed-size thread pool for blocking database work.
+
+    Calls are awaited from the event loop and run with the caller's
+    context variables. Queue depth, in-flight count and queue wait time
+    are published under ``executor.<name>``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._name = name
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        metrics = metrics or get_metrics_registry()
+        self._queued = metrics.gauge(f"executor.{name}.queue_depth")
+        self._in_flight = metrics.gauge(f"executor.{name}.in_flight")
+        self._wait = metrics.histogram(f"executor.{name}.wait_seconds", WAIT_BUCKETS)
+        self._pending: dict[int, float] = {}
+        self._tokens = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def queue_depth(self) -> int:
+        return int(self._queued.snapshot())
+
+    @property
+    def in_flight(self) -> int:
+        return int(self._in_flight.snapshot())
+
+    @property
+    def queue_wait(self) -> float:
+        """How long the oldest queued call has been waiting, in seconds."""
+        with self._lock:
+            oldest = next(iter(self._pending.values()), None)
+        return 0.0 if oldest is None else time.perf_counter() - oldest
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        context = contextvars.copy_context()
+        token = next(self._tokens)
+        submitted = time.perf_counter()
+        with self._lock:
+            self._pending[token] = submitted
+            self._queued.set(len(self._pending))
+
+        def call() -> T:
+            self._dequeue(token)
+            self._wait.observe(time.perf_counter() - submitted)
+            self._in_flight.inc()
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                self._in_flight.dec()
+
+        future = self._pool.submit(call)
+        future.add_done_callback(
+            lambda f: self._dequeue(token) if f.cancelled() else None
+        )
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def _dequeue(self, token: int) -> None:
+        with self._lock:
+            self._pending.pop(token, None)
+            self._queued.set(len(self._pending))
+
+
+_read_executor: BoundedExecutor | None = None
+_write_executor: BoundedExecutor | None = None
+
+
+def get_read_executor() -> BoundedExecutor:
+    global _read_executor
+    if _read_executor is None:
+        _read_executor = BoundedExecutor("read", get_settings().READ_EXECUTOR_WORKERS)
+    return _read_executor
+
+
+def get_write_executor() -> BoundedExecutor:
+    global _write_executor
+    if _write_executor is None:
+        _write_executor = BoundedExecutor(
+            "write", get_settings().WRITE_EXECUTOR_WORKERS
+        )
+    return _write_executor
+
+
+def shutdown_executors() -> None:
+    global _read_executor, _write_executor
+    for executor in (_read_executor, _write_executor):
+        if executor is not None:
+            executor.shutdown()
+    _read_executor = _write_executor = None
@@ -0,0 +1,14 @@
+from collections.abc import Iterator, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Stays well below SQLite's bound-parameter limit (999 on older builds).
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def chunked(
+    items: Sequence[T], size: int = IN_CLAUSE_CHUNK_SIZE
+) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -0,0 +1,65 @@
+import threading
+import time
+from contextvars import ContextVar
+
+PROGRESS_HANDLER_INTERVAL = 1000
+
+
+class CancellationToken:
+    """Deadline and cancellation flag for the work done on behalf of one
+    request.
+
+    SQLite statements poll the token from a progress handler, so a
+    statement running in a worker thread is interrupted once the deadline
+    passes or the token is cancelled (e.g. because the client went away).
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def remaining(self) -> float | None:
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def should_abort(self) -> bool:
+        return self.cancelled or self.expired
+
+
+_current_token: ContextVar[CancellationToken | None] = ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def current_token() -> CancellationToken | None:
+    return _current_token.get()
+
+
+def set_current_token(token: CancellationToken | None):
+    return _current_token.set(token)
+
+
+def reset_current_token(reset_token) -> None:
+    _current_token.reset(reset_token)
+
+
+def abort_if_cancelled() -> int:
+    """SQLite progress handler: a non-zero return interrupts the statement."""
+    token = _current_token.get()
+    return 1 if token is not None and token.should_abort() else 0
+
+
+def install_progress_handler(dbapi_conn) -> None:
+    dbapi_conn.set_progress_handler(abort_if_cancelled, PROGRESS_HANDLER_INTERVAL)
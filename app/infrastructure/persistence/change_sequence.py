@@ -0,0 +1,33 @@
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, select
+
+from app.infrastructure.persistence.models.models import ChangeSequenceModel
+
+TASK_SEQUENCE = "task"
+
+
+def next_change_seq(session: Session, name: str = TASK_SEQUENCE, count: int = 1) -> int:
+    """Allocate the next ``count`` values of a named change sequence and
+    return the last one.
+
+    The counter row is written inside the caller's transaction, so SQLite's
+    write lock hands out values in commit order: once a client has seen a
+    value, no row can later be committed with a lower one.
+    """
+    statement = (
+        insert(ChangeSequenceModel)
+        .values(name=name, value=count)
+        .on_conflict_do_update(
+            index_elements=[ChangeSequenceModel.name],
+            set_={"value": ChangeSequenceModel.value + count},
+        )
+        .returning(ChangeSequenceModel.value)
+    )
+    return session.execute(statement).scalar_one()
+
+
+def current_change_seq(session: Session, name: str = TASK_SEQUENCE) -> int:
+    statement = select(ChangeSequenceModel.value).where(
+        ChangeSequenceModel.name == name
+    )
+    return session.exec(statement).first() or 0
@@ -0,0 +1,117 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+
+_PENDING_KEY = "row_changes"
+_DEFERRED_KEY = "deferred_row_changes"
+_TRACKED_MODELS: dict[type, str] = {TaskModel: "task", ProjectModel: "project"}
+
+
+class ChangeAction(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class RowChange:
+    entity: str
+    action: ChangeAction
+    row_id: UUID
+    values: dict[str, Any]
+    changed: frozenset[str] = frozenset()
+    previous: dict[str, Any] = field(default_factory=dict)
+
+
+ChangeListener = Callable[[list[RowChange]], None]
+
+_listeners: list[ChangeListener] = []
+
+
+def add_change_listener(listener: ChangeListener) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_change_listener(listener: ChangeListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def record_changes(session: Session, changes: Iterable[RowChange]) -> None:
+    """Stage changes made outside the unit of work, e.g. by bulk statements."""
+    session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+
+def defer_change_notifications(session: Session) -> list[RowChange]:
+    """Collect the session's committed changes into the returned list
+    instead of notifying listeners, for sessions that commit into an
+    enclosing transaction."""
+    return session.info.setdefault(_DEFERRED_KEY, [])
+
+
+def notify_change_listeners(changes: list[RowChange]) -> None:
+    for listener in list(_listeners):
+        listener(changes)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_row_changes(session: Session, _flush_context) -> None:
+    changes = []
+    for instance in session.new:
+        if type(instance) in _TRACKED_MODELS:
+            changes.append(_row_change(instance, ChangeAction.CREATED))
+    for instance in session.dirty:
+        if type(instance) in _TRACKED_MODELS:
+            change = _row_change(instance, ChangeAction.UPDATED)
+            if change.changed:
+                changes.append(change)
+    for instance in session.deleted:
+        if type(instance) in _TRACKED_MODELS:
+            changes.append(_row_change(instance, ChangeAction.DELETED))
+    if changes:
+        record_changes(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_row_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    deferred = session.info.get(_DEFERRED_KEY)
+    if deferred is not None:
+        deferred.extend(changes)
+        return
+    notify_change_listeners(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_row_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _row_change(instance: Any, action: ChangeAction) -> RowChange:
+    state = inspect(instance)
+    values, changed, previous = {}, set(), {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if action is ChangeAction.UPDATED and history.added:
+            changed.add(attr.key)
+            if history.deleted:
+                previous[attr.key] = history.deleted[0]
+        values[attr.key] = getattr(instance, attr.key)
+    return RowChange(
+        entity=_TRACKED_MODELS[type(instance)],
+        action=action,
+        row_id=values["id"],
+        values=values,
+        changed=frozenset(changed),
+        previous=previous,
+    )
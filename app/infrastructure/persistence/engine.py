@@ -4,14 +4,57 @@ from sqlalchemy import event, Engine
 from sqlmodel import create_engine, SQLModel, Session
 
 from app.infrastructure.config import get_settings
+from app.infrastructure.persistence.cancellation import install_progress_handler
+from app.infrastructure.persistence.migrations import upgrade_schema
+from app.infrastructure.persistence.pool_metrics import (
+    InstrumentedQueuePool,
+    instrument_engine,
+)
 
 settings = get_settings()
 
+
+def create_read_only_engine(url: str, echo: bool = False, **pool_options) -> Engine:
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        echo=echo,
+        **pool_options,
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_query_only(dbapi_conn, _connection_record) -> None:
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return engine
+
+
+def _pool_options(name: str, pool_size: int) -> dict:
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": pool_size,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    }
+
+
 _engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False},
     echo=settings.DATABASE_ECHO,
+    **_pool_options("primary", settings.DATABASE_POOL_SIZE),
+)
+_read_engine = create_read_only_engine(
+    settings.read_only_database_url,
+    echo=settings.DATABASE_ECHO,
+    **_pool_options("read", settings.READ_POOL_SIZE),
 )
+instrument_engine(_engine)
+instrument_engine(_read_engine)
 
 
 @event.listens_for(Engine, "connect")
@@ -19,18 +62,38 @@ def set_sqlite_pragma(dbapi_conn, _connection_record) -> None:
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
+    install_progress_handler(dbapi_conn)
+
+
+@event.listens_for(_engine, "connect")
+def set_wal_mode(dbapi_conn, _connection_record) -> None:
+    # WAL lets the read-only pool keep reading while a write is in flight.
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
 
 
 def get_engine() -> Engine:
     return _engine
 
 
+def get_read_engine() -> Engine:
+    return _read_engine
+
+
 def create_db_and_tables() -> None:
     engine = get_engine()
     SQLModel.metadata.create_all(engine)
+    upgrade_schema(engine)
 
 
 def get_session() -> Generator[Session, None, None]:
     engine = get_engine()
     with Session(engine) as session:
         yield session
+
+
+def get_read_session() -> Generator[Session, None, None]:
+    engine = get_read_engine()
+    with Session(engine) as session:
+        yield session
@@ -0,0 +1,91 @@
+import logging
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    MetaData,
+    bindparam,
+    inspect,
+    select,
+    update,
+)
+from sqlmodel import Session, SQLModel
+
+from app.infrastructure.persistence.change_sequence import next_change_seq
+from app.infrastructure.persistence.models.models import TaskModel
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade_schema(engine: Engine, metadata: MetaData = SQLModel.metadata) -> None:
+    """Bring a database created by an earlier release up to the current models.
+
+    ``create_all`` only creates missing tables, so columns and indexes added
+    to an existing table are applied here, and task rows written before the
+    change feed existed are given change sequence values.
+    """
+    with engine.begin() as connection:
+        _add_missing_columns(connection, metadata)
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+        _backfill_change_seq(connection)
+
+
+def _add_missing_columns(connection: Connection, metadata: MetaData) -> None:
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                logger.info("Adding column %s.%s", table.name, column.name)
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN "
+                    f"{_column_ddl(connection, column)}"
+                )
+
+
+def _column_ddl(connection: Connection, column: Column) -> str:
+    preparer = connection.dialect.identifier_preparer
+    ddl = f"{preparer.quote(column.name)} {column.type.compile(connection.dialect)}"
+    if column.nullable:
+        return ddl
+    # SQLite can only add a NOT NULL column when existing rows get a value.
+    default = column.default
+    if default is None or not default.is_scalar:
+        raise RuntimeError(
+            f"Cannot add NOT NULL column {column.table.name}.{column.name} "
+            "without a scalar default"
+        )
+    return f"{ddl} NOT NULL DEFAULT {default.arg!r}"
+
+
+def _backfill_change_seq(connection: Connection) -> None:
+    # Every write allocates a positive value, so 0 marks a row that predates
+    # the change feed. Rows are numbered in the order they were last updated.
+    table = TaskModel.__table__
+    ids = (
+        connection.execute(
+            select(table.c.id)
+            .where(table.c.change_seq == 0)
+            .order_by(table.c.updated_at, table.c.id)
+        )
+        .scalars()
+        .all()
+    )
+    if not ids:
+        return
+    with Session(bind=connection) as session:
+        last = next_change_seq(session, count=len(ids))
+    first = last - len(ids) + 1
+    connection.execute(
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(change_seq=bindparam("seq")),
+        [{"row_id": id_, "seq": first + i} for i, id_ in enumerate(ids)],
+    )
+    logger.info("Assigned change sequence values to %s existing tasks", len(ids))
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from app.infrastructure.persistence.models.base import Base, TimestampMixin
@@ -17,10 +18,19 @@ class ProjectModel(Base, TimestampMixin, table=True):
     )
     is_completed: bool | None = Field(default=False)
 
-    tasks: list["TaskModel"] = Relationship(back_populates="project")
+    # Relationships never lazy load: repositories either eager load them
+    # (``selectinload``) or query explicitly, so a stray attribute access
+    # raises instead of issuing a hidden per-row query.
+    tasks: list["TaskModel"] = Relationship(
+        back_populates="project",
+        passive_deletes=True,
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
+    )
 
 
 class TaskModel(Base, TimestampMixin, table=True):
+    __table_args__ = (Index("ix_taskmodel_open_deadline", "is_completed", "deadline"),)
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     title: str = Field(nullable=False)
     description: str | None = Field(nullable=True, default=None)
@@ -31,5 +41,49 @@ class TaskModel(Base, TimestampMixin, table=True):
     )
     is_completed: bool | None = Field(default=False)
     project_id: UUID | None = Field(default=None, foreign_key="projectmodel.id")
+    change_seq: int = Field(default=0, nullable=False, index=True)
+
+    project: ProjectModel | None = Relationship(
+        back_populates="tasks", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+
+
+class TaskTombstoneModel(Base, table=True):
+    task_id: UUID = Field(primary_key=True)
+    project_id: UUID | None = Field(default=None, nullable=True)
+    change_seq: int = Field(nullable=False, index=True)
+    deleted_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=AwareDateTime,
+        nullable=False,
+    )
+
+
+class ChangeSequenceModel(Base, table=True):
+    name: str = Field(primary_key=True)
+    value: int = Field(default=0, nullable=False)
 
-    project: ProjectModel | None = Relationship(back_populates="tasks")
+
+class OutboxMessageModel(Base, table=True):
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    event_type: str = Field(nullable=False)
+    payload: str = Field(nullable=False)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=AwareDateTime,
+        nullable=False,
+    )
+    available_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=AwareDateTime,
+        nullable=False,
+        index=True,
+    )
+    processed_at: datetime | None = Field(
+        default=None, sa_type=AwareDateTime, nullable=True, index=True
+    )
+    failed_at: datetime | None = Field(default=None, sa_type=AwareDateTime)
+    attempts: int = Field(default=0, nullable=False)
+    last_error: str | None = Field(default=None, nullable=True)
+    claimed_by: str | None = Field(default=None, nullable=True)
+    claimed_until: datetime | None = Field(default=None, sa_type=AwareDateTime)
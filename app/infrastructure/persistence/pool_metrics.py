@@ -0,0 +1,72 @@
+import sqlite3
+import time
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.metrics import get_metrics_registry
+
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+LIFETIME_BUCKETS = (1.0, 10.0, 60.0, 300.0, 1800.0, 3600.0, 14400.0)
+
+_CONNECTED_AT = "connected_at"
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection.
+
+    Pool events only fire once a connection has been handed out, so the
+    wait itself is timed around ``_do_get``. Metrics are keyed by the
+    pool's ``logging_name``, which survives ``Engine.dispose()``.
+    """
+
+    def _do_get(self):
+        registry = get_metrics_registry()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            registry.counter(f"{_prefix(self)}.checkout_failures").inc()
+            raise
+        finally:
+            registry.histogram(
+                f"{_prefix(self)}.checkout_seconds", CHECKOUT_BUCKETS
+            ).observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    metrics = get_metrics_registry()
+
+    @event.listens_for(engine, "connect")
+    def on_connect(_dbapi_conn, connection_record) -> None:
+        connection_record.info[_CONNECTED_AT] = time.monotonic()
+        if engine.pool.overflow() > 0:
+            metrics.counter(f"{_prefix(engine.pool)}.overflow_connections").inc()
+
+    @event.listens_for(engine, "close")
+    def on_close(_dbapi_conn, connection_record) -> None:
+        connected_at = connection_record.info.pop(_CONNECTED_AT, None)
+        if connected_at is not None:
+            metrics.histogram(
+                f"{_prefix(engine.pool)}.connection_lifetime_seconds",
+                LIFETIME_BUCKETS,
+            ).observe(time.monotonic() - connected_at)
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(_dbapi_conn, _connection_record, _connection_proxy) -> None:
+        metrics.gauge(f"{_prefix(engine.pool)}.in_use").inc()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(_dbapi_conn, _connection_record) -> None:
+        metrics.gauge(f"{_prefix(engine.pool)}.in_use").dec()
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context) -> None:
+        # SQLite gave up waiting for another connection's lock (busy timeout).
+        error = context.original_exception
+        if isinstance(error, sqlite3.OperationalError) and "locked" in str(error):
+            metrics.counter(f"{_prefix(engine.pool)}.locked_errors").inc()
+
+
+def _prefix(pool) -> str:
+    return f"db.pool.{pool.logging_name or 'default'}"
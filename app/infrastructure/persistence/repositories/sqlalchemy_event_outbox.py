@@ -0,0 +1,20 @@
+from sqlmodel import Session
+
+from app.domain.events import DomainEvent
+from app.domain.repositories.event_outbox import EventOutbox
+from app.infrastructure.events.serialization import serialize_event
+from app.infrastructure.persistence.models.models import OutboxMessageModel
+
+
+class SQLAlchemyEventOutbox(EventOutbox):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def add(self, events: list[DomainEvent]) -> None:
+        for event in events:
+            self._session.add(
+                OutboxMessageModel(
+                    event_type=type(event).__name__,
+                    payload=serialize_event(event),
+                )
+            )
@@ -1,13 +1,32 @@
+from collections.abc import Iterator
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import and_, case, func, insert
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
-from app.domain.repositories.project_repository import ProjectRepository
+from app.domain.repositories.project_repository import (
+    ProjectLookup,
+    ProjectRepository,
+    ProjectStats,
+    ProjectWithTasks,
+)
 from app.domain.entities.project import Project
-from app.infrastructure.persistence.models.models import ProjectModel
+from app.infrastructure.persistence.batching import chunked
+from app.infrastructure.persistence.change_sequence import next_change_seq
+from app.infrastructure.persistence.change_tracking import (
+    ChangeAction,
+    RowChange,
+    record_changes,
+)
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
 from app.infrastructure.persistence.repositories.exceptions import (
     SQLAlchemyRepositoryError,
 )
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    task_model_to_entity,
+)
 
 
 class SQLAlchemyProjectRepository(ProjectRepository):
@@ -15,7 +34,10 @@ class SQLAlchemyProjectRepository(ProjectRepository):
         self._session = session
 
     def get_by_id(self, project_id: UUID) -> Project | None:
-        model = self._session.get(ProjectModel, project_id)
+        try:
+            model = self._session.get(ProjectModel, project_id)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch project") from e
         return self._to_entity(model) if model else None
 
     def get_all(self) -> list[Project]:
@@ -25,6 +47,87 @@ class SQLAlchemyProjectRepository(ProjectRepository):
         except SQLAlchemyError as e:
             raise SQLAlchemyRepositoryError("Failed to fetch projects") from e
 
+    def iter_batches(self, batch_size: int) -> Iterator[list[Project]]:
+        statement = (
+            select(ProjectModel)
+            .order_by(ProjectModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            for models in self._session.exec(statement).partitions():
+                yield [self._to_entity(model) for model in models]
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch projects") from e
+
+    def get_by_id_with_tasks(self, project_id: UUID) -> ProjectWithTasks | None:
+        statement = (
+            select(ProjectModel)
+            .where(ProjectModel.id == project_id)
+            .options(selectinload(ProjectModel.tasks))
+        )
+        try:
+            model = self._session.exec(statement).first()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch project") from e
+        return self._to_entity_with_tasks(model) if model else None
+
+    def get_many(self, project_ids: list[UUID]) -> ProjectLookup:
+        ids = list(dict.fromkeys(project_ids))
+        found: dict[UUID, Project] = {}
+        try:
+            for statement in self._restrict_to_ids(select(ProjectModel), ids):
+                for model in self._session.exec(statement):
+                    found[model.id] = self._to_entity(model)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch projects") from e
+        return ProjectLookup(
+            projects=[found[i] for i in ids if i in found],
+            missing_ids=[i for i in ids if i not in found],
+        )
+
+    def get_all_with_tasks(
+        self, project_ids: list[UUID] | None = None
+    ) -> list[ProjectWithTasks]:
+        statement = select(ProjectModel).options(selectinload(ProjectModel.tasks))
+        try:
+            models = [
+                model
+                for s in self._restrict_to_ids(statement, project_ids)
+                for model in self._session.exec(s)
+            ]
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch projects") from e
+        return [self._to_entity_with_tasks(model) for model in models]
+
+    def get_stats(
+        self, now: datetime, project_ids: list[UUID] | None = None
+    ) -> list[ProjectStats]:
+        is_open = TaskModel.is_completed == False  # noqa: E712
+        statement = (
+            select(
+                ProjectModel.id,
+                func.count(TaskModel.id),
+                func.count(case((TaskModel.is_completed == True, 1))),  # noqa: E712
+                func.count(case((is_open, 1))),
+                func.count(case((and_(is_open, TaskModel.deadline < now), 1))),
+                func.min(
+                    case((and_(is_open, TaskModel.deadline >= now), TaskModel.deadline))
+                ),
+            )
+            .select_from(ProjectModel)
+            .outerjoin(TaskModel, TaskModel.project_id == ProjectModel.id)
+            .group_by(ProjectModel.id)
+        )
+        try:
+            rows = [
+                row
+                for s in self._restrict_to_ids(statement, project_ids)
+                for row in self._session.exec(s)
+            ]
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch project stats") from e
+        return [ProjectStats(*row) for row in rows]
+
     def save(self, project: Project) -> Project:
         try:
             model = self._to_model(project)
@@ -40,6 +143,35 @@ class SQLAlchemyProjectRepository(ProjectRepository):
         except SQLAlchemyError as e:
             raise SQLAlchemyRepositoryError("Failed to save project") from e
 
+    def save_many(self, projects: list[Project]) -> list[Project]:
+        if not projects:
+            return []
+        try:
+            rows = [self._to_row(project) for project in projects]
+            self._session.execute(insert(ProjectModel), rows)
+            record_changes(
+                self._session,
+                [
+                    RowChange(
+                        entity="project",
+                        action=ChangeAction.CREATED,
+                        row_id=row["id"],
+                        values=row,
+                    )
+                    for row in rows
+                ],
+            )
+            self._session.commit()
+            return projects
+        except IntegrityError as e:
+            self._session.rollback()
+            raise SQLAlchemyRepositoryError(
+                "Project already exists or constraint violated"
+            ) from e
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            raise SQLAlchemyRepositoryError("Failed to save projects") from e
+
     def update(self, project: Project) -> Project:
         try:
             model = self._session.get(ProjectModel, project.id)
@@ -50,16 +182,55 @@ class SQLAlchemyProjectRepository(ProjectRepository):
         except SQLAlchemyError as e:
             raise SQLAlchemyRepositoryError("Failed to update project") from e
 
+    def update_many(
+        self, projects: list[Project], commit: bool = True
+    ) -> list[Project]:
+        if not projects:
+            return []
+        try:
+            statements = self._restrict_to_ids(
+                select(ProjectModel), [project.id for project in projects]
+            )
+            models = {m.id: m for s in statements for m in self._session.exec(s)}
+            for project in projects:
+                self._update_model(models[project.id], project)
+            if commit:
+                self._session.commit()
+            else:
+                self._session.flush()
+            return projects
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            raise SQLAlchemyRepositoryError("Failed to update projects") from e
+
     def delete(self, project_id: UUID) -> None:
         try:
             model = self._session.get(ProjectModel, project_id)
             if model:
+                # Deleting the project unlinks its tasks; bump their change
+                # sequence so delta sync picks the unlink up.
+                tasks = self._session.exec(
+                    select(TaskModel).where(TaskModel.project_id == project_id)
+                ).all()
+                for task in tasks:
+                    task.project_id = None
+                    task.change_seq = next_change_seq(self._session)
                 self._session.delete(model)
                 self._session.commit()
         except SQLAlchemyError as e:
             self._session.rollback()
             raise SQLAlchemyRepositoryError("Failed to delete project") from e
 
+    @staticmethod
+    def _restrict_to_ids(statement, project_ids: list[UUID] | None) -> list:
+        """Split ``statement`` into one chunked ``IN`` query per batch of ids."""
+        if project_ids is None:
+            return [statement]
+        return [
+            statement.where(ProjectModel.id.in_(chunk))
+            for chunk in chunked(list(dict.fromkeys(project_ids)))
+        ]
+
     @staticmethod
     def _to_entity(model: ProjectModel) -> Project:
         return Project(
@@ -71,6 +242,24 @@ class SQLAlchemyProjectRepository(ProjectRepository):
             updated_at=model.updated_at,
         )
 
+    @classmethod
+    def _to_entity_with_tasks(cls, model: ProjectModel) -> ProjectWithTasks:
+        return ProjectWithTasks(
+            project=cls._to_entity(model),
+            tasks=[task_model_to_entity(task) for task in model.tasks],
+        )
+
+    @staticmethod
+    def _to_row(entity: Project) -> dict:
+        return {
+            "id": entity.id,
+            "title": entity.title,
+            "deadline": entity.deadline,
+            "is_completed": entity.is_completed,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
     @staticmethod
     def _to_model(entity: Project) -> ProjectModel:
         return ProjectModel(
@@ -1,27 +1,88 @@
+from collections.abc import Iterator
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlmodel import Session, select
-from app.domain.repositories.task_repository import TaskRepository
+from app.domain.repositories.task_repository import (
+    TaskChangeSet,
+    TaskLookup,
+    TaskRepository,
+)
 from app.domain.entities.task import Task
-from app.infrastructure.persistence.models.models import TaskModel
+from app.infrastructure.persistence.batching import chunked
+from app.infrastructure.persistence.change_tracking import (
+    ChangeAction,
+    RowChange,
+    record_changes,
+)
+from app.infrastructure.persistence.change_sequence import (
+    current_change_seq,
+    next_change_seq,
+)
+from app.infrastructure.persistence.models.models import TaskModel, TaskTombstoneModel
 from app.infrastructure.persistence.repositories.exceptions import (
     SQLAlchemyRepositoryError,
 )
 
 
+def task_model_to_entity(model: TaskModel) -> Task:
+    return Task(
+        id=model.id,
+        title=model.title,
+        description=model.description,
+        deadline=model.deadline,
+        is_completed=model.is_completed,
+        project_id=model.project_id,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
 class SQLAlchemyTaskRepository(TaskRepository):
 
     def __init__(self, session: Session) -> None:
         self._session = session
 
     def get_by_id(self, task_id: UUID) -> Task | None:
-        model = self._session.get(TaskModel, task_id)
-        return self._to_entity(model) if model else None
+        try:
+            model = self._session.get(TaskModel, task_id)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch task") from e
+        return task_model_to_entity(model) if model else None
+
+    def get_many(self, task_ids: list[UUID]) -> TaskLookup:
+        ids = list(dict.fromkeys(task_ids))
+        found: dict[UUID, Task] = {}
+        try:
+            for chunk in chunked(ids):
+                statement = select(TaskModel).where(TaskModel.id.in_(chunk))
+                for model in self._session.exec(statement):
+                    found[model.id] = task_model_to_entity(model)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch tasks") from e
+        return TaskLookup(
+            tasks=[found[i] for i in ids if i in found],
+            missing_ids=[i for i in ids if i not in found],
+        )
 
     def get_all(self) -> list[Task]:
         try:
             models = self._session.exec(select(TaskModel)).all()
-            return [self._to_entity(model) for model in models]
+            return [task_model_to_entity(model) for model in models]
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch tasks") from e
+
+    def iter_batches(self, batch_size: int) -> Iterator[list[Task]]:
+        # The rows come from one SELECT read through a server-side cursor,
+        # so the batches share a snapshot and only one is held at a time.
+        statement = (
+            select(TaskModel)
+            .order_by(TaskModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            for models in self._session.exec(statement).partitions():
+                yield [task_model_to_entity(model) for model in models]
         except SQLAlchemyError as e:
             raise SQLAlchemyRepositoryError("Failed to fetch tasks") from e
 
@@ -29,17 +90,50 @@ class SQLAlchemyTaskRepository(TaskRepository):
         try:
             statement = select(TaskModel).where(TaskModel.project_id == project_id)
             models = self._session.exec(statement).all()
-            return [self._to_entity(model) for model in models]
+            return [task_model_to_entity(model) for model in models]
         except SQLAlchemyError as e:
             raise SQLAlchemyRepositoryError("Failed to fetch tasks for project") from e
 
+    def get_changes_since(self, since: int, limit: int) -> TaskChangeSet:
+        try:
+            # Only sequence values up to the current counter are guaranteed
+            # to belong to committed rows, so the page never skips past a
+            # change that is still being written.
+            upper = current_change_seq(self._session)
+            tasks = self._session.exec(
+                select(TaskModel)
+                .where(TaskModel.change_seq > since, TaskModel.change_seq <= upper)
+                .order_by(TaskModel.change_seq)
+                .limit(limit + 1)
+            ).all()
+            tombstones = self._session.exec(
+                select(TaskTombstoneModel)
+                .where(
+                    TaskTombstoneModel.change_seq > since,
+                    TaskTombstoneModel.change_seq <= upper,
+                )
+                .order_by(TaskTombstoneModel.change_seq)
+                .limit(limit + 1)
+            ).all()
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to fetch task changes") from e
+        rows = sorted([*tasks, *tombstones], key=lambda row: row.change_seq)
+        page = rows[:limit]
+        return TaskChangeSet(
+            tasks=[task_model_to_entity(r) for r in page if isinstance(r, TaskModel)],
+            deleted_ids=[r.task_id for r in page if isinstance(r, TaskTombstoneModel)],
+            last_seq=page[-1].change_seq if page else since,
+            has_more=len(rows) > limit,
+        )
+
     def save(self, task: Task) -> Task:
         try:
             model = self._to_model(task)
+            model.change_seq = next_change_seq(self._session)
             self._session.add(model)
             self._session.commit()
             self._session.refresh(model)
-            return self._to_entity(model)
+            return task_model_to_entity(model)
         except IntegrityError as e:
             self._session.rollback()
             raise SQLAlchemyRepositoryError(
@@ -49,21 +143,89 @@ class SQLAlchemyTaskRepository(TaskRepository):
             self._session.rollback()
             raise SQLAlchemyRepositoryError("Failed to save task") from e
 
+    def save_many(self, tasks: list[Task]) -> list[Task]:
+        if not tasks:
+            return []
+        try:
+            last_seq = next_change_seq(self._session, count=len(tasks))
+            rows = [
+                {**self._to_row(task), "change_seq": seq}
+                for seq, task in enumerate(tasks, start=last_seq - len(tasks) + 1)
+            ]
+            # One executemany INSERT; it bypasses the unit of work, so the
+            # created rows are staged for change listeners explicitly.
+            self._session.execute(insert(TaskModel), rows)
+            record_changes(
+                self._session,
+                [
+                    RowChange(
+                        entity="task",
+                        action=ChangeAction.CREATED,
+                        row_id=row["id"],
+                        values=row,
+                    )
+                    for row in rows
+                ],
+            )
+            self._session.commit()
+            return tasks
+        except IntegrityError as e:
+            self._session.rollback()
+            raise SQLAlchemyRepositoryError(
+                "Task already exists or constraint violated"
+            ) from e
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            raise SQLAlchemyRepositoryError("Failed to save tasks") from e
+
     def update(self, task: Task) -> Task:
         try:
             model = self._session.get(TaskModel, task.id)
             self._update_model(model, task)
+            model.change_seq = next_change_seq(self._session)
             self._session.commit()
             self._session.refresh(model)
-            return self._to_entity(model)
+            return task_model_to_entity(model)
         except SQLAlchemyError as e:
             self._session.rollback()
             raise SQLAlchemyRepositoryError("Failed to update task") from e
 
+    def update_many(self, tasks: list[Task], commit: bool = True) -> list[Task]:
+        if not tasks:
+            return []
+        try:
+            models = {}
+            for chunk in chunked([task.id for task in tasks]):
+                statement = select(TaskModel).where(TaskModel.id.in_(chunk))
+                models.update(
+                    (model.id, model) for model in self._session.exec(statement)
+                )
+            last_seq = next_change_seq(self._session, count=len(tasks))
+            for seq, task in enumerate(tasks, start=last_seq - len(tasks) + 1):
+                self._update_model(models[task.id], task)
+                models[task.id].change_seq = seq
+            # Rows with the same changed columns are flushed as one
+            # executemany UPDATE.
+            if commit:
+                self._session.commit()
+            else:
+                self._session.flush()
+            return tasks
+        except SQLAlchemyError as e:
+            self._session.rollback()
+            raise SQLAlchemyRepositoryError("Failed to update tasks") from e
+
     def delete(self, task_id: UUID) -> None:
         try:
             model = self._session.get(TaskModel, task_id)
             if model:
+                self._session.add(
+                    TaskTombstoneModel(
+                        task_id=model.id,
+                        project_id=model.project_id,
+                        change_seq=next_change_seq(self._session),
+                    )
+                )
                 self._session.delete(model)
                 self._session.commit()
         except SQLAlchemyError as e:
@@ -71,17 +233,17 @@ class SQLAlchemyTaskRepository(TaskRepository):
             raise SQLAlchemyRepositoryError("Failed to delete task") from e
 
     @staticmethod
-    def _to_entity(model: TaskModel) -> Task:
-        return Task(
-            id=model.id,
-            title=model.title,
-            description=model.description,
-            deadline=model.deadline,
-            is_completed=model.is_completed,
-            project_id=model.project_id,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+    def _to_row(entity: Task) -> dict:
+        return {
+            "id": entity.id,
+            "title": entity.title,
+            "description": entity.description,
+            "deadline": entity.deadline,
+            "is_completed": entity.is_completed,
+            "project_id": entity.project_id,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
 
     @staticmethod
     def _to_model(entity: Task) -> TaskModel:
@@ -0,0 +1,23 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+
+@contextmanager
+def read_snapshot(engine: Engine) -> Iterator[Session]:
+    """Yield a session pinned to one read transaction.
+
+    pysqlite runs each SELECT in its own implicit transaction, so reads
+    through a plain session may see different states of the database.
+    Opening the transaction explicitly makes every read through this
+    session come from the same snapshot until it is closed.
+    """
+    with engine.connect() as connection:
+        connection.exec_driver_sql("BEGIN")
+        try:
+            with Session(bind=connection) as session:
+                yield session
+        finally:
+            connection.rollback()
@@ -0,0 +1,321 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from sqlalchemy import Connection, Engine, event
+from sqlmodel import Session, create_engine
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.executors import BoundedExecutor
+from app.infrastructure.persistence.change_tracking import (
+    RowChange,
+    defer_change_notifications,
+    notify_change_listeners,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+UnitOfWork = Callable[[Session], T]
+
+_STOP = object()
+
+
+class UnitOfWorkRunner(ABC):
+
+    @abstractmethod
+    async def run(self, work: UnitOfWork[T]) -> T:
+        pass
+
+
+class InlineRunner(UnitOfWorkRunner):
+    """Runs units of work on the request's own session, on the write
+    executor."""
+
+    def __init__(self, session: Session, executor: BoundedExecutor) -> None:
+        self._session = session
+        self._executor = executor
+
+    async def run(self, work: UnitOfWork[T]) -> T:
+        return await self._executor.run(work, self._session)
+
+
+class SharedTransaction(UnitOfWorkRunner):
+    """Runs units of work inside one transaction that is committed or
+    rolled back as a whole.
+
+    Units share a session whose commits only release savepoints; change
+    notifications are held back until ``commit``. The transaction keeps
+    SQLite's write lock until it ends, so its work runs on a dedicated
+    thread rather than queueing behind other writers on the write
+    executor.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._executor = BoundedExecutor("shared_transaction", 1)
+        self._connection: Connection | None = None
+        self._session: Session | None = None
+        self._changes: list[RowChange] = []
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            raise RuntimeError("Shared transaction has not begun")
+        return self._session
+
+    async def begin(self) -> None:
+        await self._executor.run(self._begin)
+
+    async def run(self, work: UnitOfWork[T]) -> T:
+        return await self._executor.run(work, self.session)
+
+    async def commit(self) -> None:
+        try:
+            await self._executor.run(self._end, True)
+        finally:
+            self._executor.shutdown()
+        if self._changes:
+            notify_change_listeners(self._changes)
+
+    async def rollback(self) -> None:
+        try:
+            await self._executor.run(self._end, False)
+        finally:
+            self._executor.shutdown()
+
+    def _begin(self) -> None:
+        self._connection = self._engine.connect()
+        # pysqlite only opens a transaction before DML, which would let the
+        # first RELEASE commit; open it explicitly so savepoints nest.
+        self._connection.exec_driver_sql("BEGIN IMMEDIATE")
+        self._session = Session(
+            bind=self._connection, join_transaction_mode="create_savepoint"
+        )
+        self._changes = defer_change_notifications(self._session)
+
+    def _end(self, commit: bool) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._session.close()
+            if commit:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        finally:
+            self._connection.close()
+            self._connection = self._session = None
+
+
+_shared_transaction: ContextVar[SharedTransaction | None] = ContextVar(
+    "shared_transaction", default=None
+)
+
+
+def current_shared_transaction() -> SharedTransaction | None:
+    return _shared_transaction.get()
+
+
+def set_shared_transaction(transaction: SharedTransaction | None):
+    return _shared_transaction.set(transaction)
+
+
+def reset_shared_transaction(reset_token) -> None:
+    _shared_transaction.reset(reset_token)
+
+
+class WriteCoordinator(UnitOfWorkRunner):
+    """Funnels every write through one connection owned by a writer thread.
+
+    Queued units of work are grouped into a single transaction (group
+    commit): each unit runs on its own session inside a savepoint, so a
+    failing unit is rolled back alone, and the batch is committed once.
+    Callers' futures are resolved only after that commit, with their own
+    result or error. A batch is closed once it reaches ``max_batch_size``
+    or ``max_delay`` seconds after its first unit was taken.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+    ) -> None:
+        self._engine = engine
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._pending: dict[Future, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def queue_wait(self) -> float:
+        """How long the oldest unit that has not started yet has been
+        waiting, in seconds."""
+        with self._lock:
+            oldest = next(iter(self._pending.values()), None)
+        return 0.0 if oldest is None else time.perf_counter() - oldest
+
+    def submit(self, work: UnitOfWork[T]) -> Future:
+        if self._thread is None:
+            raise RuntimeError("Write coordinator is not running")
+        future: Future = Future()
+        with self._lock:
+            self._pending[future] = time.perf_counter()
+        self._queue.put((work, future))
+        return future
+
+    def execute(self, work: UnitOfWork[T]) -> T:
+        return self.submit(work).result()
+
+    async def run(self, work: UnitOfWork[T]) -> T:
+        return await asyncio.wrap_future(self.submit(work))
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="sqlite-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        with self._engine.connect() as connection:
+            stopping = False
+            while not stopping:
+                batch, stopping = self._next_batch()
+                if batch:
+                    self._commit_batch(connection, batch)
+
+    def _next_batch(self) -> tuple[list[tuple[UnitOfWork, Future]], bool]:
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self._max_delay
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _commit_batch(
+        self, connection: Connection, batch: list[tuple[UnitOfWork, Future]]
+    ) -> None:
+        completed: list[tuple[Future, Any]] = []
+        changes = []
+        try:
+            with connection.begin():
+                for work, future in batch:
+                    self._dequeue(future)
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        result, unit_changes = self._run_unit(connection, work)
+                    except Exception as e:
+                        future.set_exception(e)
+                        continue
+                    completed.append((future, result))
+                    changes.extend(unit_changes)
+        except Exception as e:
+            # BEGIN or COMMIT failed (e.g. another connection held the lock):
+            # nothing in the batch was written, so fail every caller still
+            # waiting, including those whose unit never started.
+            logger.exception("Group commit of %s units failed", len(batch))
+            for _, future in batch:
+                self._dequeue(future)
+                if future.done():
+                    continue
+                if future.running() or future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            return
+        if changes:
+            notify_change_listeners(changes)
+        for future, result in completed:
+            future.set_result(result)
+
+    def _dequeue(self, future: Future) -> None:
+        with self._lock:
+            self._pending.pop(future, None)
+
+    @staticmethod
+    def _run_unit(connection: Connection, work: UnitOfWork[T]) -> tuple[T, list]:
+        savepoint = connection.begin_nested()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        changes = defer_change_notifications(session)
+        try:
+            result = work(session)
+            session.commit()
+        except Exception:
+            session.close()
+            savepoint.rollback()
+            raise
+        session.close()
+        savepoint.commit()
+        return result, changes
+
+
+def create_writer_engine(url: str, echo: bool = False) -> Engine:
+    engine = create_engine(url, connect_args={"check_same_thread": False}, echo=echo)
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; take it over and
+    # start every transaction with the write lock already held.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_conn, _connection_record) -> None:
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+_write_coordinator: WriteCoordinator | None = None
+
+
+def running_write_coordinator() -> WriteCoordinator | None:
+    """The application's write coordinator, if writes are going through it."""
+    if _write_coordinator is not None and _write_coordinator.running:
+        return _write_coordinator
+    return None
+
+
+def get_write_coordinator() -> WriteCoordinator:
+    global _write_coordinator
+    if _write_coordinator is None:
+        settings = get_settings()
+        _write_coordinator = WriteCoordinator(
+            create_writer_engine(settings.database_url, settings.DATABASE_ECHO),
+            max_batch_size=settings.WRITE_BATCH_MAX_SIZE,
+            max_delay=settings.WRITE_BATCH_MAX_DELAY,
+        )
+    return _write_coordinator
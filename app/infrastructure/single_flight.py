@@ -0,0 +1,100 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from app.infrastructure.executors import BoundedExecutor
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.persistence.cancellation import (
+    CancellationToken,
+    set_current_token,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    future: asyncio.Future
+    token: CancellationToken
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Lets concurrent callers with the same key share one in-flight call.
+
+    The first caller for a key starts the call; callers arriving before it
+    finishes await the same result (or exception). The shared call is
+    shielded, so one caller going away does not cancel it for the others.
+    It runs under its own ``CancellationToken`` rather than the first
+    caller's, cancelled only once every caller has gone away.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, _Flight] = {}
+        self._shared = get_metrics_registry().counter("single_flight.shared")
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self._shared.inc()
+        else:
+            flight = self._start(key, call)
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.future.done():
+                flight.token.cancel()
+
+    def _start(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> _Flight:
+        token = CancellationToken()
+        context = contextvars.copy_context()
+        context.run(set_current_token, token)
+        future = asyncio.get_running_loop().create_task(call(), context=context)
+        flight = _Flight(future, token)
+        self._in_flight[key] = flight
+        future.add_done_callback(lambda _: self._forget(key, flight))
+        return flight
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        if not flight.future.cancelled():
+            # Mark the error as retrieved even if every caller went away.
+            flight.future.exception()
+
+
+class CoalescingReader:
+    """Runs read calls on the read executor, coalescing identical
+    concurrent requests into one call."""
+
+    def __init__(
+        self,
+        executor: BoundedExecutor,
+        single_flight: SingleFlight | None,
+        request_key: Hashable,
+    ) -> None:
+        self._executor = executor
+        self._single_flight = single_flight
+        self._request_key = request_key
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        if self._single_flight is None:
+            return await self._executor.run(fn, *args, **kwargs)
+        key = (self._request_key, getattr(fn, "__qualname__", repr(fn)))
+        return await self._single_flight.do(
+            key, lambda: self._executor.run(fn, *args, **kwargs)
+        )
+
+
+_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -0,0 +1,179 @@
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.transfer.formats import TransferFormat
+from app.infrastructure.transfer.importer import TransferEntity
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+COLUMNS: dict[TransferEntity, tuple[str, ...]] = {
+    TransferEntity.PROJECTS: (
+        "id",
+        "title",
+        "deadline",
+        "is_completed",
+        "created_at",
+        "updated_at",
+    ),
+    TransferEntity.TASKS: (
+        "id",
+        "title",
+        "description",
+        "deadline",
+        "is_completed",
+        "project_id",
+        "created_at",
+        "updated_at",
+    ),
+}
+
+Record = dict[str, Any]
+
+
+class ColumnarFormat(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+def export_batches(
+    entity: TransferEntity, session: Session, batch_size: int
+) -> Iterator[list[Record]]:
+    """Yield every row of ``entity`` as records, ``batch_size`` at a time."""
+    if entity is TransferEntity.PROJECTS:
+        repository = SQLAlchemyProjectRepository(session)
+    else:
+        repository = SQLAlchemyTaskRepository(session)
+    columns = COLUMNS[entity]
+    for batch in repository.iter_batches(batch_size):
+        yield [{name: getattr(item, name) for name in columns} for item in batch]
+
+
+class RecordEncoder(ABC):
+    """Serializes batches of records into text, one batch at a time."""
+
+    def __init__(self, columns: tuple[str, ...]) -> None:
+        self._columns = columns
+
+    def start(self) -> str:
+        return ""
+
+    @abstractmethod
+    def encode(self, records: list[Record]) -> str:
+        pass
+
+
+class NDJSONEncoder(RecordEncoder):
+    def encode(self, records: list[Record]) -> str:
+        return "".join(
+            json.dumps(record, default=_json_default) + "\n" for record in records
+        )
+
+
+class CSVEncoder(RecordEncoder):
+    def start(self) -> str:
+        return self._write([self._columns])
+
+    def encode(self, records: list[Record]) -> str:
+        return self._write(
+            [_csv_value(record[name]) for name in self._columns] for record in records
+        )
+
+    @staticmethod
+    def _write(rows: Iterable[Iterable[Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue()
+
+
+def create_record_encoder(
+    transfer_format: TransferFormat, columns: tuple[str, ...]
+) -> RecordEncoder:
+    if transfer_format is TransferFormat.CSV:
+        return CSVEncoder(columns)
+    return NDJSONEncoder(columns)
+
+
+def write_columnar(
+    path: Path,
+    columnar_format: ColumnarFormat,
+    entity: TransferEntity,
+    batches: Iterable[list[Record]],
+) -> int:
+    """Write batches to a Parquet or Arrow IPC file, one row group or
+    record batch per batch. Returns the number of rows written."""
+    if pyarrow is None:
+        raise RuntimeError(f"Writing {columnar_format.value} files requires pyarrow")
+    schema = _arrow_schema(entity)
+    if columnar_format is ColumnarFormat.PARQUET:
+        writer = pyarrow.parquet.ParquetWriter(path, schema)
+    else:
+        writer = pyarrow.ipc.new_file(path, schema)
+    rows = 0
+    with writer:
+        for records in batches:
+            batch = pyarrow.RecordBatch.from_pylist(
+                [_arrow_record(record) for record in records], schema=schema
+            )
+            if columnar_format is ColumnarFormat.PARQUET:
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def _arrow_schema(entity: TransferEntity):
+    types = {
+        "id": pyarrow.string(),
+        "title": pyarrow.string(),
+        "description": pyarrow.string(),
+        "deadline": pyarrow.timestamp("us", tz="UTC"),
+        "is_completed": pyarrow.bool_(),
+        "project_id": pyarrow.string(),
+        "created_at": pyarrow.timestamp("us", tz="UTC"),
+        "updated_at": pyarrow.timestamp("us", tz="UTC"),
+    }
+    return pyarrow.schema([(name, types[name]) for name in COLUMNS[entity]])
+
+
+def _arrow_record(record: Record) -> Record:
+    return {k: str(v) if isinstance(v, UUID) else v for k, v in record.items()}
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
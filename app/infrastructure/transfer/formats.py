@@ -0,0 +1,134 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class TransferFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    TransferFormat.NDJSON: "application/x-ndjson",
+    TransferFormat.CSV: "text/csv",
+}
+
+
+def format_for_media_type(media_type: str | None) -> TransferFormat | None:
+    media_type = (media_type or "").split(";")[0].strip().lower()
+    for transfer_format, known in MEDIA_TYPES.items():
+        if media_type == known:
+            return transfer_format
+    return None
+
+
+@dataclass
+class ParsedRow:
+    line: int
+    values: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class RowParser(ABC):
+    """Incrementally splits text into rows.
+
+    ``feed`` accepts text in arbitrary pieces and returns the rows that are
+    complete so far; only the unfinished tail is buffered, so memory stays
+    proportional to the longest row rather than to the upload.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._line = 0
+
+    def feed(self, text: str) -> list[ParsedRow]:
+        *lines, self._buffer = (self._buffer + text).split("\n")
+        return self._parse_lines(lines)
+
+    def close(self) -> list[ParsedRow]:
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = ""
+        return self._parse_lines(lines) + self._finish()
+
+    def _parse_lines(self, lines: list[str]) -> list[ParsedRow]:
+        rows = []
+        for line in lines:
+            self._line += 1
+            row = self._parse_line(self._line, line.rstrip("\r"))
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    @abstractmethod
+    def _parse_line(self, number: int, line: str) -> ParsedRow | None:
+        pass
+
+    def _finish(self) -> list[ParsedRow]:
+        return []
+
+
+class NDJSONRowParser(RowParser):
+    def _parse_line(self, number: int, line: str) -> ParsedRow | None:
+        if not line.strip():
+            return None
+        try:
+            values = json.loads(line)
+        except ValueError as e:
+            return ParsedRow(number, error=f"Invalid JSON: {e}")
+        if not isinstance(values, dict):
+            return ParsedRow(number, error="Expected a JSON object")
+        return ParsedRow(number, values)
+
+
+class CSVRowParser(RowParser):
+    """Parses CSV with a header row. Quoted fields may span lines; empty
+    fields are read as missing values."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._header: list[str] | None = None
+        self._record: str | None = None
+        self._record_line = 0
+
+    def _parse_line(self, number: int, line: str) -> ParsedRow | None:
+        if self._record is None:
+            self._record, self._record_line = line, number
+        else:
+            self._record += "\n" + line
+        # An odd number of quotes means a quoted field is still open.
+        if self._record.count('"') % 2:
+            return None
+        record, self._record = self._record, None
+        if not record.strip():
+            return None
+        try:
+            fields = next(csv.reader([record], strict=True))
+        except csv.Error as e:
+            return ParsedRow(self._record_line, error=f"Invalid CSV: {e}")
+        if self._header is None:
+            self._header = [name.strip() for name in fields]
+            return None
+        if len(fields) != len(self._header):
+            return ParsedRow(
+                self._record_line,
+                error=f"Expected {len(self._header)} fields, got {len(fields)}",
+            )
+        return ParsedRow(
+            self._record_line,
+            {name: value or None for name, value in zip(self._header, fields)},
+        )
+
+    def _finish(self) -> list[ParsedRow]:
+        if self._record is None:
+            return []
+        self._record = None
+        return [ParsedRow(self._record_line, error="Unterminated quoted field")]
+
+
+def create_row_parser(transfer_format: TransferFormat) -> RowParser:
+    if transfer_format is TransferFormat.CSV:
+        return CSVRowParser()
+    return NDJSONRowParser()
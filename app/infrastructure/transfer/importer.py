@@ -0,0 +1,173 @@
+import codecs
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from sqlmodel import Session
+
+from app.application.dto.import_dto import (
+    ImportChunkResultDTO,
+    ImportProjectRowDTO,
+    ImportRowErrorDTO,
+    ImportTaskRowDTO,
+)
+from app.application.use_cases.project_use_cases.import_projects import (
+    ImportProjectsUseCase,
+)
+from app.application.use_cases.task_use_cases.import_tasks import ImportTasksUseCase
+from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.transfer.formats import (
+    ParsedRow,
+    TransferFormat,
+    create_row_parser,
+)
+
+
+class TransferEntity(str, Enum):
+    PROJECTS = "projects"
+    TASKS = "tasks"
+
+
+class _ImportRow(BaseModel):
+    id: UUID | None = None
+    title: str = Field(min_length=1)
+    deadline: datetime
+    is_completed: bool = False
+
+    @field_validator("deadline")
+    @classmethod
+    def assume_utc(cls, value: datetime) -> datetime:
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class ProjectImportRow(_ImportRow):
+    def to_dto(self, line: int) -> ImportProjectRowDTO:
+        return ImportProjectRowDTO(line=line, **self.model_dump())
+
+
+class TaskImportRow(_ImportRow):
+    description: str | None = None
+    project_id: UUID | None = None
+
+    def to_dto(self, line: int) -> ImportTaskRowDTO:
+        return ImportTaskRowDTO(line=line, **self.model_dump())
+
+
+ROW_SCHEMAS: dict[TransferEntity, type[_ImportRow]] = {
+    TransferEntity.PROJECTS: ProjectImportRow,
+    TransferEntity.TASKS: TaskImportRow,
+}
+
+
+@dataclass
+class ImportChunk:
+    rows: list[Any] = field(default_factory=list)
+    errors: list[ImportRowErrorDTO] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.rows) + len(self.errors)
+
+
+class StreamingImport:
+    """Cuts an upload, fed in arbitrary pieces, into chunks of validated
+    rows and keeps the running totals.
+
+    Rows that fail to parse or validate never reach the use case; they are
+    carried with their chunk and reported alongside the domain errors.
+    """
+
+    def __init__(
+        self, entity: TransferEntity, transfer_format: TransferFormat, chunk_size: int
+    ) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        self._parser = create_row_parser(transfer_format)
+        self._schema = ROW_SCHEMAS[entity]
+        self._chunk_size = chunk_size
+        self._chunk = ImportChunk()
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+
+    def feed(self, data: bytes) -> list[ImportChunk]:
+        return self._collect(self._parser.feed(self._decoder.decode(data)))
+
+    def close(self) -> list[ImportChunk]:
+        parsed = self._parser.feed(self._decoder.decode(b"", final=True))
+        chunks = self._collect(parsed + self._parser.close())
+        if self._chunk.size:
+            chunks.append(self._chunk)
+            self._chunk = ImportChunk()
+        return chunks
+
+    def record(
+        self, chunk: ImportChunk, result: ImportChunkResultDTO
+    ) -> list[dict[str, Any]]:
+        """Add a chunk's outcome to the totals and return its events."""
+        errors = sorted(chunk.errors + result.errors, key=lambda e: e.line)
+        self.rows += chunk.size
+        self.imported += result.imported
+        self.failed += len(errors)
+        events = [
+            {"type": "error", "line": error.line, "error": error.error}
+            for error in errors
+        ]
+        events.append({"type": "progress", **self._totals()})
+        return events
+
+    def record_failure(self, chunk: ImportChunk, reason: str) -> list[dict[str, Any]]:
+        """Report every row of a chunk whose write failed as a whole."""
+        failed = [ImportRowErrorDTO(row.line, reason) for row in chunk.rows]
+        return self.record(chunk, ImportChunkResultDTO(imported=0, errors=failed))
+
+    def summary(self) -> dict[str, Any]:
+        return {"type": "summary", **self._totals()}
+
+    def _totals(self) -> dict[str, int]:
+        return {"rows": self.rows, "imported": self.imported, "failed": self.failed}
+
+    def _collect(self, parsed: list[ParsedRow]) -> list[ImportChunk]:
+        chunks = []
+        for row in parsed:
+            self._add(row)
+            if self._chunk.size >= self._chunk_size:
+                chunks.append(self._chunk)
+                self._chunk = ImportChunk()
+        return chunks
+
+    def _add(self, row: ParsedRow) -> None:
+        if row.error is not None:
+            self._chunk.errors.append(ImportRowErrorDTO(row.line, row.error))
+            return
+        values = {k: v for k, v in row.values.items() if v is not None}
+        try:
+            self._chunk.rows.append(self._schema(**values).to_dto(row.line))
+        except ValidationError as e:
+            self._chunk.errors.append(ImportRowErrorDTO(row.line, _describe(e)))
+
+
+def import_chunk(
+    entity: TransferEntity, session: Session, chunk: ImportChunk
+) -> ImportChunkResultDTO:
+    if entity is TransferEntity.PROJECTS:
+        use_case = ImportProjectsUseCase(SQLAlchemyProjectRepository(session))
+    else:
+        use_case = ImportTasksUseCase(
+            SQLAlchemyTaskRepository(session), SQLAlchemyProjectRepository(session)
+        )
+    return use_case.execute(chunk.rows)
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}"
+        for e in error.errors()
+    )
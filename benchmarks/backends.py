@@ -0,0 +1,217 @@
+import shutil
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import Engine, event, func
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.domain.repositories.project_repository import ProjectRepository
+from app.domain.repositories.task_repository import TaskRepository
+from app.infrastructure.persistence.change_sequence import current_change_seq
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.persistence.seeding import SeedConfig, seed_database
+from benchmarks.in_memory import (
+    InMemoryProjectRepository,
+    InMemoryStore,
+    InMemoryTaskRepository,
+)
+
+SAMPLE_SIZE = 2000
+
+
+@dataclass
+class Repositories:
+    tasks: TaskRepository
+    projects: ProjectRepository
+
+
+@dataclass
+class Dataset:
+    """A seeded database file plus ids the scenarios pick their targets
+    from."""
+
+    path: Path
+    scale: int
+    now: datetime
+    task_ids: list[UUID]
+    unassigned_task_ids: list[UUID]
+    project_ids: list[UUID]
+    completable_project_ids: list[UUID]
+    hot_project_id: UUID
+    typical_project_id: UUID
+    typical_project_deadline: datetime
+    # Another median-size project, so deadline changes do not interfere
+    # with the scenarios that rely on the typical project's deadline.
+    cascade_project_id: UUID
+
+
+def create_sqlite_engine(path: Path, busy_timeout: float = 5.0) -> Engine:
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": busy_timeout},
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_conn, _connection_record) -> None:
+        # The same pragmas as the application's primary engine.
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+    return engine
+
+
+def prepare_dataset(scale: int, data_dir: Path, seed: int) -> Dataset:
+    """Seed (or reuse) a database of ``scale`` tasks and sample it."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    path = data_dir / f"seed-{scale}-{seed}.db"
+    if not path.exists():
+        partial = path.with_suffix(".partial")
+        partial.unlink(missing_ok=True)
+        engine = create_sqlite_engine(partial)
+        SQLModel.metadata.create_all(engine)
+        seed_database(engine, SeedConfig(tasks=scale, seed=seed))
+        engine.dispose()
+        partial.rename(path)
+
+    engine = create_sqlite_engine(path)
+    now = datetime.now(timezone.utc)
+    try:
+        with Session(engine) as session:
+            return _sample(session, path, scale, now)
+    finally:
+        engine.dispose()
+
+
+def _sample(session: Session, path: Path, scale: int, now: datetime) -> Dataset:
+    sizes = session.exec(
+        select(TaskModel.project_id, func.count(TaskModel.id))
+        .where(TaskModel.project_id.is_not(None))
+        .group_by(TaskModel.project_id)
+        .order_by(func.count(TaskModel.id))
+    ).all()
+    future = set(
+        session.exec(
+            select(ProjectModel.id).where(
+                ProjectModel.deadline > now + timedelta(days=30)
+            )
+        ).all()
+    )
+    sized = [
+        (project_id, size) for project_id, size in sizes if project_id in future
+    ] or list(sizes)
+    typical_id = sized[len(sized) // 2][0]
+    typical_deadline = session.get(ProjectModel, typical_id).deadline
+    random_rows = lambda statement: session.exec(
+        statement.order_by(func.random()).limit(SAMPLE_SIZE)
+    ).all()
+    open_counts = (
+        select(TaskModel.project_id)
+        .where(TaskModel.project_id.is_not(None))
+        .group_by(TaskModel.project_id)
+        .having(func.sum(TaskModel.is_completed == False) == 0)  # noqa: E712
+    )
+    return Dataset(
+        path=path,
+        scale=scale,
+        now=now,
+        task_ids=random_rows(select(TaskModel.id)),
+        unassigned_task_ids=random_rows(
+            select(TaskModel.id).where(
+                TaskModel.project_id.is_(None),
+                TaskModel.deadline <= typical_deadline,
+            )
+        ),
+        project_ids=random_rows(select(ProjectModel.id)),
+        completable_project_ids=random_rows(open_counts),
+        hot_project_id=sized[-1][0],
+        typical_project_id=typical_id,
+        typical_project_deadline=typical_deadline,
+        cascade_project_id=sized[len(sized) // 2 - 1][0],
+    )
+
+
+class Backend(ABC):
+    name: str
+
+    @abstractmethod
+    @contextmanager
+    def repositories(self) -> Iterator[Repositories]:
+        """Repositories for one unit of work."""
+
+    @abstractmethod
+    def current_change_seq(self) -> int:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class InMemoryBackend(Backend):
+    name = "memory"
+
+    def __init__(self, dataset: Dataset, _work_dir: Path) -> None:
+        self._store = InMemoryStore()
+        engine = create_sqlite_engine(dataset.path)
+        with Session(engine) as session:
+            for batch in SQLAlchemyProjectRepository(session).iter_batches(10_000):
+                for project in batch:
+                    self._store.projects[project.id] = project
+            for batch in SQLAlchemyTaskRepository(session).iter_batches(10_000):
+                for task in batch:
+                    self._store.put_task(task)
+        engine.dispose()
+        self._repositories = Repositories(
+            tasks=InMemoryTaskRepository(self._store),
+            projects=InMemoryProjectRepository(self._store),
+        )
+
+    @contextmanager
+    def repositories(self) -> Iterator[Repositories]:
+        yield self._repositories
+
+    def current_change_seq(self) -> int:
+        return self._store.last_seq
+
+
+class SQLiteBackend(Backend):
+    """Works on a copy of the dataset, one session per unit of work."""
+
+    name = "sqlite"
+
+    def __init__(self, dataset: Dataset, work_dir: Path) -> None:
+        self._path = work_dir / f"work-{dataset.scale}.db"
+        shutil.copyfile(dataset.path, self._path)
+        self._engine = create_sqlite_engine(self._path)
+
+    @contextmanager
+    def repositories(self) -> Iterator[Repositories]:
+        with Session(self._engine) as session:
+            yield Repositories(
+                tasks=SQLAlchemyTaskRepository(session),
+                projects=SQLAlchemyProjectRepository(session),
+            )
+
+    def current_change_seq(self) -> int:
+        with Session(self._engine) as session:
+            return current_change_seq(session)
+
+    def close(self) -> None:
+        self._engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self._path}{suffix}").unlink(missing_ok=True)
+
+
+BACKENDS = {"memory": InMemoryBackend, "sqlite": SQLiteBackend}
@@ -0,0 +1,322 @@
+"""Write-contention stress test for concurrent task completions.
+
+    python -m benchmarks.contention --threads 16 --projects 4 --tasks 250
+    python -m benchmarks.contention --mode coordinator --output result.json
+
+Worker threads complete every task of a few hot projects through
+``CompleteTaskUseCase``, in random order so that the threads keep
+colliding on the same project rows. ``--mode session`` runs each
+completion on its own session, as the inline runner does; ``--mode
+coordinator`` funnels them through the ``WriteCoordinator``. A completion
+that fails with "database is locked" is retried with exponential backoff.
+Afterwards every project's ``is_completed`` is checked against its tasks:
+once all of them are done, the project must be completed too. The exit
+status is 1 when a completion failed or a project ended up inconsistent.
+"""
+
+import argparse
+import json
+import queue
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from sqlalchemy import Engine, func, insert
+from sqlmodel import Session, SQLModel, select
+
+from app.application.use_cases.task_use_cases.complete_task import (
+    CompleteTaskUseCase,
+)
+from app.domain.services.project_completion_service import ProjectCompletionService
+from app.infrastructure.persistence.change_sequence import next_change_seq
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.persistence.write_coordinator import (
+    WriteCoordinator,
+    create_writer_engine,
+)
+from benchmarks.backends import create_sqlite_engine
+from benchmarks.harness import percentile
+
+MODES = ("session", "coordinator")
+
+
+@dataclass
+class ContentionResult:
+    mode: str
+    threads: int
+    projects: int
+    tasks: int
+    completed: int
+    failed: int
+    seconds: float
+    completions_per_sec: float
+    locked_errors: int
+    locked_rate: float
+    retries: int
+    p50_ms: float
+    p99_ms: float
+    inconsistent_projects: int
+
+
+def create_hot_projects(
+    engine: Engine, projects: int, tasks_per_project: int
+) -> list[UUID]:
+    """Insert ``projects`` open projects with open tasks; return task ids."""
+    now = datetime.now(timezone.utc)
+    deadline = now + timedelta(days=30)
+    project_rows = [
+        {
+            "id": uuid4(),
+            "title": f"Hot project {i}",
+            "deadline": deadline,
+            "is_completed": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(projects)
+    ]
+    total = projects * tasks_per_project
+    with Session(engine) as session:
+        seq = next_change_seq(session, count=total) - total
+        session.commit()
+    task_rows = []
+    for project in project_rows:
+        for i in range(tasks_per_project):
+            seq += 1
+            task_rows.append(
+                {
+                    "id": uuid4(),
+                    "title": f"Task {i}",
+                    "description": None,
+                    "deadline": deadline,
+                    "is_completed": False,
+                    "project_id": project["id"],
+                    "change_seq": seq,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+    with engine.begin() as connection:
+        connection.execute(insert(ProjectModel.__table__), project_rows)
+        connection.execute(insert(TaskModel.__table__), task_rows)
+    return [row["id"] for row in task_rows]
+
+
+def inconsistent_projects(engine: Engine) -> int:
+    """Count projects whose flag disagrees with "has tasks, all completed"."""
+    with Session(engine) as session:
+        rows = session.exec(
+            select(
+                ProjectModel.is_completed,
+                func.count(TaskModel.id),
+                func.sum(TaskModel.is_completed == False),  # noqa: E712
+            )
+            .join(TaskModel, TaskModel.project_id == ProjectModel.id, isouter=True)
+            .group_by(ProjectModel.id)
+        ).all()
+    return sum(
+        1
+        for is_completed, tasks, open_tasks in rows
+        if bool(is_completed) != (tasks > 0 and not open_tasks)
+    )
+
+
+def is_lock_error(error: BaseException | None) -> bool:
+    while error is not None:
+        if isinstance(error, sqlite3.OperationalError) and "locked" in str(error):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _complete(session: Session, task_id: UUID) -> None:
+    CompleteTaskUseCase(
+        SQLAlchemyTaskRepository(session),
+        SQLAlchemyProjectRepository(session),
+        ProjectCompletionService(auto_complete_enabled=True),
+    ).execute(task_id)
+
+
+def run_contention(
+    path: Path,
+    mode: str = "session",
+    threads: int = 16,
+    projects: int = 4,
+    tasks_per_project: int = 250,
+    busy_timeout: float = 5.0,
+    max_retries: int = 10,
+    backoff: float = 0.001,
+    seed: int = 42,
+) -> ContentionResult:
+    """Create the hot projects in a fresh database at ``path`` and complete
+    all of their tasks from ``threads`` threads."""
+    engine = create_sqlite_engine(path, busy_timeout)
+    SQLModel.metadata.create_all(engine)
+    task_ids = create_hot_projects(engine, projects, tasks_per_project)
+    random.Random(seed).shuffle(task_ids)
+
+    coordinator = None
+    if mode == "coordinator":
+        coordinator = WriteCoordinator(create_writer_engine(f"sqlite:///{path}"))
+        coordinator.start()
+
+        def complete(task_id: UUID) -> None:
+            coordinator.execute(lambda session: _complete(session, task_id))
+
+    else:
+
+        def complete(task_id: UUID) -> None:
+            with Session(engine) as session:
+                _complete(session, task_id)
+
+    pending: queue.SimpleQueue[UUID] = queue.SimpleQueue()
+    for task_id in task_ids:
+        pending.put(task_id)
+    lock = threading.Lock()
+    latencies: list[float] = []
+    counts = {"completed": 0, "failed": 0, "locked": 0, "retries": 0}
+
+    def worker(rng: random.Random) -> None:
+        while True:
+            try:
+                task_id = pending.get_nowait()
+            except queue.Empty:
+                return
+            outcome, locked, retries, latency = _attempt(
+                complete, task_id, rng, max_retries, backoff
+            )
+            with lock:
+                counts[outcome] += 1
+                counts["locked"] += locked
+                counts["retries"] += retries
+                latencies.append(latency)
+
+    workers = [
+        threading.Thread(target=worker, args=(random.Random(seed + i),))
+        for i in range(threads)
+    ]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    seconds = time.perf_counter() - started
+    if coordinator is not None:
+        coordinator.stop()
+
+    latencies.sort()
+    attempts = len(task_ids) + counts["retries"]
+    result = ContentionResult(
+        mode=mode,
+        threads=threads,
+        projects=projects,
+        tasks=len(task_ids),
+        completed=counts["completed"],
+        failed=counts["failed"],
+        seconds=seconds,
+        completions_per_sec=counts["completed"] / seconds,
+        locked_errors=counts["locked"],
+        locked_rate=counts["locked"] / attempts,
+        retries=counts["retries"],
+        p50_ms=percentile(latencies, 0.5) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        inconsistent_projects=inconsistent_projects(engine),
+    )
+    engine.dispose()
+    return result
+
+
+def _attempt(
+    complete: Callable[[UUID], None],
+    task_id: UUID,
+    rng: random.Random,
+    max_retries: int,
+    backoff: float,
+) -> tuple[str, int, int, float]:
+    """Complete one task, retrying lock errors; return the outcome, lock
+    errors, retries and latency including the retries."""
+    started = time.perf_counter()
+    locked = 0
+    for attempt in range(max_retries + 1):
+        try:
+            complete(task_id)
+            return "completed", locked, attempt, time.perf_counter() - started
+        except Exception as e:
+            if not is_lock_error(e):
+                return "failed", locked, attempt, time.perf_counter() - started
+            locked += 1
+            if attempt < max_retries:
+                time.sleep(backoff * 2**attempt * rng.uniform(0.5, 1.5))
+    return "failed", locked, max_retries, time.perf_counter() - started
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.contention")
+    parser.add_argument("--mode", choices=MODES, nargs="+", default=list(MODES))
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--projects", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=250, help="tasks per project")
+    parser.add_argument(
+        "--busy-timeout",
+        type=float,
+        default=5.0,
+        help="seconds SQLite waits for a lock before failing",
+    )
+    parser.add_argument("--max-retries", type=int, default=10)
+    parser.add_argument("--backoff", type=float, default=0.001, help="seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="save the results as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for mode in args.mode:
+            results.append(
+                run_contention(
+                    Path(work_dir) / f"{mode}.db",
+                    mode=mode,
+                    threads=args.threads,
+                    projects=args.projects,
+                    tasks_per_project=args.tasks,
+                    busy_timeout=args.busy_timeout,
+                    max_retries=args.max_retries,
+                    backoff=args.backoff,
+                    seed=args.seed,
+                )
+            )
+    print(
+        f"{'mode':<12} {'done/s':>8} {'failed':>6} {'locked':>7} {'lock %':>7} "
+        f"{'retries':>7} {'p50 ms':>8} {'p99 ms':>8} {'inconsistent':>12}"
+    )
+    for r in results:
+        print(
+            f"{r.mode:<12} {r.completions_per_sec:>8.1f} {r.failed:>6} "
+            f"{r.locked_errors:>7} {r.locked_rate * 100:>7.2f} {r.retries:>7} "
+            f"{r.p50_ms:>8.2f} {r.p99_ms:>8.2f} {r.inconsistent_projects:>12}"
+        )
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(r) for r in results], indent=2) + "\n"
+        )
+    return 1 if any(r.failed or r.inconsistent_projects for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.domain.exceptions import DomainError
+from app.infrastructure.persistence.repositories.exceptions import (
+    SQLAlchemyRepositoryError,
+)
+
+EXPECTED_ERRORS = (DomainError, SQLAlchemyRepositoryError)
+
+
+@dataclass
+class Measurement:
+    scenario: str
+    backend: str
+    scale: int
+    ops: int
+    errors: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return self.scenario, self.backend, self.scale
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(fraction * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def measure(
+    op: Callable[[], object],
+    max_ops: int,
+    max_seconds: float,
+    warmup: int = 2,
+    min_ops: int = 3,
+) -> tuple[list[float], int, float]:
+    """Time ``op`` until ``max_ops`` calls or ``max_seconds`` have passed.
+
+    Returns per-call latencies in seconds, the number of calls that raised
+    an expected domain or repository error, and the peak traced memory of
+    a single call in KiB. Memory is traced in a separate pass because
+    tracemalloc slows every allocation down.
+    """
+    for _ in range(warmup):
+        _call(op)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _call(op)
+        peak_kib = max(tracemalloc.get_traced_memory()[1] - baseline, 0) / 1024
+    finally:
+        tracemalloc.stop()
+
+    latencies: list[float] = []
+    errors = 0
+    started = time.perf_counter()
+    while len(latencies) < max_ops:
+        if len(latencies) >= min_ops and time.perf_counter() - started > max_seconds:
+            break
+        begin = time.perf_counter()
+        errors += not _call(op)
+        latencies.append(time.perf_counter() - begin)
+    return latencies, errors, peak_kib
+
+
+def _call(op: Callable[[], object]) -> bool:
+    try:
+        op()
+    except EXPECTED_ERRORS:
+        return False
+    return True
@@ -0,0 +1,228 @@
+"""Dictionary-backed repositories.
+
+They implement the same contracts as the SQLAlchemy repositories and hand
+out copies of the stored entities, so use cases behave identically; the
+difference in timings is the cost of the database layer.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterator
+from copy import copy
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.entities.project import Project
+from app.domain.entities.task import Task
+from app.domain.repositories.project_repository import (
+    ProjectLookup,
+    ProjectRepository,
+    ProjectStats,
+    ProjectWithTasks,
+)
+from app.domain.repositories.task_repository import (
+    TaskChangeSet,
+    TaskLookup,
+    TaskRepository,
+)
+
+
+def _detached(project: Project) -> Project:
+    # A shallow copy would share the pending domain events list.
+    clone = copy(project)
+    clone._domain_events = []
+    return clone
+
+
+@dataclass
+class InMemoryStore:
+    projects: dict[UUID, Project] = field(default_factory=dict)
+    tasks: dict[UUID, Task] = field(default_factory=dict)
+    tasks_by_project: dict[UUID, set[UUID]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    change_seqs: dict[UUID, int] = field(default_factory=dict)
+    tombstones: dict[UUID, int] = field(default_factory=dict)
+    last_seq: int = 0
+
+    def put_task(self, task: Task) -> None:
+        previous = self.tasks.get(task.id)
+        if previous is not None and previous.project_id is not None:
+            self.tasks_by_project[previous.project_id].discard(task.id)
+        self.tasks[task.id] = copy(task)
+        if task.project_id is not None:
+            self.tasks_by_project[task.project_id].add(task.id)
+        self.last_seq += 1
+        self.change_seqs[task.id] = self.last_seq
+
+    def remove_task(self, task_id: UUID) -> None:
+        task = self.tasks.pop(task_id, None)
+        if task is None:
+            return
+        if task.project_id is not None:
+            self.tasks_by_project[task.project_id].discard(task_id)
+        self.change_seqs.pop(task_id)
+        self.last_seq += 1
+        self.tombstones[task_id] = self.last_seq
+
+    def project_tasks(self, project_id: UUID) -> list[Task]:
+        return [copy(self.tasks[i]) for i in self.tasks_by_project.get(project_id, ())]
+
+
+class InMemoryTaskRepository(TaskRepository):
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+
+    def get_by_id(self, task_id: UUID) -> Task | None:
+        task = self._store.tasks.get(task_id)
+        return copy(task) if task else None
+
+    def get_many(self, task_ids: list[UUID]) -> TaskLookup:
+        ids = list(dict.fromkeys(task_ids))
+        return TaskLookup(
+            tasks=[copy(self._store.tasks[i]) for i in ids if i in self._store.tasks],
+            missing_ids=[i for i in ids if i not in self._store.tasks],
+        )
+
+    def get_all(self) -> list[Task]:
+        return [copy(task) for task in self._store.tasks.values()]
+
+    def iter_batches(self, batch_size: int) -> Iterator[list[Task]]:
+        tasks = sorted(self._store.tasks)
+        for start in range(0, len(tasks), batch_size):
+            yield [
+                copy(self._store.tasks[i]) for i in tasks[start : start + batch_size]
+            ]
+
+    def get_by_project_id(self, project_id: UUID) -> list[Task]:
+        return self._store.project_tasks(project_id)
+
+    def get_changes_since(self, since: int, limit: int) -> TaskChangeSet:
+        changes = sorted(
+            [
+                (seq, task_id, False)
+                for task_id, seq in self._store.change_seqs.items()
+                if seq > since
+            ]
+            + [
+                (seq, task_id, True)
+                for task_id, seq in self._store.tombstones.items()
+                if seq > since
+            ]
+        )
+        page = changes[:limit]
+        return TaskChangeSet(
+            tasks=[copy(self._store.tasks[i]) for _, i, deleted in page if not deleted],
+            deleted_ids=[i for _, i, deleted in page if deleted],
+            last_seq=page[-1][0] if page else since,
+            has_more=len(changes) > limit,
+        )
+
+    def save(self, task: Task) -> Task:
+        self._store.put_task(task)
+        return copy(task)
+
+    def save_many(self, tasks: list[Task]) -> list[Task]:
+        return [self.save(task) for task in tasks]
+
+    def update(self, task: Task) -> Task:
+        return self.save(task)
+
+    def update_many(self, tasks: list[Task], commit: bool = True) -> list[Task]:
+        return self.save_many(tasks)
+
+    def delete(self, task_id: UUID) -> None:
+        self._store.remove_task(task_id)
+
+
+class InMemoryProjectRepository(ProjectRepository):
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+
+    def get_by_id(self, project_id: UUID) -> Project | None:
+        project = self._store.projects.get(project_id)
+        return _detached(project) if project else None
+
+    def get_all(self) -> list[Project]:
+        return [_detached(project) for project in self._store.projects.values()]
+
+    def iter_batches(self, batch_size: int) -> Iterator[list[Project]]:
+        ids = sorted(self._store.projects)
+        for start in range(0, len(ids), batch_size):
+            yield [
+                _detached(self._store.projects[i])
+                for i in ids[start : start + batch_size]
+            ]
+
+    def get_by_id_with_tasks(self, project_id: UUID) -> ProjectWithTasks | None:
+        project = self.get_by_id(project_id)
+        if project is None:
+            return None
+        return ProjectWithTasks(project, self._store.project_tasks(project_id))
+
+    def get_many(self, project_ids: list[UUID]) -> ProjectLookup:
+        ids = list(dict.fromkeys(project_ids))
+        projects = self._store.projects
+        return ProjectLookup(
+            projects=[_detached(projects[i]) for i in ids if i in projects],
+            missing_ids=[i for i in ids if i not in projects],
+        )
+
+    def get_all_with_tasks(
+        self, project_ids: list[UUID] | None = None
+    ) -> list[ProjectWithTasks]:
+        ids = self._store.projects if project_ids is None else project_ids
+        return [
+            ProjectWithTasks(
+                _detached(self._store.projects[i]), self._store.project_tasks(i)
+            )
+            for i in dict.fromkeys(ids)
+            if i in self._store.projects
+        ]
+
+    def get_stats(
+        self, now: datetime, project_ids: list[UUID] | None = None
+    ) -> list[ProjectStats]:
+        ids = self._store.projects if project_ids is None else project_ids
+        stats = []
+        for project_id in dict.fromkeys(ids):
+            if project_id not in self._store.projects:
+                continue
+            tasks = [
+                self._store.tasks[i]
+                for i in self._store.tasks_by_project.get(project_id, ())
+            ]
+            open_tasks = [t for t in tasks if not t.is_completed]
+            upcoming = [t.deadline for t in open_tasks if t.deadline >= now]
+            stats.append(
+                ProjectStats(
+                    project_id=project_id,
+                    total_tasks=len(tasks),
+                    completed_tasks=len(tasks) - len(open_tasks),
+                    open_tasks=len(open_tasks),
+                    overdue_tasks=sum(t.deadline < now for t in open_tasks),
+                    next_deadline=min(upcoming, default=None),
+                )
+            )
+        return stats
+
+    def save(self, project: Project) -> Project:
+        self._store.projects[project.id] = _detached(project)
+        return _detached(project)
+
+    def save_many(self, projects: list[Project]) -> list[Project]:
+        return [self.save(project) for project in projects]
+
+    def update(self, project: Project) -> Project:
+        return self.save(project)
+
+    def update_many(
+        self, projects: list[Project], commit: bool = True
+    ) -> list[Project]:
+        return self.save_many(projects)
+
+    def delete(self, project_id: UUID) -> None:
+        for task in self._store.project_tasks(project_id):
+            task.project_id = None
+            self._store.put_task(task)
+        self._store.projects.pop(project_id, None)
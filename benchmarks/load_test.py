@@ -0,0 +1,354 @@
+"""HTTP load test against the application running under uvicorn.
+
+    python -m benchmarks.load_test --scale 100k --rate 200 --duration 30
+    python -m benchmarks.load_test --workers 4 --env WRITE_COORDINATOR_ENABLED=true
+
+The app is started from ``app.infrastructure.api.main:app`` on a copy of a
+seeded dataset; ``--env`` passes settings (pragmas, executors, caching) to
+it. Requests follow a weighted ``--mix`` and are sent open-loop at a fixed
+arrival rate: each starts on schedule whether or not earlier ones have
+finished, and its latency is measured from the scheduled start, so a
+stalled server shows up as latency rather than as a lower request rate.
+Lock contention is read from the server's ``/metrics`` before and after
+the run; with several workers these come from whichever worker answers.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.backends import Dataset, prepare_dataset
+from benchmarks.harness import percentile
+from benchmarks.run import parse_scale
+
+Request = tuple[str, str, dict[str, Any] | None]
+Sample = tuple[float, int]
+
+
+def _future(dataset: Dataset, rng: random.Random, days: float = 30) -> str:
+    return (dataset.now + timedelta(days=rng.uniform(1, days))).isoformat()
+
+
+OPERATIONS: dict[str, Callable[[Dataset, random.Random], Request]] = {
+    "get_task": lambda d, rng: ("GET", f"/tasks/{rng.choice(d.task_ids)}", None),
+    "get_tasks_by_ids": lambda d, rng: (
+        "GET",
+        "/tasks/?" + "&".join(f"ids={i}" for i in rng.sample(d.task_ids, 10)),
+        None,
+    ),
+    "get_project": lambda d, rng: (
+        "GET",
+        f"/projects/{rng.choice(d.project_ids)}?include=stats",
+        None,
+    ),
+    "list_project_tasks": lambda d, rng: (
+        "GET",
+        f"/projects/{d.typical_project_id}/tasks",
+        None,
+    ),
+    "task_changes": lambda d, rng: ("GET", "/tasks/changes?limit=100", None),
+    "project_stats": lambda d, rng: ("GET", "/projects/stats", None),
+    "create_task": lambda d, rng: (
+        "POST",
+        "/tasks/",
+        {"title": "load", "deadline": _future(d, rng)},
+    ),
+    "update_task": lambda d, rng: (
+        "PUT",
+        f"/tasks/{rng.choice(d.task_ids)}",
+        {"title": "renamed"},
+    ),
+    "complete_task": lambda d, rng: (
+        "PATCH",
+        f"/tasks/{rng.choice(d.task_ids)}/complete",
+        None,
+    ),
+    "reopen_task": lambda d, rng: (
+        "PATCH",
+        f"/tasks/{rng.choice(d.task_ids)}/reopen",
+        None,
+    ),
+    "update_project_deadline": lambda d, rng: (
+        "PUT",
+        f"/projects/{d.cascade_project_id}",
+        {"deadline": _future(d, rng, 90)},
+    ),
+}
+
+DEFAULT_MIX = (
+    "get_task=35,get_project=15,list_project_tasks=10,get_tasks_by_ids=10,"
+    "create_task=10,update_task=5,complete_task=10,reopen_task=5"
+)
+
+CONTENTION_COUNTERS = (
+    "db.pool.primary.locked_errors",
+    "db.pool.primary.checkout_failures",
+    "admission.read.rejected",
+    "admission.write.rejected",
+)
+CONTENTION_WAITS = (
+    "executor.write.wait_seconds",
+    "executor.read.wait_seconds",
+    "db.pool.primary.checkout_seconds",
+)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(
+                f"unknown operation {name!r}; choose from {', '.join(OPERATIONS)}"
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve(
+    database: Path, workers: int, env: dict[str, str], startup_timeout: float = 30
+) -> Iterator[str]:
+    """Run the app under uvicorn on ``database`` and yield its base URL."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.infrastructure.api.main:app",
+            "--host=127.0.0.1",
+            f"--port={port}",
+            f"--workers={workers}",
+            "--log-level=warning",
+        ],
+        env={**os.environ, "DATABASE_FILE_PATH": str(database), **env},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with {process.returncode}")
+            try:
+                if httpx.get(f"{base_url}/metrics").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("uvicorn did not start in time")
+            time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    next_request: Callable[[], tuple[str, Request]],
+    rate: float,
+    duration: float,
+    warmup: float,
+) -> tuple[dict[str, list[Sample]], float]:
+    """Send requests open-loop at ``rate`` per second.
+
+    Returns the samples per operation, excluding the warmup, and the
+    length of the measured window in seconds.
+    """
+    loop = asyncio.get_running_loop()
+    samples: dict[str, list[Sample]] = defaultdict(list)
+    skipped = int(rate * warmup)
+    total = skipped + int(rate * duration)
+    start = loop.time() + 0.05
+    finished = start
+
+    async def fire(name: str, request: Request, scheduled: float, keep: bool):
+        nonlocal finished
+        method, url, body = request
+        try:
+            response = await client.request(method, url, json=body)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        now = loop.time()
+        if keep:
+            samples[name].append((now - scheduled, status))
+            finished = max(finished, now)
+
+    in_flight = []
+    for i in range(total):
+        scheduled = start + i / rate
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        name, request = next_request()
+        in_flight.append(
+            asyncio.create_task(fire(name, request, scheduled, i >= skipped))
+        )
+    await asyncio.gather(*in_flight)
+    return samples, max(finished - (start + skipped / rate), 1e-9)
+
+
+def summarize(samples: list[Sample], window: float) -> dict[str, Any]:
+    latencies = sorted(latency for latency, _ in samples)
+    statuses: dict[str, int] = defaultdict(int)
+    for _, status in samples:
+        statuses[str(status)] += 1
+    errors = sum(1 for _, status in samples if status == 0 or status >= 500)
+    return {
+        "requests": len(samples),
+        "throughput": len(samples) / window,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        **{
+            f"p{label}_ms": percentile(latencies, fraction) * 1000
+            for label, fraction in (
+                ("50", 0.5),
+                ("95", 0.95),
+                ("99", 0.99),
+                ("999", 0.999),
+            )
+        },
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def contention(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Difference of the server's lock and queueing metrics over the run."""
+    report: dict[str, Any] = {
+        name: after.get(name, 0) - before.get(name, 0) for name in CONTENTION_COUNTERS
+    }
+    for name in CONTENTION_WAITS:
+        old = before.get(name) or {"count": 0, "sum": 0.0, "buckets": {}}
+        new = after.get(name) or old
+        count = new["count"] - old["count"]
+        waited = count - (new["buckets"].get("0.01", 0) - old["buckets"].get("0.01", 0))
+        report[name] = {
+            "count": count,
+            "mean_ms": (new["sum"] - old["sum"]) / count * 1000 if count else 0.0,
+            "over_10ms": waited / count if count else 0.0,
+        }
+    return report
+
+
+async def _run(args: argparse.Namespace, dataset: Dataset, base_url: str) -> dict:
+    rng = random.Random(args.seed)
+    names = list(args.mix)
+    weights = list(args.mix.values())
+
+    def next_request() -> tuple[str, Request]:
+        name = rng.choices(names, weights)[0]
+        return name, OPERATIONS[name](dataset, rng)
+
+    limits = httpx.Limits(max_connections=args.max_connections)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        before = (await client.get("/metrics")).json()
+        samples, window = await drive(
+            client, next_request, args.rate, args.duration, args.warmup
+        )
+        after = (await client.get("/metrics")).json()
+    every = [sample for op in samples.values() for sample in op]
+    return {
+        "config": {
+            "scale": args.scale,
+            "rate": args.rate,
+            "duration": args.duration,
+            "workers": args.workers,
+            "mix": args.mix,
+            "env": args.env,
+        },
+        "overall": summarize(every, window),
+        "operations": {
+            name: summarize(op, window) for name, op in sorted(samples.items())
+        },
+        "contention": contention(before, after),
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(
+        f"{'operation':<24} {'reqs':>7} {'req/s':>8} {'err %':>6} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8} {'p999':>8}  (ms)"
+    )
+    rows = [*report["operations"].items(), ("overall", report["overall"])]
+    for name, s in rows:
+        print(
+            f"{name:<24} {s['requests']:>7} {s['throughput']:>8.1f} "
+            f"{s['error_rate'] * 100:>6.2f} {s['p50_ms']:>8.2f} {s['p95_ms']:>8.2f} "
+            f"{s['p99_ms']:>8.2f} {s['p999_ms']:>8.2f}"
+        )
+    print("contention:", json.dumps(report["contention"], indent=2))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test")
+    parser.add_argument("--scale", type=parse_scale, default=100_000)
+    parser.add_argument("--rate", type=float, default=100, help="requests/second")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="application setting for the server, e.g. READ_POOL_SIZE=20",
+    )
+    parser.add_argument("--max-connections", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "payback-benchmarks",
+    )
+    parser.add_argument("--output", type=Path, help="save the report as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    env = dict(item.split("=", 1) for item in args.env)
+    dataset = prepare_dataset(args.scale, args.data_dir, args.seed)
+    with tempfile.TemporaryDirectory() as work_dir:
+        database = Path(work_dir) / "load.db"
+        shutil.copyfile(dataset.path, database)
+        with serve(database, args.workers, env) as base_url:
+            report = asyncio.run(_run(args, dataset, base_url))
+    _print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Use-case micro-benchmarks.
+
+    python -m benchmarks.run --scales 1k,100k --output results.json
+    python -m benchmarks.run --compare results.json --tolerance 0.25
+
+Every scenario runs against the in-memory and the SQLite repositories at
+each scale. Results are printed as a table and can be saved as JSON; with
+``--compare`` the run is matched against a saved baseline and the exit
+status is 1 when any p50 latency regressed by more than the tolerance.
+A scenario whose every call raised is reported as failed and also makes
+the exit status 1, since its latencies only time the error path.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+
+from benchmarks.backends import BACKENDS, prepare_dataset
+from benchmarks.harness import Measurement, measure, percentile
+from benchmarks.scenarios import SCENARIOS, Context
+
+SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_scale(value: str) -> int:
+    value = value.strip().lower()
+    if value and value[-1] in SUFFIXES:
+        return int(float(value[:-1]) * SUFFIXES[value[-1]])
+    return int(value)
+
+
+def run(args: argparse.Namespace) -> list[Measurement]:
+    names = [
+        name
+        for name in SCENARIOS
+        if any(fnmatch(name, pattern) for pattern in args.scenarios)
+    ]
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for scale in args.scales:
+            print(f"preparing {scale} tasks", file=sys.stderr)
+            dataset = prepare_dataset(scale, args.data_dir, args.seed)
+            for backend_name in args.backends:
+                backend = BACKENDS[backend_name](dataset, Path(work_dir))
+                try:
+                    for name in names:
+                        ctx = Context(backend, dataset, random.Random(args.seed))
+                        latencies, errors, peak_kib = measure(
+                            SCENARIOS[name](ctx), args.max_ops, args.max_seconds
+                        )
+                        latencies.sort()
+                        result = Measurement(
+                            scenario=name,
+                            backend=backend_name,
+                            scale=scale,
+                            ops=len(latencies),
+                            errors=errors,
+                            ops_per_sec=len(latencies) / sum(latencies),
+                            p50_ms=percentile(latencies, 0.50) * 1000,
+                            p99_ms=percentile(latencies, 0.99) * 1000,
+                            peak_kib=peak_kib,
+                        )
+                        print(_format_row(result), flush=True)
+                        results.append(result)
+                finally:
+                    backend.close()
+    return results
+
+
+def compare(
+    results: list[Measurement], baseline: list[Measurement], tolerance: float
+) -> list[str]:
+    """Return a line for every result whose p50 got slower than the
+    baseline by more than ``tolerance``."""
+    previous = {m.key: m for m in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result.key)
+        if before is None or before.p50_ms == 0:
+            continue
+        ratio = result.p50_ms / before.p50_ms
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{result.scenario} [{result.backend}, {result.scale}]: "
+                f"p50 {before.p50_ms:.3f} -> {result.p50_ms:.3f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def failures(results: list[Measurement]) -> list[str]:
+    """Return a line for every result whose calls all raised an error."""
+    return [
+        f"{result.scenario} [{result.backend}, {result.scale}]: "
+        f"all {result.ops} calls failed"
+        for result in results
+        if result.ops and result.errors == result.ops
+    ]
+
+
+def load_results(path: Path) -> list[Measurement]:
+    data = json.loads(path.read_text())
+    return [Measurement(**result) for result in data["results"]]
+
+
+def save_results(path: Path, results: list[Measurement]) -> None:
+    data = {"environment": _environment(), "results": [asdict(r) for r in results]}
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def _environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+HEADER = (
+    f"{'scenario':<34} {'backend':<7} {'scale':>9} {'ops':>6} {'err':>5} "
+    f"{'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>10}"
+)
+
+
+def _format_row(m: Measurement) -> str:
+    return (
+        f"{m.scenario:<34} {m.backend:<7} {m.scale:>9} {m.ops:>6} {m.errors:>5} "
+        f"{m.ops_per_sec:>10.1f} {m.p50_ms:>9.3f} {m.p99_ms:>9.3f} {m.peak_kib:>10.1f}"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument(
+        "--scales",
+        type=lambda v: [parse_scale(s) for s in v.split(",")],
+        default=[1_000, 100_000],
+        help="comma separated task counts, e.g. 1k,100k,1M",
+    )
+    parser.add_argument(
+        "--backends",
+        type=lambda v: v.split(","),
+        default=list(BACKENDS),
+        help="comma separated: " + ",".join(BACKENDS),
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", default=["*"], help="glob patterns of scenarios"
+    )
+    parser.add_argument("--max-ops", type=int, default=200)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=2.0,
+        help="time budget per scenario; slow scenarios stop early",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "payback-benchmarks",
+        help="where seeded datasets are cached between runs",
+    )
+    parser.add_argument("--output", type=Path, help="save results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    unknown = set(args.backends) - set(BACKENDS)
+    if unknown:
+        raise SystemExit(f"Unknown backends: {', '.join(sorted(unknown))}")
+    print(HEADER)
+    results = run(args)
+    if args.output:
+        save_results(args.output, results)
+    failed = failures(results)
+    for line in failed:
+        print(f"FAILED {line}", file=sys.stderr)
+    regressions = []
+    if args.compare:
+        regressions = compare(results, load_results(args.compare), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,405 @@
+"""One scenario per use case. Each factory receives the benchmark context
+and returns a zero-argument operation that runs the use case once, in its
+own unit of work, against a rotating set of targets."""
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import count
+from uuid import UUID
+
+from app.application.dto.import_dto import ImportProjectRowDTO, ImportTaskRowDTO
+from app.application.dto.project_dto import CreateProjectDTO, UpdateProjectDTO
+from app.application.dto.task_dto import (
+    CreateTaskBatchItemDTO,
+    CreateTaskDTO,
+    TaskFilterDTO,
+    UpdateTaskDTO,
+)
+from app.application.use_cases.project_use_cases.complete_project import (
+    CompleteProjectUseCase,
+)
+from app.application.use_cases.project_use_cases.create_project import (
+    CreateProjectUseCase,
+)
+from app.application.use_cases.project_use_cases.get_project_stats import (
+    GetProjectStatsUseCase,
+)
+from app.application.use_cases.project_use_cases.get_projects import (
+    GetProjectsUseCase,
+)
+from app.application.use_cases.project_use_cases.import_projects import (
+    ImportProjectsUseCase,
+)
+from app.application.use_cases.project_use_cases.update_project import (
+    UpdateProjectUseCase,
+)
+from app.application.use_cases.task_use_cases.bulk_transitions import (
+    BulkCompleteTasksUseCase,
+    BulkLinkTasksUseCase,
+    BulkReopenTasksUseCase,
+    BulkUnlinkTasksUseCase,
+)
+from app.application.use_cases.task_use_cases.complete_task import CompleteTaskUseCase
+from app.application.use_cases.task_use_cases.create_task import CreateTaskUseCase
+from app.application.use_cases.task_use_cases.create_tasks import CreateTasksUseCase
+from app.application.use_cases.task_use_cases.get_filtered_tasks import (
+    GetFilteredTasksUseCase,
+)
+from app.application.use_cases.task_use_cases.get_task_changes import (
+    GetTaskChangesUseCase,
+)
+from app.application.use_cases.task_use_cases.get_tasks_by_ids import (
+    GetTasksByIdsUseCase,
+)
+from app.application.use_cases.task_use_cases.import_tasks import ImportTasksUseCase
+from app.application.use_cases.task_use_cases.link_task_to_project import (
+    LinkTaskToProjectUseCase,
+)
+from app.application.use_cases.task_use_cases.reopen_task import ReopenTaskUseCase
+from app.application.use_cases.task_use_cases.unlink_task_from_project import (
+    UnlinkTaskToProjectUseCase,
+)
+from app.application.use_cases.task_use_cases.update_task import UpdateTaskUseCase
+from app.domain.clock import FixedClock
+from app.domain.event_bus import EventBus
+from app.domain.event_handlers import ProjectDeadlineChangedHandler
+from app.domain.events import ProjectDeadlineChangedEvent
+from app.domain.services.deadline_enforcement_service import DeadlineEnforcementService
+from app.domain.services.project_completion_service import ProjectCompletionService
+from benchmarks.backends import Backend, Dataset
+
+BATCH = 100
+
+
+@dataclass
+class Context:
+    backend: Backend
+    dataset: Dataset
+    rng: random.Random
+
+    @property
+    def clock(self) -> FixedClock:
+        return FixedClock(self.dataset.now)
+
+    def picker(self, ids: list[UUID]) -> Callable[[], UUID]:
+        return lambda: self.rng.choice(ids)
+
+    def sampler(self, ids: list[UUID], size: int = BATCH) -> Callable[[], list[UUID]]:
+        return lambda: self.rng.sample(ids, min(size, len(ids)))
+
+    def future(self, days: float = 30) -> datetime:
+        return self.dataset.now + timedelta(days=days)
+
+
+Operation = Callable[[], object]
+SCENARIOS: dict[str, Callable[[Context], Operation]] = {}
+
+
+def scenario(name: str):
+    def register(factory: Callable[[Context], Operation]):
+        SCENARIOS[name] = factory
+        return factory
+
+    return register
+
+
+# Projects
+
+
+@scenario("create_project")
+def create_project(ctx: Context) -> Operation:
+    def op():
+        with ctx.backend.repositories() as repos:
+            CreateProjectUseCase(repos.projects).execute(
+                CreateProjectDTO(title="bench", deadline=ctx.future())
+            )
+
+    return op
+
+
+@scenario("update_project_deadline_cascade")
+def update_project_deadline(ctx: Context) -> Operation:
+    """Moves the deadline of a median-size project; tasks due later are
+    pulled in through the deadline-changed handler."""
+    deadlines = [ctx.future(days) for days in (5, 20, 40, 60)]
+    turn = count()
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            handler = ProjectDeadlineChangedHandler(
+                repos.tasks, DeadlineEnforcementService()
+            )
+            event_bus = EventBus()
+            event_bus.subscribe(
+                ProjectDeadlineChangedEvent, partial(handler.handle, auto_adjust=True)
+            )
+            UpdateProjectUseCase(repos.projects, event_bus).execute(
+                UpdateProjectDTO(deadline=deadlines[next(turn) % len(deadlines)]),
+                ctx.dataset.cascade_project_id,
+            )
+
+    return op
+
+
+@scenario("complete_project")
+def complete_project(ctx: Context) -> Operation:
+    pick = ctx.picker(ctx.dataset.completable_project_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            CompleteProjectUseCase(repos.projects, repos.tasks).execute(pick())
+
+    return op
+
+
+@scenario("get_projects")
+def get_projects(ctx: Context) -> Operation:
+    def op():
+        with ctx.backend.repositories() as repos:
+            GetProjectsUseCase(repos.projects, ctx.clock).execute()
+
+    return op
+
+
+@scenario("get_project_with_tasks_and_stats")
+def get_project_expanded(ctx: Context) -> Operation:
+    def op():
+        with ctx.backend.repositories() as repos:
+            GetProjectsUseCase(repos.projects, ctx.clock).execute_one(
+                ctx.dataset.typical_project_id, include_stats=True, include_tasks=True
+            )
+
+    return op
+
+
+@scenario("get_projects_by_ids_with_stats")
+def get_projects_by_ids(ctx: Context) -> Operation:
+    sample = ctx.sampler(ctx.dataset.project_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            GetProjectsUseCase(repos.projects, ctx.clock).execute_many(
+                sample(), include_stats=True
+            )
+
+    return op
+
+
+@scenario("get_project_stats")
+def get_project_stats(ctx: Context) -> Operation:
+    sample = ctx.sampler(ctx.dataset.project_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            GetProjectStatsUseCase(repos.projects, ctx.clock).execute(sample())
+
+    return op
+
+
+@scenario("import_projects")
+def import_projects(ctx: Context) -> Operation:
+    def op():
+        rows = [
+            ImportProjectRowDTO(line=i, title="imported", deadline=ctx.future())
+            for i in range(BATCH)
+        ]
+        with ctx.backend.repositories() as repos:
+            ImportProjectsUseCase(repos.projects).execute(rows)
+
+    return op
+
+
+# Tasks
+
+
+@scenario("create_task")
+def create_task(ctx: Context) -> Operation:
+    def op():
+        with ctx.backend.repositories() as repos:
+            CreateTaskUseCase(repos.tasks, repos.projects).execute(
+                CreateTaskDTO(title="bench", description=None, deadline=ctx.future())
+            )
+
+    return op
+
+
+@scenario("create_tasks")
+def create_tasks(ctx: Context) -> Operation:
+    deadline = ctx.dataset.typical_project_deadline - timedelta(days=1)
+
+    def op():
+        items = [
+            CreateTaskBatchItemDTO(
+                title="bench",
+                description=None,
+                deadline=deadline,
+                project_id=ctx.dataset.typical_project_id,
+            )
+            for _ in range(BATCH)
+        ]
+        with ctx.backend.repositories() as repos:
+            CreateTasksUseCase(repos.tasks, repos.projects).execute(items)
+
+    return op
+
+
+@scenario("import_tasks")
+def import_tasks(ctx: Context) -> Operation:
+    deadline = ctx.dataset.typical_project_deadline - timedelta(days=1)
+
+    def op():
+        rows = [
+            ImportTaskRowDTO(
+                line=i,
+                title="imported",
+                deadline=deadline,
+                project_id=ctx.dataset.typical_project_id,
+            )
+            for i in range(BATCH)
+        ]
+        with ctx.backend.repositories() as repos:
+            ImportTasksUseCase(repos.tasks, repos.projects).execute(rows)
+
+    return op
+
+
+@scenario("update_task")
+def update_task(ctx: Context) -> Operation:
+    pick = ctx.picker(ctx.dataset.task_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            UpdateTaskUseCase(repos.tasks, repos.projects).execute(
+                UpdateTaskDTO(title="renamed"), pick()
+            )
+
+    return op
+
+
+@scenario("complete_task_in_hot_project")
+def complete_task(ctx: Context) -> Operation:
+    """Completion reads every task of the project, so the largest project
+    is the worst case."""
+    with ctx.backend.repositories() as repos:
+        task_ids = [
+            t.id for t in repos.tasks.get_by_project_id(ctx.dataset.hot_project_id)
+        ]
+    pick = ctx.picker(task_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            CompleteTaskUseCase(
+                repos.tasks,
+                repos.projects,
+                ProjectCompletionService(auto_complete_enabled=True),
+            ).execute(pick())
+
+    return op
+
+
+@scenario("reopen_task")
+def reopen_task(ctx: Context) -> Operation:
+    pick = ctx.picker(ctx.dataset.task_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            ReopenTaskUseCase(repos.tasks, repos.projects).execute(pick())
+
+    return op
+
+
+@scenario("link_and_unlink_task")
+def link_and_unlink_task(ctx: Context) -> Operation:
+    pick = ctx.picker(ctx.dataset.unassigned_task_ids)
+    project_id = ctx.dataset.typical_project_id
+
+    def op():
+        task_id = pick()
+        with ctx.backend.repositories() as repos:
+            LinkTaskToProjectUseCase(repos.tasks, repos.projects).execute(
+                task_id, project_id
+            )
+            UnlinkTaskToProjectUseCase(repos.tasks, repos.projects).execute(
+                task_id, project_id
+            )
+
+    return op
+
+
+@scenario("get_filtered_tasks")
+def get_filtered_tasks(ctx: Context) -> Operation:
+    def op():
+        with ctx.backend.repositories() as repos:
+            GetFilteredTasksUseCase(repos.tasks, ctx.clock).execute(
+                TaskFilterDTO(is_completed=False, is_overdue=True)
+            )
+
+    return op
+
+
+@scenario("get_task_changes")
+def get_task_changes(ctx: Context) -> Operation:
+    def op():
+        since = max(ctx.backend.current_change_seq() - 5 * BATCH, 0)
+        with ctx.backend.repositories() as repos:
+            GetTaskChangesUseCase(repos.tasks, ctx.clock).execute(since, BATCH)
+
+    return op
+
+
+@scenario("get_tasks_by_ids")
+def get_tasks_by_ids(ctx: Context) -> Operation:
+    sample = ctx.sampler(ctx.dataset.task_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            GetTasksByIdsUseCase(repos.tasks, ctx.clock).execute(sample())
+
+    return op
+
+
+@scenario("bulk_complete_tasks")
+def bulk_complete_tasks(ctx: Context) -> Operation:
+    sample = ctx.sampler(ctx.dataset.task_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            BulkCompleteTasksUseCase(
+                repos.tasks,
+                repos.projects,
+                ProjectCompletionService(auto_complete_enabled=True),
+            ).execute(sample())
+
+    return op
+
+
+@scenario("bulk_reopen_tasks")
+def bulk_reopen_tasks(ctx: Context) -> Operation:
+    sample = ctx.sampler(ctx.dataset.task_ids)
+
+    def op():
+        with ctx.backend.repositories() as repos:
+            BulkReopenTasksUseCase(repos.tasks, repos.projects).execute(sample())
+
+    return op
+
+
+@scenario("bulk_link_and_unlink_tasks")
+def bulk_link_and_unlink_tasks(ctx: Context) -> Operation:
+    sample = ctx.sampler(ctx.dataset.unassigned_task_ids)
+    project_id = ctx.dataset.typical_project_id
+
+    def op():
+        task_ids = sample()
+        with ctx.backend.repositories() as repos:
+            BulkLinkTasksUseCase(repos.tasks, repos.projects).execute(
+                project_id, task_ids
+            )
+            BulkUnlinkTasksUseCase(repos.tasks, repos.projects).execute(
+                project_id, task_ids
+            )
+
+    return op
@@ -0,0 +1,19 @@
+import pytest
+
+from benchmarks.contention import MODES, run_contention
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_concurrent_completions_leave_projects_consistent(tmp_path, mode) -> None:
+    result = run_contention(
+        tmp_path / "contention.db",
+        mode=mode,
+        threads=4,
+        projects=2,
+        tasks_per_project=10,
+    )
+
+    assert result.completed == 20
+    assert result.failed == 0
+    assert result.inconsistent_projects == 0
+    assert result.retries <= result.locked_errors
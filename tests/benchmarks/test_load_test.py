@@ -0,0 +1,51 @@
+import argparse
+
+import pytest
+
+from benchmarks.load_test import contention, parse_mix, summarize
+
+
+def test_parse_mix_rejects_unknown_operations() -> None:
+    assert parse_mix("get_task=3,complete_task") == {
+        "get_task": 3.0,
+        "complete_task": 1.0,
+    }
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("get_task=1,drop_tables=1")
+
+
+def test_summary_counts_server_and_transport_errors() -> None:
+    samples = [(0.001 * i, 200) for i in range(1, 97)]
+    samples += [(0.5, 503), (0.5, 500), (1.0, 0), (0.002, 404)]
+
+    summary = summarize(samples, window=2.0)
+
+    assert summary["requests"] == 100
+    assert summary["throughput"] == 50
+    assert summary["error_rate"] == pytest.approx(0.03)
+    assert summary["statuses"] == {"0": 1, "200": 96, "404": 1, "500": 1, "503": 1}
+    assert summary["p50_ms"] <= summary["p99_ms"] <= summary["p999_ms"] == 1000
+
+
+def test_contention_reports_the_difference_over_the_run() -> None:
+    def wait(count: int, total: float, fast: int) -> dict:
+        return {"count": count, "sum": total, "buckets": {"0.01": fast}}
+
+    before = {
+        "db.pool.primary.locked_errors": 2,
+        "executor.write.wait_seconds": wait(10, 1.0, 10),
+    }
+    after = {
+        "db.pool.primary.locked_errors": 5,
+        "executor.write.wait_seconds": wait(20, 1.5, 15),
+    }
+
+    report = contention(before, after)
+
+    assert report["db.pool.primary.locked_errors"] == 3
+    assert report["executor.write.wait_seconds"] == {
+        "count": 10,
+        "mean_ms": pytest.approx(50),
+        "over_10ms": 0.5,
+    }
+    assert report["executor.read.wait_seconds"]["count"] == 0
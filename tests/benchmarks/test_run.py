@@ -0,0 +1,50 @@
+import json
+
+from benchmarks.harness import Measurement
+from benchmarks.run import compare, failures, main, parse_scale
+from benchmarks.scenarios import SCENARIOS
+
+
+def test_every_scenario_runs_on_every_backend(tmp_path) -> None:
+    output = tmp_path / "results.json"
+
+    status = main(
+        [
+            "--scales=1k",
+            "--max-ops=2",
+            "--max-seconds=0.01",
+            f"--data-dir={tmp_path / 'data'}",
+            f"--output={output}",
+        ]
+    )
+
+    assert status == 0
+    results = json.loads(output.read_text())["results"]
+    assert {(r["scenario"], r["backend"]) for r in results} == {
+        (name, backend) for name in SCENARIOS for backend in ("memory", "sqlite")
+    }
+    assert all(r["ops"] >= 2 and r["p99_ms"] >= r["p50_ms"] for r in results)
+    assert all(r["errors"] < r["ops"] for r in results)
+
+
+def test_compare_flags_slower_p50_only() -> None:
+    def result(scenario: str, p50_ms: float) -> Measurement:
+        return Measurement(scenario, "sqlite", 1000, 10, 0, 1.0, p50_ms, p50_ms, 0.0)
+
+    baseline = [result("fast", 1.0), result("slow", 1.0)]
+    current = [result("fast", 0.5), result("slow", 1.5), result("new", 9.0)]
+
+    assert compare(current, baseline, tolerance=0.25) == [
+        "slow [sqlite, 1000]: p50 1.000 -> 1.500 ms (1.50x)"
+    ]
+    assert parse_scale("100k") == 100_000
+    assert parse_scale("1M") == 1_000_000
+
+
+def test_failures_flags_scenarios_where_every_call_raised() -> None:
+    def result(scenario: str, errors: int) -> Measurement:
+        return Measurement(scenario, "sqlite", 1000, 10, errors, 1.0, 1.0, 1.0, 0.0)
+
+    results = [result("ok", 0), result("flaky", 3), result("broken", 10)]
+
+    assert failures(results) == ["broken [sqlite, 1000]: all 10 calls failed"]
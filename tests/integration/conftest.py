@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel, Session
+
+from app.infrastructure.persistence.models import models  # noqa: F401
+
+
+@pytest.fixture(scope="function")
+def test_db(tmp_path: Path):
+    db_path = tmp_path / "test.db"
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def session(test_db):
+    with Session(test_db) as session:
+        yield session
+        session.rollback()
@@ -1,36 +1,19 @@
 from datetime import datetime, timezone, timedelta
-from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
-from sqlmodel import SQLModel, Session
+from sqlmodel import Session
 from starlette.testclient import TestClient
 
 from app.infrastructure.api.main import app
 from app.infrastructure.config import Settings, get_settings
-from app.infrastructure.persistence.engine import get_session
+from app.infrastructure.persistence.engine import (
+    get_engine,
+    get_read_session,
+    get_session,
+)
 from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
 
 
-@pytest.fixture(scope="function")
-def test_db(tmp_path: Path):
-    db_path = tmp_path / "test.db"
-
-    engine = create_engine(f"sqlite:///{db_path}")
-    SQLModel.metadata.create_all(engine)
-
-    yield engine
-
-    engine.dispose()
-
-
-@pytest.fixture(scope="function")
-def session(test_db):
-    with Session(test_db) as session:
-        yield session
-        session.rollback()
-
-
 @pytest.fixture
 def test_settings() -> Settings:
     return Settings(
@@ -42,10 +25,13 @@ def test_settings() -> Settings:
 
 @pytest.fixture
 def client(
+    test_db,
     session: Session,
     test_settings: Settings,
 ) -> TestClient:
+    app.dependency_overrides[get_engine] = lambda: test_db
     app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_read_session] = lambda: session
     app.dependency_overrides[get_settings] = lambda: test_settings
     yield TestClient(app)
     app.dependency_overrides.clear()
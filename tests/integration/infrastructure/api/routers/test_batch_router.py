@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlmodel import Session, select
+from starlette.testclient import TestClient
+
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+
+
+def _deadline(days: int = 1) -> str:
+    return (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
+
+
+def test_batch_runs_sub_requests_in_order(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    session.add(project_model)
+    session.commit()
+
+    r = client.post(
+        "/batch",
+        json={
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/tasks/",
+                    "body": {"title": "t", "deadline": _deadline()},
+                },
+                {"method": "GET", "path": f"/tasks/{uuid4()}"},
+                {
+                    "method": "GET",
+                    "path": f"/projects/{project_model.id}?include=stats",
+                },
+            ]
+        },
+    )
+
+    assert r.status_code == 200
+    created, missing, project = r.json()
+    assert created["status"] == 201
+    assert created["body"]["title"] == "t"
+    assert missing == {"status": 404, "body": {"detail": "Task not found"}}
+    assert project["status"] == 200
+    assert project["body"]["stats"]["total_tasks"] == 0
+
+
+def test_atomic_batch_commits_all_sub_requests(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    session.add(project_model)
+    session.commit()
+    task_id = uuid4()
+    session.add(
+        TaskModel(id=task_id, title="existing", deadline=project_model.deadline)
+    )
+    session.commit()
+
+    r = client.post(
+        "/batch",
+        json={
+            "atomic": True,
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/tasks/",
+                    "body": {"title": "new", "deadline": _deadline()},
+                },
+                {
+                    "method": "POST",
+                    "path": f"/projects/{project_model.id}/tasks/{task_id}/link",
+                },
+                {"method": "GET", "path": f"/projects/{project_model.id}/tasks"},
+            ],
+        },
+    )
+
+    assert [sub["status"] for sub in r.json()] == [201, 200, 200]
+    assert [t["id"] for t in r.json()[2]["body"]] == [str(task_id)]
+    session.expire_all()
+    assert session.get(TaskModel, task_id).project_id == project_model.id
+    assert len(session.exec(select(TaskModel)).all()) == 2
+
+
+def test_atomic_batch_rolls_back_on_failure(
+    client: TestClient, session: Session
+) -> None:
+    r = client.post(
+        "/batch",
+        json={
+            "atomic": True,
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/projects/",
+                    "body": {"title": "p", "deadline": _deadline()},
+                },
+                {"method": "DELETE", "path": f"/tasks/{uuid4()}"},
+                {"method": "GET", "path": "/tasks/"},
+            ],
+        },
+    )
+
+    assert [sub["status"] for sub in r.json()] == [424, 404, 424]
+    assert session.exec(select(ProjectModel)).all() == []
+
+
+def test_batch_422_for_unbatchable_path(client: TestClient) -> None:
+    r = client.post("/batch", json={"requests": [{"method": "GET", "path": "/events"}]})
+    assert r.status_code == 422
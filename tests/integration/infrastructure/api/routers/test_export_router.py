@@ -0,0 +1,58 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from sqlmodel import Session, select
+from starlette.testclient import TestClient
+
+from app.infrastructure.config import Settings
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+
+
+def test_export_tasks_streams_ndjson_in_batches(
+    client: TestClient,
+    project_model: ProjectModel,
+    session: Session,
+    test_settings: Settings,
+) -> None:
+    session.add(project_model)
+    for i in range(5):
+        session.add(
+            TaskModel(
+                title=f"t{i}",
+                deadline=project_model.deadline,
+                project_id=project_model.id if i % 2 else None,
+            )
+        )
+    session.commit()
+    test_settings.EXPORT_BATCH_SIZE = 2
+
+    r = client.get("/export/tasks")
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert sorted(row["title"] for row in rows) == ["t0", "t1", "t2", "t3", "t4"]
+    assert rows == sorted(rows, key=lambda row: row["id"])
+    assert {row["project_id"] for row in rows} == {None, str(project_model.id)}
+
+
+def test_csv_export_can_be_imported_back(client: TestClient, session: Session) -> None:
+    deadline = datetime.now(timezone.utc) - timedelta(days=3)
+    session.add(ProjectModel(title='say "hi",\nbye', deadline=deadline))
+    session.add(ProjectModel(title="done", deadline=deadline, is_completed=True))
+    session.commit()
+
+    exported = client.get("/export/projects?format=csv")
+    session.exec(ProjectModel.__table__.delete())
+    session.commit()
+    imported = client.post("/import/projects?format=csv", content=exported.content)
+
+    assert exported.text.splitlines()[0] == (
+        "id,title,deadline,is_completed,created_at,updated_at"
+    )
+    assert json.loads(imported.text.splitlines()[-1])["imported"] == 2
+    projects = session.exec(select(ProjectModel).order_by(ProjectModel.title)).all()
+    assert [(p.title, p.is_completed) for p in projects] == [
+        ("done", True),
+        ('say "hi",\nbye', False),
+    ]
@@ -0,0 +1,84 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlmodel import Session, select
+from starlette.testclient import TestClient
+
+from app.infrastructure.config import Settings
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+
+
+def _deadline(days: int = 1) -> str:
+    return (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
+
+
+def _events(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_import_tasks_from_ndjson_reports_row_errors(
+    client: TestClient,
+    project_model: ProjectModel,
+    session: Session,
+    test_settings: Settings,
+) -> None:
+    session.add(project_model)
+    session.commit()
+    test_settings.IMPORT_CHUNK_SIZE = 2
+    rows = [
+        {"title": "a", "deadline": _deadline(), "project_id": str(project_model.id)},
+        {"title": "b", "deadline": _deadline(20), "project_id": str(project_model.id)},
+        "not json",
+        {"title": "c", "deadline": _deadline(-5), "is_completed": True},
+        {"title": "d", "deadline": _deadline(), "project_id": str(uuid4())},
+    ]
+    body = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in rows)
+
+    r = client.post(
+        "/import/tasks",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert r.status_code == 200
+    events = _events(r)
+    assert [e["line"] for e in events if e["type"] == "error"] == [2, 3, 5]
+    assert [e["type"] for e in events].count("progress") == 3
+    assert events[-1] == {"type": "summary", "rows": 5, "imported": 2, "failed": 3}
+    titles = session.exec(select(TaskModel.title).order_by(TaskModel.title)).all()
+    assert titles == ["a", "c"]
+
+
+def test_import_projects_from_csv(client: TestClient, session: Session) -> None:
+    existing = ProjectModel(title="existing", deadline=datetime.now(timezone.utc))
+    session.add(existing)
+    session.commit()
+    body = (
+        "id,title,deadline,is_completed\n"
+        f',"multi\nline",{_deadline()},\n'
+        f"{existing.id},dup,{_deadline()},true\n"
+        f",,{_deadline()},\n"
+    )
+
+    r = client.post("/import/projects?format=csv", content=body)
+
+    events = _events(r)
+    assert [(e["line"], e["error"]) for e in events if e["type"] == "error"] == [
+        (4, "Project already exists"),
+        (5, "title: Field required"),
+    ]
+    assert events[-1]["imported"] == 1
+    imported = session.exec(
+        select(ProjectModel).where(ProjectModel.id != existing.id)
+    ).one()
+    assert imported.title == "multi\nline"
+    assert imported.is_completed is False
+
+
+def test_import_rejects_unknown_format(client: TestClient) -> None:
+    r = client.post(
+        "/import/tasks", content="x", headers={"content-type": "text/plain"}
+    )
+
+    assert r.status_code == 415
@@ -3,11 +3,20 @@ from datetime import datetime, timezone, timedelta
 from uuid import uuid4, UUID
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select
 from starlette.testclient import TestClient
 
+from app.domain.event_bus import EventBus
+from app.domain.events import ProjectDeadlineChangedEvent
+from app.infrastructure.api.dependencies import get_event_bus
+from app.infrastructure.api.main import app
 from app.infrastructure.api.schemas.project_schemas import ProjectCreate, ProjectUpdate
-from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+from app.infrastructure.config import Settings
+from app.infrastructure.persistence.models.models import (
+    OutboxMessageModel,
+    ProjectModel,
+    TaskModel,
+)
 from tests.integration.infrastructure.api.routers.test_task_router import (
     _assert_object_are_equal,
 )
@@ -143,7 +152,7 @@ def test_link_task_happy_path(
 ) -> None:
     session.add_all([project_model, task_model])
     session.commit()
-    session.refresh(project_model)
+    session.refresh(project_model, ["tasks"])
     session.refresh(task_model)
 
     assert not project_model.tasks
@@ -153,6 +162,7 @@ def test_link_task_happy_path(
     assert r.status_code == 200
 
     project = session.get(ProjectModel, project_model.id)
+    session.refresh(project, ["tasks"])
 
     assert task_model.project_id == project.id
     assert project.tasks[0].id == task_model.id
@@ -234,3 +244,280 @@ def test_retrieve_tasks_happy_path(
     expected = {k: v for k, v in asdict(task).items() if not k.startswith("_")}
 
     _assert_object_are_equal(tested, expected)
+
+
+def test_update_project_deadline_writes_outbox_message(
+    client: TestClient,
+    project_model: ProjectModel,
+    session: Session,
+) -> None:
+    session.add(project_model)
+    session.commit()
+    session.refresh(project_model)
+    new_deadline = datetime.now(timezone.utc) + timedelta(days=5)
+
+    r = client.put(
+        f"/projects/{project_model.id}",
+        data=ProjectUpdate(deadline=new_deadline).model_dump_json(),
+    )
+
+    assert r.status_code == 200
+    message = session.exec(select(OutboxMessageModel)).one()
+    assert message.event_type == "ProjectDeadlineChangedEvent"
+    assert str(project_model.id) in message.payload
+
+
+def test_update_project_uses_overridden_event_bus(
+    client: TestClient,
+    project_model: ProjectModel,
+    session: Session,
+) -> None:
+    published = []
+    event_bus = EventBus()
+    event_bus.subscribe(ProjectDeadlineChangedEvent, published.append)
+    app.dependency_overrides[get_event_bus] = lambda: lambda _session: event_bus
+    session.add(project_model)
+    session.commit()
+    session.refresh(project_model)
+
+    r = client.put(
+        f"/projects/{project_model.id}",
+        data=ProjectUpdate(
+            deadline=datetime.now(timezone.utc) + timedelta(days=5)
+        ).model_dump_json(),
+    )
+
+    assert r.status_code == 200
+    assert [event.project_id for event in published] == [project_model.id]
+    assert session.exec(select(OutboxMessageModel)).all() == []
+
+
+def test_update_project_deadline_422_when_auto_adjust_disabled(
+    client: TestClient,
+    test_settings: Settings,
+    project_model: ProjectModel,
+    task_model: TaskModel,
+    session: Session,
+) -> None:
+    test_settings.AUTO_ADJUST_TASK_DEADLINES = False
+    session.add(project_model)
+    session.commit()
+    task_model.project_id = project_model.id
+    task_model.deadline = project_model.deadline - timedelta(days=1)
+    session.add(task_model)
+    session.commit()
+
+    r = client.put(
+        f"/projects/{project_model.id}",
+        data=ProjectUpdate(
+            deadline=task_model.deadline - timedelta(days=1)
+        ).model_dump_json(),
+    )
+
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Project contains task(s) with later deadline(s)"
+    assert session.exec(select(OutboxMessageModel)).all() == []
+
+
+def test_delete_project_reports_unlinked_tasks_as_changes(
+    client: TestClient,
+    project_model: ProjectModel,
+    task_model: TaskModel,
+    session: Session,
+) -> None:
+    task_model.project_id = project_model.id
+    session.add_all([project_model, task_model])
+    session.commit()
+    since = client.get("/tasks/changes").json()["next_since"]
+
+    r = client.delete(f"/projects/{project_model.id}")
+    assert r.status_code == 204
+
+    changes = client.get("/tasks/changes", params={"since": since}).json()
+    assert [t["id"] for t in changes["tasks"]] == [str(task_model.id)]
+    assert changes["tasks"][0]["project_id"] is None
+
+
+def test_get_project_stats_aggregates_tasks(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    now = datetime.now(timezone.utc)
+    empty_project = ProjectModel(title="empty", deadline=project_model.deadline)
+    session.add_all([project_model, empty_project])
+    session.commit()
+    session.add_all(
+        [
+            TaskModel(
+                title="overdue",
+                deadline=now - timedelta(days=1),
+                project_id=project_model.id,
+            ),
+            TaskModel(
+                title="next",
+                deadline=now + timedelta(days=2),
+                project_id=project_model.id,
+            ),
+            TaskModel(
+                title="later",
+                deadline=now + timedelta(days=3),
+                project_id=project_model.id,
+            ),
+            TaskModel(
+                title="done",
+                deadline=now + timedelta(days=1),
+                project_id=project_model.id,
+                is_completed=True,
+            ),
+        ]
+    )
+    session.commit()
+
+    r = client.get("/projects/stats")
+
+    assert r.status_code == 200
+    stats = {s["project_id"]: s for s in r.json()}
+    next_deadline = datetime.fromisoformat(
+        stats[str(project_model.id)].pop("next_deadline")
+    )
+    assert stats[str(project_model.id)] == {
+        "project_id": str(project_model.id),
+        "total_tasks": 4,
+        "completed_tasks": 1,
+        "open_tasks": 3,
+        "overdue_tasks": 1,
+    }
+    assert abs(next_deadline - (now + timedelta(days=2))) < timedelta(seconds=1)
+    assert stats[str(empty_project.id)]["total_tasks"] == 0
+    assert stats[str(empty_project.id)]["next_deadline"] is None
+
+
+def test_get_all_projects_include_stats(
+    client: TestClient,
+    project_model: ProjectModel,
+    task_model: TaskModel,
+    session: Session,
+) -> None:
+    task_model.project_id = project_model.id
+    session.add_all([project_model, task_model])
+    session.commit()
+
+    plain = client.get("/projects/").json()
+    expanded = client.get("/projects/", params={"include": "stats"}).json()
+
+    assert "stats" not in plain[0]
+    assert {k: v for k, v in expanded[0].items() if k != "stats"} == plain[0]
+    assert expanded[0]["stats"]["total_tasks"] == 1
+    assert expanded[0]["stats"]["open_tasks"] == 1
+
+
+def test_get_all_projects_422_unknown_include(client: TestClient) -> None:
+    r = client.get("/projects/", params={"include": "unknown"})
+    assert r.status_code == 422
+
+
+def test_get_project_include_tasks(
+    client: TestClient,
+    project_model: ProjectModel,
+    task_model: TaskModel,
+    session: Session,
+) -> None:
+    task_model.project_id = project_model.id
+    session.add_all([project_model, task_model])
+    session.commit()
+
+    plain = client.get(f"/projects/{project_model.id}").json()
+    r = client.get(f"/projects/{project_model.id}", params={"include": "tasks"})
+
+    assert r.status_code == 200
+    expanded = r.json()
+    assert "tasks" not in plain
+    assert {k: v for k, v in expanded.items() if k != "tasks"} == plain
+    assert [t["id"] for t in expanded["tasks"]] == [str(task_model.id)]
+
+
+def test_get_all_projects_include_tasks_and_stats(
+    client: TestClient,
+    project_model: ProjectModel,
+    task_model: TaskModel,
+    session: Session,
+) -> None:
+    empty_project = ProjectModel(title="empty", deadline=project_model.deadline)
+    task_model.project_id = project_model.id
+    session.add_all([project_model, empty_project, task_model])
+    session.commit()
+
+    r = client.get("/projects/", params=[("include", "tasks"), ("include", "stats")])
+
+    assert r.status_code == 200
+    projects = {p["id"]: p for p in r.json()}
+    assert [t["id"] for t in projects[str(project_model.id)]["tasks"]] == [
+        str(task_model.id)
+    ]
+    assert projects[str(project_model.id)]["stats"]["total_tasks"] == 1
+    assert projects[str(empty_project.id)]["tasks"] == []
+
+
+def test_get_projects_by_ids(
+    client: TestClient,
+    project_model: ProjectModel,
+    task_model: TaskModel,
+    session: Session,
+) -> None:
+    other_project = ProjectModel(title="other", deadline=project_model.deadline)
+    task_model.project_id = project_model.id
+    session.add_all([project_model, other_project, task_model])
+    session.commit()
+    missing = uuid4()
+    ids = [other_project.id, missing, project_model.id]
+
+    r = client.get(
+        "/projects/",
+        params=[("ids", str(i)) for i in ids] + [("include", "tasks")],
+    )
+
+    assert r.status_code == 200
+    assert [p["id"] for p in r.json()] == [str(other_project.id), str(project_model.id)]
+    assert [len(p["tasks"]) for p in r.json()] == [0, 1]
+    assert r.headers["X-Missing-Ids"] == str(missing)
+
+
+def test_link_and_unlink_tasks_bulk(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    other_project = ProjectModel(title="other", deadline=project_model.deadline)
+    session.add_all([project_model, other_project])
+    session.commit()
+    free = TaskModel(title="free", deadline=project_model.deadline)
+    late = TaskModel(title="late", deadline=project_model.deadline + timedelta(days=1))
+    elsewhere = TaskModel(
+        title="elsewhere",
+        deadline=project_model.deadline,
+        project_id=other_project.id,
+    )
+    session.add_all([free, late, elsewhere])
+    session.commit()
+    ids = [str(free.id), str(late.id), str(elsewhere.id)]
+
+    linked = client.post(
+        f"/projects/{project_model.id}/tasks/bulk/link", json={"task_ids": ids}
+    )
+
+    assert linked.status_code == 207
+    assert [item["status"] for item in linked.json()] == [200, 422, 409]
+    assert linked.json()[0]["task"]["project_id"] == str(project_model.id)
+
+    unlinked = client.post(
+        f"/projects/{project_model.id}/tasks/bulk/unlink", json={"task_ids": ids}
+    )
+
+    assert [item["status"] for item in unlinked.json()] == [200, 200, 409]
+    session.expire_all()
+    assert session.get(TaskModel, free.id).project_id is None
+    assert session.get(TaskModel, elsewhere.id).project_id == other_project.id
+
+
+def test_link_tasks_bulk_404_project_not_found(client: TestClient) -> None:
+    r = client.post(
+        f"/projects/{uuid4()}/tasks/bulk/link", json={"task_ids": [str(uuid4())]}
+    )
+    assert r.status_code == 404
@@ -2,11 +2,30 @@ from datetime import datetime, timezone, timedelta
 from uuid import UUID, uuid4
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select
 from starlette.testclient import TestClient
 
+from app.domain.event_bus import EventBus
+from app.infrastructure.api.main import app
 from app.infrastructure.api.schemas.task_schemas import TaskCreate, TaskUpdate
+from app.infrastructure.config import Settings
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.events.overdue_engine import OverdueEngine, get_overdue_engine
 from app.infrastructure.persistence.models.models import TaskModel, ProjectModel
+from app.infrastructure.persistence.repositories.exceptions import (
+    SQLAlchemyRepositoryError,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.persistence.write_coordinator import (
+    WriteCoordinator,
+    create_writer_engine,
+    get_write_coordinator,
+)
 from tests.utils import cast_datetime_to_sqlite_format, to_task_entity
 
 
@@ -133,7 +152,7 @@ def test_update_existing_task_happy_path(
     updated_task = session.get(TaskModel, UUID(tested["id"]))
     assert updated_task.title == task_update_model.title
     for field, value in immutable_fields.items():
-        if not field == "updated_at":
+        if field not in ("updated_at", "change_seq"):
             assert getattr(updated_task, field) == value
         else:
             assert getattr(updated_task, field) > value
@@ -195,6 +214,7 @@ def test_complete_task_with_project_complete_happy_path(
     session.add(task_model)
     session.commit()
     session.refresh(task_model)
+    session.refresh(project_model, ["tasks"])
 
     assert not task_model.is_completed
     assert not project_model.is_completed
@@ -259,3 +279,282 @@ def test_reopen_assigned_task_happy_path(
     assert updated_task.project_id == updated_project.id
     assert not updated_task.is_completed
     assert not updated_project.is_completed
+
+
+def test_get_upcoming_tasks(
+    client: TestClient, task_model: TaskModel, session: Session
+) -> None:
+    overdue_engine = OverdueEngine(EventBus())
+    app.dependency_overrides[get_overdue_engine] = lambda: overdue_engine
+    session.add(task_model)
+    session.commit()
+    session.refresh(task_model)
+    overdue_engine.load(session)
+
+    r = client.get("/tasks/upcoming", params={"within": "P2D"})
+    assert r.status_code == 200
+    assert r.json() == [
+        {
+            "task_id": str(task_model.id),
+            "project_id": None,
+            "deadline": cast_datetime_to_sqlite_format(task_model.deadline),
+        }
+    ]
+
+    r = client.get("/tasks/upcoming", params={"within": "PT1M"})
+    assert r.status_code == 200
+    assert r.json() == []
+
+
+def test_get_task_changes_returns_only_rows_changed_since_token(
+    client: TestClient,
+) -> None:
+    deadline = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    ids = [
+        client.post("/tasks/", json={"title": title, "deadline": deadline}).json()["id"]
+        for title in ("first", "second", "third")
+    ]
+
+    r = client.get("/tasks/changes")
+    assert r.status_code == 200
+    initial = r.json()
+    assert [t["id"] for t in initial["tasks"]] == ids
+    assert initial["deleted_ids"] == []
+    assert not initial["has_more"]
+
+    client.patch(f"/tasks/{ids[0]}/complete")
+    client.delete(f"/tasks/{ids[1]}")
+
+    r = client.get("/tasks/changes", params={"since": initial["next_since"]})
+    delta = r.json()
+    assert [t["id"] for t in delta["tasks"]] == [ids[0]]
+    assert delta["tasks"][0]["is_completed"]
+    assert delta["deleted_ids"] == [ids[1]]
+    assert delta["next_since"] > initial["next_since"]
+
+    r = client.get("/tasks/changes", params={"since": delta["next_since"]})
+    assert r.json() == {
+        "tasks": [],
+        "deleted_ids": [],
+        "next_since": delta["next_since"],
+        "has_more": False,
+    }
+
+
+def test_get_task_changes_pages_with_limit(client: TestClient) -> None:
+    deadline = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    for title in ("first", "second", "third"):
+        client.post("/tasks/", json={"title": title, "deadline": deadline})
+
+    first_page = client.get("/tasks/changes", params={"limit": 2}).json()
+    assert [t["title"] for t in first_page["tasks"]] == ["first", "second"]
+    assert first_page["has_more"]
+
+    second_page = client.get(
+        "/tasks/changes", params={"since": first_page["next_since"], "limit": 2}
+    ).json()
+    assert [t["title"] for t in second_page["tasks"]] == ["third"]
+    assert not second_page["has_more"]
+
+
+def test_complete_task_through_write_coordinator(
+    client: TestClient,
+    task_model: TaskModel,
+    session: Session,
+    test_db,
+    test_settings: Settings,
+) -> None:
+    session.add(task_model)
+    session.commit()
+    test_settings.WRITE_COORDINATOR_ENABLED = True
+    coordinator = WriteCoordinator(
+        create_writer_engine(test_db.url.render_as_string(hide_password=False))
+    )
+    app.dependency_overrides[get_write_coordinator] = lambda: coordinator
+    coordinator.start()
+    try:
+        r = client.patch(f"/tasks/{task_model.id}/complete")
+        missing = client.patch(f"/tasks/{uuid4()}/complete")
+    finally:
+        coordinator.stop()
+
+    assert r.status_code == 200
+    assert r.json()["is_completed"]
+    assert missing.status_code == 404
+    session.expire_all()
+    assert session.get(TaskModel, task_model.id).is_completed
+
+
+def test_metrics_exposes_registry_snapshot(client: TestClient) -> None:
+    get_metrics_registry().counter("test.metrics_endpoint").inc()
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.json()["test.metrics_endpoint"] >= 1
+
+
+def test_get_tasks_by_ids_preserves_order_and_reports_missing(
+    client: TestClient, session: Session
+) -> None:
+    tasks = [
+        TaskModel(title=f"task-{i}", deadline=datetime.now(timezone.utc))
+        for i in range(3)
+    ]
+    session.add_all(tasks)
+    session.commit()
+    missing = uuid4()
+    ids = [tasks[2].id, missing, tasks[0].id]
+
+    r = client.get("/tasks/", params=[("ids", str(i)) for i in ids])
+
+    assert r.status_code == 200
+    assert [t["id"] for t in r.json()] == [str(tasks[2].id), str(tasks[0].id)]
+    assert r.headers["X-Missing-Ids"] == str(missing)
+
+
+def test_get_tasks_by_ids_422_when_combined_with_filters(client: TestClient) -> None:
+    r = client.get("/tasks/", params={"ids": str(uuid4()), "is_completed": True})
+    assert r.status_code == 422
+
+
+def test_create_tasks_batch_reports_per_item_results(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    session.add(project_model)
+    session.commit()
+    now = datetime.now(timezone.utc)
+    items = [
+        {"title": "free", "deadline": (now + timedelta(days=1)).isoformat()},
+        {
+            "title": "linked",
+            "deadline": (now + timedelta(days=1)).isoformat(),
+            "project_id": str(project_model.id),
+        },
+        {"title": "late", "deadline": (now - timedelta(days=1)).isoformat()},
+        {
+            "title": "after project",
+            "deadline": (project_model.deadline + timedelta(days=1)).isoformat(),
+            "project_id": str(project_model.id),
+        },
+        {
+            "title": "unknown project",
+            "deadline": (now + timedelta(days=1)).isoformat(),
+            "project_id": str(uuid4()),
+        },
+    ]
+    since = client.get("/tasks/changes").json()["next_since"]
+
+    r = client.post("/tasks/batch", json=items)
+
+    assert r.status_code == 207
+    results = r.json()
+    assert [item["status"] for item in results] == [201, 201, 422, 422, 404]
+    assert results[1]["task"]["project_id"] == str(project_model.id)
+    assert results[2]["error"] == "The task deadline has passed"
+    created = {results[0]["task"]["id"], results[1]["task"]["id"]}
+    assert {t.title for t in session.exec(select(TaskModel)).all()} == {
+        "free",
+        "linked",
+    }
+    changes = client.get("/tasks/changes", params={"since": since}).json()
+    assert {t["id"] for t in changes["tasks"]} == created
+
+
+def test_create_tasks_batch_413_when_too_large(
+    client: TestClient, test_settings: Settings
+) -> None:
+    test_settings.TASK_BATCH_MAX_SIZE = 1
+    item = {
+        "title": "t",
+        "deadline": (datetime.now(timezone.utc) + timedelta(days=1)).isoformat(),
+    }
+
+    r = client.post("/tasks/batch", json=[item, item])
+
+    assert r.status_code == 413
+
+
+def test_complete_tasks_bulk_auto_completes_project_once(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    session.add(project_model)
+    session.commit()
+    tasks = [
+        TaskModel(
+            title=f"task-{i}",
+            deadline=project_model.deadline,
+            project_id=project_model.id,
+        )
+        for i in range(3)
+    ]
+    session.add_all(tasks)
+    session.commit()
+    missing = uuid4()
+
+    r = client.post(
+        "/tasks/bulk/complete",
+        json={"task_ids": [str(t.id) for t in tasks] + [str(missing)]},
+    )
+
+    assert r.status_code == 207
+    assert [item["status"] for item in r.json()] == [200, 200, 200, 404]
+    assert all(item["task"]["is_completed"] for item in r.json()[:3])
+    session.expire_all()
+    assert all(t.is_completed for t in session.exec(select(TaskModel)).all())
+    assert session.get(ProjectModel, project_model.id).is_completed
+
+
+@pytest.mark.parametrize(
+    "repository", [SQLAlchemyTaskRepository, SQLAlchemyProjectRepository]
+)
+def test_complete_tasks_bulk_writes_nothing_when_an_update_fails(
+    client: TestClient,
+    project_model: ProjectModel,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    repository: type,
+) -> None:
+    session.add(project_model)
+    session.commit()
+    task = TaskModel(
+        title="task", deadline=project_model.deadline, project_id=project_model.id
+    )
+    session.add(task)
+    session.commit()
+
+    def fail(self, entities, commit=True):
+        raise SQLAlchemyRepositoryError("Failed to update")
+
+    monkeypatch.setattr(repository, "update_many", fail)
+
+    r = client.post("/tasks/bulk/complete", json={"task_ids": [str(task.id)]})
+
+    assert r.status_code == 500
+    # Discard what the request left uncommitted, as closing its session would.
+    session.rollback()
+    assert not session.get(ProjectModel, project_model.id).is_completed
+    assert not session.get(TaskModel, task.id).is_completed
+
+
+def test_reopen_tasks_bulk_reopens_completed_project(
+    client: TestClient, project_model: ProjectModel, session: Session
+) -> None:
+    project_model.is_completed = True
+    session.add(project_model)
+    session.commit()
+    task = TaskModel(
+        title="done",
+        deadline=project_model.deadline,
+        project_id=project_model.id,
+        is_completed=True,
+    )
+    session.add(task)
+    session.commit()
+
+    r = client.post("/tasks/bulk/reopen", json={"task_ids": [str(task.id)]})
+
+    assert r.status_code == 207
+    assert r.json()[0]["task"]["is_completed"] is False
+    session.expire_all()
+    assert not session.get(TaskModel, task.id).is_completed
+    assert not session.get(ProjectModel, project_model.id).is_completed
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.infrastructure.api.admission import AdmissionControlMiddleware, AdmissionLimits
+from app.infrastructure.persistence.write_coordinator import (
+    WriteCoordinator,
+    create_writer_engine,
+)
+
+
+@pytest.fixture
+def executors() -> dict[str, SimpleNamespace]:
+    return {
+        "read": SimpleNamespace(queue_wait=0.0),
+        "write": SimpleNamespace(queue_wait=0.0),
+    }
+
+
+@pytest.fixture
+def coordinators() -> dict[str, WriteCoordinator | None]:
+    return {"write": None}
+
+
+@pytest.fixture
+def release() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture
+def guarded_app(executors, coordinators, release) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def read_items():
+        return []
+
+    @app.post("/items")
+    async def write_item():
+        await release.wait()
+        return {}
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        read_limits=AdmissionLimits(max_in_flight=10, max_queue_wait=1.0),
+        write_limits=AdmissionLimits(max_in_flight=1, max_queue_wait=0.5),
+        retry_after=3,
+        read_executor=lambda: executors["read"],
+        write_executor=lambda: executors["write"],
+        write_coordinator=lambda: coordinators["write"],
+    )
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://t")
+
+
+def test_writes_over_in_flight_limit_are_shed(guarded_app, release) -> None:
+    async def scenario():
+        async with _client(guarded_app) as client:
+            admitted = asyncio.ensure_future(client.post("/items"))
+            await asyncio.sleep(0.01)
+            rejected = await client.post("/items")
+            read = await client.get("/items")
+            release.set()
+            return await admitted, rejected, read
+
+    admitted, rejected, read = asyncio.run(scenario())
+
+    assert admitted.status_code == 200
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "3"
+    assert read.status_code == 200
+
+
+def test_requests_are_shed_when_executor_queue_wait_is_too_long(
+    guarded_app, executors
+) -> None:
+    executors["read"].queue_wait = 1.5
+
+    async def scenario():
+        async with _client(guarded_app) as client:
+            return await client.get("/items")
+
+    assert asyncio.run(scenario()).status_code == 503
+
+
+def test_writes_are_shed_when_write_coordinator_queue_wait_is_too_long(
+    guarded_app, coordinators, release, test_db
+) -> None:
+    engine = create_writer_engine(test_db.url.render_as_string(hide_password=False))
+    coordinator = WriteCoordinator(engine, max_delay=0)
+    coordinator.start()
+    coordinators["write"] = coordinator
+    started, unblock = threading.Event(), threading.Event()
+
+    def hold_writer(_session) -> None:
+        started.set()
+        unblock.wait()
+
+    async def scenario():
+        async with _client(guarded_app) as client:
+            return await client.post("/items")
+
+    release.set()
+    try:
+        coordinator.submit(hold_writer)
+        assert started.wait(5)
+        queued = coordinator.submit(lambda _session: None)
+        time.sleep(0.6)
+
+        assert asyncio.run(scenario()).status_code == 503
+
+        unblock.set()
+        queued.result(timeout=5)
+        assert asyncio.run(scenario()).status_code == 200
+    finally:
+        unblock.set()
+        coordinator.stop()
+        engine.dispose()
@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from app.infrastructure.api.deadline import RequestDeadlineMiddleware
+from app.infrastructure.persistence.cancellation import current_token
+
+
+def _app(events: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow():
+        token = current_token()
+        try:
+            await asyncio.sleep(5)
+        finally:
+            events.append(token.should_abort())
+        return {}
+
+    @app.get("/fast")
+    async def fast():
+        return {"remaining": current_token().remaining()}
+
+    app.add_middleware(
+        RequestDeadlineMiddleware,
+        default_timeout=10.0,
+        route_timeouts={"GET /slow": 0.05},
+    )
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        return await client.get(path)
+
+
+def test_route_deadline_returns_504_and_cancels_work() -> None:
+    events = []
+
+    response = asyncio.run(_get(_app(events), "/slow"))
+
+    assert response.status_code == 504
+    assert events == [True]
+
+
+def test_other_routes_use_default_deadline() -> None:
+    response = asyncio.run(_get(_app([]), "/fast"))
+
+    assert response.status_code == 200
+    assert 9 < response.json()["remaining"] <= 10
+
+
+def test_client_disconnect_cancels_request() -> None:
+    events = []
+    app = _app(events)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/slow",
+        "raw_path": b"/slow",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    }
+    inbox = [
+        {"type": "http.request", "body": b"", "more_body": False},
+        {"type": "http.disconnect"},
+    ]
+
+    async def receive():
+        await asyncio.sleep(0.01)
+        return inbox.pop(0)
+
+    async def send(message):
+        events.append(message["type"])
+
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), 1))
+
+    assert events == [True]
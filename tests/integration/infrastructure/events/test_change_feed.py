@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session
+
+from app.infrastructure.events.change_feed import RESET_EVENT, ChangeFeed
+from app.infrastructure.persistence.change_tracking import (
+    add_change_listener,
+    remove_change_listener,
+)
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+
+
+@pytest.fixture
+def change_feed() -> ChangeFeed:
+    change_feed = ChangeFeed(history_size=3)
+    add_change_listener(change_feed.apply_changes)
+    yield change_feed
+    remove_change_listener(change_feed.apply_changes)
+    change_feed.close()
+
+
+def _deadline() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=1)
+
+
+async def _collect(stream, count: int) -> list:
+    return [await anext(stream) for _ in range(count)]
+
+
+def test_stream_receives_task_lifecycle(
+    session: Session, change_feed: ChangeFeed
+) -> None:
+    async def scenario() -> list:
+        change_feed.bind(asyncio.get_running_loop())
+        stream = change_feed.subscribe()
+        pending = asyncio.ensure_future(_collect(stream, 5))
+        await asyncio.sleep(0)
+
+        project = ProjectModel(title="project", deadline=_deadline())
+        task = TaskModel(title="task", deadline=_deadline())
+        session.add_all([project, task])
+        session.commit()
+        task.project_id = project.id
+        session.commit()
+        task.is_completed = True
+        session.commit()
+        session.delete(task)
+        session.commit()
+        return await asyncio.wait_for(pending, 1)
+
+    notifications = asyncio.run(scenario())
+
+    assert [n.type for n in notifications] == [
+        "project.created",
+        "task.created",
+        "task.linked",
+        "task.completed",
+        "task.deleted",
+    ]
+    assert [n.id for n in notifications] == [1, 2, 3, 4, 5]
+
+
+def test_stream_filters_by_project(session: Session, change_feed: ChangeFeed) -> None:
+    project = ProjectModel(title="project", deadline=_deadline())
+    session.add(project)
+    session.commit()
+    project_id = project.id
+
+    async def scenario() -> list:
+        change_feed.bind(asyncio.get_running_loop())
+        stream = change_feed.subscribe(project_id=project_id)
+        pending = asyncio.ensure_future(_collect(stream, 2))
+        await asyncio.sleep(0)
+
+        task = TaskModel(title="mine", deadline=_deadline(), project_id=project_id)
+        session.add_all([TaskModel(title="other", deadline=_deadline()), task])
+        session.commit()
+        session.refresh(task)
+        task.project_id = None
+        session.commit()
+        return await asyncio.wait_for(pending, 1)
+
+    notifications = asyncio.run(scenario())
+
+    assert [(n.type, n.data["title"]) for n in notifications] == [
+        ("task.created", "mine"),
+        ("task.unlinked", "mine"),
+    ]
+
+
+def test_resume_replays_missed_notifications(
+    session: Session, change_feed: ChangeFeed
+) -> None:
+    async def scenario() -> list:
+        change_feed.bind(asyncio.get_running_loop())
+        for title in ("first", "second", "third"):
+            session.add(TaskModel(title=title, deadline=_deadline()))
+            session.commit()
+        await asyncio.sleep(0)
+        return await _collect(change_feed.subscribe(last_event_id=1), 2)
+
+    notifications = asyncio.run(scenario())
+
+    assert [n.data["title"] for n in notifications] == ["second", "third"]
+
+
+def test_resume_past_retained_history_requests_reset(
+    session: Session, change_feed: ChangeFeed
+) -> None:
+    async def scenario() -> list:
+        change_feed.bind(asyncio.get_running_loop())
+        for title in ("first", "second", "third", "fourth", "fifth"):
+            session.add(TaskModel(title=title, deadline=_deadline()))
+            session.commit()
+        await asyncio.sleep(0)
+        return await _collect(change_feed.subscribe(last_event_id=1), 4)
+
+    notifications = asyncio.run(scenario())
+
+    assert notifications[0].type == RESET_EVENT
+    assert [n.data["title"] for n in notifications[1:]] == [
+        "third",
+        "fourth",
+        "fifth",
+    ]
+
+
+def test_stream_emits_heartbeat_when_idle(change_feed: ChangeFeed) -> None:
+    async def scenario():
+        change_feed.bind(asyncio.get_running_loop())
+        return await anext(change_feed.subscribe(heartbeat=0.01))
+
+    assert asyncio.run(scenario()) is None
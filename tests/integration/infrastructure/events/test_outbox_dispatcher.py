@@ -0,0 +1,226 @@
+from datetime import datetime, timezone, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session, select
+
+from app.domain.events import ProjectDeadlineChangedEvent
+from app.domain.clock import FixedClock
+from app.domain.event_bus import EventBus
+from app.infrastructure.events.handlers import register_subscribers
+from app.infrastructure.events.outbox_dispatcher import OutboxDispatcher
+from app.infrastructure.persistence.models.models import (
+    OutboxMessageModel,
+    ProjectModel,
+    TaskModel,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_event_outbox import (
+    SQLAlchemyEventOutbox,
+)
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+
+@pytest.fixture
+def project(session: Session) -> ProjectModel:
+    project = ProjectModel(
+        title="project", deadline=datetime.now(timezone.utc) + timedelta(days=10)
+    )
+    session.add(project)
+    session.commit()
+    session.refresh(project)
+    return project
+
+
+def _subscribing(handler: Mock):
+    def register(event_bus: EventBus, _session: Session) -> None:
+        event_bus.subscribe(ProjectDeadlineChangedEvent, handler)
+
+    return register
+
+
+def _stage_deadline_change(
+    session: Session, project: ProjectModel, new_deadline: datetime
+) -> None:
+    event = ProjectDeadlineChangedEvent(
+        occurred_at=datetime.now(timezone.utc),
+        project_id=project.id,
+        old_deadline=project.deadline,
+        new_deadline=new_deadline,
+    )
+    SQLAlchemyEventOutbox(session).add([event])
+    session.commit()
+
+
+def test_dispatch_adjusts_task_deadlines(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    task = TaskModel(
+        title="task",
+        deadline=datetime.now(timezone.utc) + timedelta(days=9),
+        project_id=project.id,
+    )
+    session.add(task)
+    session.commit()
+    new_deadline = datetime.now(timezone.utc) + timedelta(days=2)
+    _stage_deadline_change(session, project, new_deadline)
+    dispatcher = OutboxDispatcher(test_db, register_subscribers)
+
+    assert dispatcher.dispatch_batch() == 1
+
+    session.expire_all()
+    assert session.get(TaskModel, task.id).deadline == new_deadline
+    message = session.exec(select(OutboxMessageModel)).one()
+    assert message.processed_at is not None
+    assert dispatcher.dispatch_batch() == 0
+
+
+def test_failed_handler_is_retried_with_backoff(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    handler = Mock(side_effect=RuntimeError("boom"))
+    _stage_deadline_change(
+        session, project, datetime.now(timezone.utc) + timedelta(days=2)
+    )
+    dispatcher = OutboxDispatcher(test_db, _subscribing(handler), retry_backoff=60)
+
+    assert dispatcher.dispatch_batch() == 1
+    assert dispatcher.dispatch_batch() == 0
+
+    message = session.exec(select(OutboxMessageModel)).one()
+    assert message.attempts == 1
+    assert message.processed_at is None
+    assert "boom" in message.last_error
+    assert message.available_at > datetime.now(timezone.utc) + timedelta(seconds=30)
+
+
+def test_failed_handler_work_is_rolled_back(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    task = TaskModel(
+        title="task",
+        deadline=datetime.now(timezone.utc) + timedelta(days=9),
+        project_id=project.id,
+    )
+    session.add(task)
+    session.commit()
+    original_deadline = task.deadline
+
+    def register(event_bus: EventBus, handler_session: Session) -> None:
+        repository = SQLAlchemyTaskRepository(handler_session)
+
+        def adjust_then_fail(event: ProjectDeadlineChangedEvent) -> None:
+            (adjusted,) = repository.get_by_project_id(event.project_id)
+            adjusted.deadline = event.new_deadline
+            repository.update(adjusted)
+            raise RuntimeError("boom")
+
+        event_bus.subscribe(ProjectDeadlineChangedEvent, adjust_then_fail)
+
+    _stage_deadline_change(
+        session, project, datetime.now(timezone.utc) + timedelta(days=2)
+    )
+
+    assert OutboxDispatcher(test_db, register).dispatch_batch() == 1
+
+    session.expire_all()
+    assert session.get(TaskModel, task.id).deadline == original_deadline
+    assert session.exec(select(OutboxMessageModel)).one().attempts == 1
+
+
+def test_message_is_dead_lettered_after_max_attempts(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    handler = Mock(side_effect=RuntimeError("boom"))
+    _stage_deadline_change(
+        session, project, datetime.now(timezone.utc) + timedelta(days=2)
+    )
+    dispatcher = OutboxDispatcher(
+        test_db,
+        _subscribing(handler),
+        max_attempts=2,
+        retry_backoff=0,
+    )
+
+    dispatcher.dispatch_batch()
+    dispatcher.dispatch_batch()
+
+    assert handler.call_count == 2
+    message = session.exec(select(OutboxMessageModel)).one()
+    assert message.failed_at is not None
+    assert dispatcher.dispatch_batch() == 0
+
+
+def test_deadline_changes_within_window_are_coalesced(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    handler = Mock()
+    original_deadline = project.deadline
+    deadlines = [
+        datetime.now(timezone.utc) + timedelta(days=days) for days in (5, 4, 3)
+    ]
+    for deadline in deadlines:
+        _stage_deadline_change(session, project, deadline)
+        project.deadline = deadline
+    window = timedelta(minutes=1)
+    dispatcher = OutboxDispatcher(
+        test_db, _subscribing(handler), coalesce_window=window
+    )
+
+    assert dispatcher.dispatch_batch() == 0
+    handler.assert_not_called()
+
+    settled = FixedClock(datetime.now(timezone.utc) + 2 * window)
+    dispatcher = OutboxDispatcher(
+        test_db, _subscribing(handler), coalesce_window=window, clock=settled
+    )
+    assert dispatcher.dispatch_batch() == 3
+    handler.assert_called_once()
+    (event,) = handler.call_args.args
+    assert event.old_deadline == original_deadline
+    assert event.new_deadline == deadlines[-1]
+
+
+def test_claimed_messages_are_skipped_by_other_dispatchers(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    _stage_deadline_change(
+        session, project, datetime.now(timezone.utc) + timedelta(days=2)
+    )
+    other = OutboxDispatcher(test_db, _subscribing(Mock()))
+    dispatched_by_other = []
+    handler = Mock(
+        side_effect=lambda _: dispatched_by_other.append(other.dispatch_batch())
+    )
+    dispatcher = OutboxDispatcher(test_db, _subscribing(handler))
+
+    assert dispatcher.dispatch_batch() == 1
+
+    handler.assert_called_once()
+    assert dispatched_by_other == [0]
+    message = session.exec(select(OutboxMessageModel)).one()
+    assert message.processed_at is not None
+    assert message.claimed_by is None
+
+
+def test_expired_claim_is_taken_over(
+    test_db: Engine, session: Session, project: ProjectModel
+) -> None:
+    _stage_deadline_change(
+        session, project, datetime.now(timezone.utc) + timedelta(days=2)
+    )
+    message = session.exec(select(OutboxMessageModel)).one()
+    message.claimed_by = "crashed"
+    message.claimed_until = datetime.now(timezone.utc) + timedelta(minutes=1)
+    session.add(message)
+    session.commit()
+    handler = Mock()
+
+    assert OutboxDispatcher(test_db, _subscribing(handler)).dispatch_batch() == 0
+
+    later = FixedClock(datetime.now(timezone.utc) + timedelta(minutes=2))
+    dispatcher = OutboxDispatcher(test_db, _subscribing(handler), clock=later)
+    assert dispatcher.dispatch_batch() == 1
+    handler.assert_called_once()
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlmodel import Session
+
+from app.domain.clock import Clock
+from app.domain.event_bus import EventBus
+from app.domain.events import TaskBecameOverdueEvent
+from app.infrastructure.events.overdue_engine import OverdueEngine
+from app.infrastructure.persistence.change_tracking import (
+    add_change_listener,
+    remove_change_listener,
+)
+from app.infrastructure.persistence.models.models import TaskModel
+
+
+class MovableClock(Clock):
+    def __init__(self, instant: datetime) -> None:
+        self.instant = instant
+
+    def now(self) -> datetime:
+        return self.instant
+
+
+@pytest.fixture
+def clock() -> MovableClock:
+    return MovableClock(datetime.now(timezone.utc))
+
+
+@pytest.fixture
+def subscriber() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def overdue_engine(clock: MovableClock, subscriber: Mock) -> OverdueEngine:
+    event_bus = EventBus()
+    event_bus.subscribe(TaskBecameOverdueEvent, subscriber)
+    overdue_engine = OverdueEngine(event_bus, clock)
+    add_change_listener(overdue_engine.apply_changes)
+    yield overdue_engine
+    remove_change_listener(overdue_engine.apply_changes)
+
+
+def _add_task(session: Session, deadline: datetime, **kwargs) -> TaskModel:
+    task = TaskModel(title="task", deadline=deadline, **kwargs)
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+    return task
+
+
+def test_load_tracks_only_open_future_deadlines(
+    session: Session, overdue_engine: OverdueEngine, clock: MovableClock
+) -> None:
+    remove_change_listener(overdue_engine.apply_changes)
+    open_task = _add_task(session, clock.instant + timedelta(hours=1))
+    _add_task(session, clock.instant + timedelta(hours=2), is_completed=True)
+    _add_task(session, clock.instant - timedelta(hours=1))
+
+    overdue_engine.load(session)
+
+    upcoming = overdue_engine.upcoming(within=timedelta(days=1))
+    assert [entry.task_id for entry in upcoming] == [open_task.id]
+
+
+def test_upcoming_is_ordered_and_bounded_by_horizon(
+    session: Session, overdue_engine: OverdueEngine, clock: MovableClock
+) -> None:
+    tasks = [
+        _add_task(session, clock.instant + timedelta(hours=hours))
+        for hours in (5, 1, 30, 3, 2)
+    ]
+
+    upcoming = overdue_engine.upcoming(within=timedelta(hours=6))
+
+    assert [entry.task_id for entry in upcoming] == [
+        tasks[1].id,
+        tasks[4].id,
+        tasks[3].id,
+        tasks[0].id,
+    ]
+    assert len(overdue_engine.upcoming(within=timedelta(hours=6), limit=2)) == 2
+
+
+def test_task_writes_update_tracked_deadlines(
+    session: Session, overdue_engine: OverdueEngine, clock: MovableClock
+) -> None:
+    task = _add_task(session, clock.instant + timedelta(hours=1))
+    other = _add_task(session, clock.instant + timedelta(hours=2))
+
+    task.deadline = clock.instant + timedelta(hours=3)
+    session.commit()
+    other.is_completed = True
+    session.commit()
+
+    upcoming = overdue_engine.upcoming(within=timedelta(days=1))
+    assert [(entry.task_id, entry.deadline) for entry in upcoming] == [
+        (task.id, clock.instant + timedelta(hours=3))
+    ]
+
+    session.delete(task)
+    session.commit()
+    assert overdue_engine.upcoming(within=timedelta(days=1)) == []
+
+
+def test_updates_keeping_the_deadline_list_the_task_once(
+    session: Session, overdue_engine: OverdueEngine, clock: MovableClock
+) -> None:
+    task = _add_task(session, clock.instant + timedelta(hours=1))
+
+    task.title = "renamed"
+    session.commit()
+    task.is_completed = True
+    session.commit()
+    task.is_completed = False
+    session.commit()
+
+    upcoming = overdue_engine.upcoming(within=timedelta(days=1))
+    assert [entry.task_id for entry in upcoming] == [task.id]
+
+
+def test_rolled_back_writes_are_ignored(
+    session: Session, overdue_engine: OverdueEngine, clock: MovableClock
+) -> None:
+    session.add(TaskModel(title="task", deadline=clock.instant + timedelta(hours=1)))
+    session.flush()
+    session.rollback()
+
+    assert overdue_engine.upcoming(within=timedelta(days=1)) == []
+
+
+def test_emit_due_publishes_event_once_when_deadline_passes(
+    session: Session,
+    overdue_engine: OverdueEngine,
+    clock: MovableClock,
+    subscriber: Mock,
+) -> None:
+    task = _add_task(session, clock.instant + timedelta(minutes=5))
+    _add_task(session, clock.instant + timedelta(minutes=10))
+
+    assert overdue_engine.emit_due() == []
+
+    clock.instant += timedelta(minutes=6)
+    events = overdue_engine.emit_due()
+
+    assert [event.task_id for event in events] == [task.id]
+    subscriber.assert_called_once_with(events[0])
+    assert overdue_engine.emit_due() == []
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+import app.infrastructure.persistence.engine  # noqa: F401
+from app.infrastructure.persistence.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+
+SLOW_QUERY = text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c "
+    "WHERE x < 100000000) SELECT count(*) FROM c"
+)
+
+
+@pytest.fixture
+def token_scope():
+    resets = []
+
+    def enter(token: CancellationToken) -> CancellationToken:
+        resets.append(set_current_token(token))
+        return token
+
+    yield enter
+    for reset in reversed(resets):
+        reset_current_token(reset)
+
+
+def test_statement_is_interrupted_at_deadline(test_db, token_scope) -> None:
+    token_scope(CancellationToken(timeout=0.05))
+
+    started = time.monotonic()
+    with test_db.connect() as connection:
+        with pytest.raises(OperationalError, match="interrupted"):
+            connection.execute(SLOW_QUERY)
+
+    assert time.monotonic() - started < 2
+
+
+def test_statement_is_interrupted_when_cancelled(test_db, token_scope) -> None:
+    token = token_scope(CancellationToken())
+    token.cancel()
+
+    with test_db.connect() as connection:
+        with pytest.raises(OperationalError, match="interrupted"):
+            connection.execute(SLOW_QUERY)
+
+
+def test_statements_without_token_are_not_interrupted(test_db) -> None:
+    with test_db.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+
+from app.infrastructure.persistence.engine import create_read_only_engine
+from app.infrastructure.persistence.models.models import TaskModel
+
+
+@pytest.fixture
+def read_engine(test_db):
+    database = test_db.url.database
+    engine = create_read_only_engine(f"sqlite:///file:{database}?mode=ro&uri=true")
+    yield engine
+    engine.dispose()
+
+
+def _task(title: str) -> TaskModel:
+    return TaskModel(title=title, deadline=datetime.now(timezone.utc) + timedelta(1))
+
+
+def test_read_only_engine_reads_committed_rows(session: Session, read_engine) -> None:
+    session.add(_task("task"))
+    session.commit()
+
+    with Session(read_engine) as read_session:
+        titles = read_session.exec(select(TaskModel.title)).all()
+
+    assert titles == ["task"]
+
+
+def test_read_only_engine_rejects_writes(read_engine) -> None:
+    with Session(read_engine) as read_session:
+        read_session.add(_task("task"))
+        with pytest.raises(OperationalError, match="readonly"):
+            read_session.commit()
+
+
+def test_reads_are_not_blocked_by_open_write_transaction(
+    test_db, session: Session, read_engine
+) -> None:
+    with test_db.connect() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+    session.add(_task("committed"))
+    session.commit()
+
+    session.add(_task("in flight"))
+    session.flush()
+    with Session(read_engine) as read_session:
+        titles = read_session.exec(select(TaskModel.title)).all()
+
+    assert titles == ["committed"]
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import inspect
+from sqlmodel import Session
+
+from app.infrastructure.persistence.migrations import upgrade_schema
+from app.infrastructure.persistence.models.models import TaskModel
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+
+def _downgrade_to_initial_schema(engine) -> None:
+    with engine.begin() as connection:
+        for index in ("ix_taskmodel_change_seq", "ix_taskmodel_open_deadline"):
+            connection.exec_driver_sql(f"DROP INDEX {index}")
+        connection.exec_driver_sql("ALTER TABLE taskmodel DROP COLUMN change_seq")
+        connection.exec_driver_sql("DROP TABLE changesequencemodel")
+        for column in ("claimed_by", "claimed_until"):
+            connection.exec_driver_sql(
+                f"ALTER TABLE outboxmessagemodel DROP COLUMN {column}"
+            )
+
+
+def test_upgrade_adds_change_tracking_to_existing_tasks(test_db) -> None:
+    deadline = datetime.now(timezone.utc) + timedelta(days=1)
+    with Session(test_db) as session:
+        session.add_all(
+            TaskModel(title=f"task-{i}", deadline=deadline) for i in range(3)
+        )
+        session.commit()
+    _downgrade_to_initial_schema(test_db)
+
+    # create_all only restores the dropped table; the rest is the migration's job.
+    TaskModel.metadata.create_all(test_db)
+    upgrade_schema(test_db)
+
+    inspector = inspect(test_db)
+    assert "change_seq" in {c["name"] for c in inspector.get_columns("taskmodel")}
+    assert {"claimed_by", "claimed_until"} <= {
+        c["name"] for c in inspector.get_columns("outboxmessagemodel")
+    }
+    assert {"ix_taskmodel_change_seq", "ix_taskmodel_open_deadline"} <= {
+        i["name"] for i in inspector.get_indexes("taskmodel")
+    }
+    with Session(test_db) as session:
+        changes = SQLAlchemyTaskRepository(session).get_changes_since(0, limit=10)
+    assert sorted(t.title for t in changes.tasks) == ["task-0", "task-1", "task-2"]
+    assert changes.last_seq == 3
+
+
+def test_upgrade_is_a_no_op_on_a_current_schema(test_db) -> None:
+    upgrade_schema(test_db)
+    upgrade_schema(test_db)
+
+    with Session(test_db) as session:
+        changes = SQLAlchemyTaskRepository(session).get_changes_since(0, limit=10)
+    assert changes.tasks == []
+    assert changes.last_seq == 0
@@ -0,0 +1,99 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.infrastructure.metrics import Histogram, get_metrics_registry
+from app.infrastructure.persistence.pool_metrics import (
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+
+
+@pytest.fixture
+def pool_name() -> str:
+    return f"test-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def engine(test_db, pool_name: str):
+    engine = create_engine(
+        test_db.url,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=pool_name,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def _metrics(pool_name: str) -> dict:
+    prefix = f"db.pool.{pool_name}."
+    return {
+        name.removeprefix(prefix): value
+        for name, value in get_metrics_registry().snapshot().items()
+        if name.startswith(prefix)
+    }
+
+
+def test_pool_records_checkouts_usage_and_overflow(engine, pool_name: str) -> None:
+    first = engine.connect()
+    second = engine.connect()
+
+    metrics = _metrics(pool_name)
+    assert metrics["in_use"] == 2
+    assert metrics["overflow_connections"] == 1
+    assert metrics["checkout_seconds"]["count"] == 2
+
+    second.close()
+    first.close()
+    assert _metrics(pool_name)["in_use"] == 0
+
+
+def test_pool_records_exhaustion_and_connection_lifetime(
+    engine, pool_name: str
+) -> None:
+    connections = [engine.connect(), engine.connect()]
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    for connection in connections:
+        connection.close()
+    engine.dispose()
+
+    metrics = _metrics(pool_name)
+    assert metrics["checkout_failures"] == 1
+    assert metrics["connection_lifetime_seconds"]["count"] == 2
+
+
+def test_engine_counts_lock_timeouts(test_db, pool_name: str) -> None:
+    engine = create_engine(
+        test_db.url,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=pool_name,
+        connect_args={"timeout": 0},
+    )
+    instrument_engine(engine)
+    with engine.connect() as writer, engine.connect() as blocked:
+        writer.exec_driver_sql("BEGIN IMMEDIATE")
+        with pytest.raises(OperationalError):
+            blocked.exec_driver_sql("BEGIN IMMEDIATE")
+    engine.dispose()
+
+    assert _metrics(pool_name)["locked_errors"] == 1
+
+
+def test_histogram_snapshot_is_cumulative() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 5.0):
+        histogram.observe(value)
+
+    assert histogram.snapshot() == {
+        "count": 4,
+        "sum": pytest.approx(6.25),
+        "buckets": {"0.1": 1, "1.0": 3, "+Inf": 4},
+    }
@@ -0,0 +1,90 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import Session, select
+
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+from app.infrastructure.persistence.repositories.sqlalchemy_project_repository import (
+    SQLAlchemyProjectRepository,
+)
+
+
+@pytest.fixture
+def projects_with_tasks(session: Session) -> list[ProjectModel]:
+    projects = [ProjectModel(title=f"project-{i}") for i in range(5)]
+    session.add_all(projects)
+    session.commit()
+    session.add_all(
+        TaskModel(title=f"task-{i}", project_id=project.id)
+        for project in projects
+        for i in range(3)
+    )
+    session.commit()
+    return projects
+
+
+def test_get_all_with_tasks_loads_tasks_in_one_extra_query(
+    test_db, session: Session, projects_with_tasks: list[ProjectModel]
+) -> None:
+    statements = []
+    event.listen(
+        test_db,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_: statements.append(statement),
+    )
+    session.expunge_all()
+
+    result = SQLAlchemyProjectRepository(session).get_all_with_tasks()
+
+    assert [len(p.tasks) for p in result] == [3] * 5
+    assert len([s for s in statements if s.lstrip().startswith("SELECT")]) == 2
+
+
+def test_lazy_loading_tasks_raises(
+    session: Session, projects_with_tasks: list[ProjectModel]
+) -> None:
+    session.expunge_all()
+    project = session.exec(select(ProjectModel)).first()
+
+    with pytest.raises(InvalidRequestError):
+        _ = project.tasks
+
+
+def test_delete_unlinks_tasks_without_loading_relationship(
+    session: Session, projects_with_tasks: list[ProjectModel]
+) -> None:
+    project_id = projects_with_tasks[0].id
+    session.expunge_all()
+
+    SQLAlchemyProjectRepository(session).delete(project_id)
+
+    assert session.get(ProjectModel, project_id) is None
+    assert (
+        session.exec(select(TaskModel).where(TaskModel.project_id == project_id)).all()
+        == []
+    )
+    assert (
+        len(session.exec(select(TaskModel).where(TaskModel.project_id.is_(None))).all())
+        == 3
+    )
+
+
+def test_get_many_chunks_ids_and_reports_missing(
+    test_db, session: Session, projects_with_tasks: list[ProjectModel]
+) -> None:
+    first, second = projects_with_tasks[3].id, projects_with_tasks[1].id
+    missing = [uuid4() for _ in range(1200)]
+    statements = []
+    event.listen(
+        test_db,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_: statements.append(statement),
+    )
+
+    lookup = SQLAlchemyProjectRepository(session).get_many([first, *missing, second])
+
+    assert [p.id for p in lookup.projects] == [first, second]
+    assert lookup.missing_ids == missing
+    assert len(statements) == 3
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from statistics import median
+
+from sqlalchemy import create_engine, func
+from sqlmodel import Session, SQLModel, select
+
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+from app.infrastructure.persistence.seeding import SeedConfig, seed_database
+
+
+def test_seed_database_generates_a_consistent_heavy_tailed_dataset(
+    test_db,
+) -> None:
+    config = SeedConfig(tasks=3000, projects=100, batch_size=500, seed=7)
+    progress = []
+
+    summary = seed_database(test_db, config, on_batch=progress.append)
+
+    assert progress == [500, 1000, 1500, 2000, 2500, 3000]
+    with Session(test_db) as session:
+        assert session.exec(select(func.count(TaskModel.id))).one() == 3000
+        assert session.exec(select(func.count(ProjectModel.id))).one() == 100
+        sizes = session.exec(
+            select(func.count(TaskModel.id))
+            .where(TaskModel.project_id.is_not(None))
+            .group_by(TaskModel.project_id)
+        ).all()
+        late_tasks = session.exec(
+            select(func.count(TaskModel.id))
+            .join(ProjectModel)
+            .where(TaskModel.deadline > ProjectModel.deadline)
+        ).one()
+        open_in_completed = session.exec(
+            select(func.count(TaskModel.id))
+            .join(ProjectModel)
+            .where(ProjectModel.is_completed, TaskModel.is_completed.is_(False))
+        ).one()
+        completed_projects = session.exec(
+            select(func.count(ProjectModel.id)).where(ProjectModel.is_completed)
+        ).one()
+        seqs = session.exec(select(TaskModel.change_seq)).all()
+
+    assert summary.assigned_tasks == sum(sizes)
+    assert max(sizes) == summary.largest_project >= 10 * median(sizes)
+    assert late_tasks == 0
+    assert open_in_completed == 0
+    assert completed_projects == summary.completed_projects > 0
+    assert sorted(seqs) == list(range(1, 3001))
+
+
+def test_seed_reproduces_the_same_dataset(test_db, tmp_path) -> None:
+    other_db = create_engine(f"sqlite:///{tmp_path / 'other.db'}")
+    SQLModel.metadata.create_all(other_db)
+    config = SeedConfig(tasks=200, projects=10, seed=3)
+    now = datetime.now(timezone.utc)
+
+    def rows(engine) -> list[tuple]:
+        seed_database(engine, config, now=now)
+        with Session(engine) as session:
+            return session.exec(
+                select(
+                    TaskModel.id,
+                    TaskModel.project_id,
+                    TaskModel.deadline,
+                    TaskModel.is_completed,
+                ).order_by(TaskModel.id)
+            ).all()
+
+    try:
+        assert rows(test_db) == rows(other_db)
+    finally:
+        other_db.dispose()
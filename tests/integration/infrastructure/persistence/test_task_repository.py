@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.infrastructure.persistence.models.models import TaskModel
+from app.infrastructure.persistence.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+
+def test_update_many_issues_one_update_statement(test_db, session: Session) -> None:
+    deadline = datetime.now(timezone.utc) + timedelta(days=1)
+    session.add_all(TaskModel(title=f"task-{i}", deadline=deadline) for i in range(20))
+    session.commit()
+    repo = SQLAlchemyTaskRepository(session)
+    tasks = repo.get_all()
+    for task in tasks:
+        task.mark_as_completed()
+    updates = []
+    event.listen(
+        test_db,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_: (
+            updates.append(statement)
+            if statement.startswith("UPDATE taskmodel")
+            else None
+        ),
+    )
+
+    repo.update_many(tasks)
+
+    assert len(updates) == 1
+    assert all(task.is_completed for task in repo.get_all())
+    assert len({model.change_seq for model in session.exec(select(TaskModel))}) == 20
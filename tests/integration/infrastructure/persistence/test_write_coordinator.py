@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+
+from app.infrastructure.persistence.change_tracking import (
+    add_change_listener,
+    remove_change_listener,
+)
+from app.infrastructure.persistence.models.models import TaskModel
+from app.infrastructure.persistence.write_coordinator import (
+    WriteCoordinator,
+    create_writer_engine,
+)
+
+
+@pytest.fixture
+def writer_engine(test_db):
+    engine = create_writer_engine(test_db.url.render_as_string(hide_password=False))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def coordinator(writer_engine) -> WriteCoordinator:
+    coordinator = WriteCoordinator(writer_engine, max_batch_size=16, max_delay=0.05)
+    coordinator.start()
+    yield coordinator
+    coordinator.stop()
+
+
+def _add_task(title: str):
+    def work(session: Session) -> str:
+        task = TaskModel(
+            title=title, deadline=datetime.now(timezone.utc) + timedelta(days=1)
+        )
+        session.add(task)
+        session.commit()
+        return task.title
+
+    return work
+
+
+def _fail(session: Session) -> None:
+    session.add(TaskModel(title="rolled back"))
+    session.flush()
+    raise ValueError("boom")
+
+
+def test_units_are_group_committed(
+    coordinator: WriteCoordinator, writer_engine, session: Session
+) -> None:
+    commits = []
+    event.listen(writer_engine, "commit", lambda conn: commits.append(conn))
+
+    futures = [coordinator.submit(_add_task(f"task {i}")) for i in range(10)]
+
+    assert [f.result(timeout=5) for f in futures] == [f"task {i}" for i in range(10)]
+    assert len(session.exec(select(TaskModel)).all()) == 10
+    assert len(commits) < 10
+
+
+def test_failing_unit_is_rolled_back_alone(
+    coordinator: WriteCoordinator, session: Session
+) -> None:
+    ok = coordinator.submit(_add_task("kept"))
+    failed = coordinator.submit(_fail)
+
+    assert ok.result(timeout=5) == "kept"
+    with pytest.raises(ValueError, match="boom"):
+        failed.result(timeout=5)
+    titles = session.exec(select(TaskModel.title)).all()
+    assert titles == ["kept"]
+
+
+def test_change_listeners_are_notified_once_batch_commits(
+    coordinator: WriteCoordinator,
+) -> None:
+    listener = Mock()
+    add_change_listener(listener)
+    try:
+        coordinator.submit(_add_task("kept")).result(timeout=5)
+        with pytest.raises(ValueError):
+            coordinator.submit(_fail).result(timeout=5)
+    finally:
+        remove_change_listener(listener)
+
+    notified = [
+        c.values["title"] for call in listener.call_args_list for c in call.args[0]
+    ]
+    assert notified == ["kept"]
+
+
+def test_execute_runs_unit_and_returns_result(coordinator: WriteCoordinator) -> None:
+    assert coordinator.execute(_add_task("sync")) == "sync"
+
+
+def test_submit_requires_running_coordinator(writer_engine) -> None:
+    with pytest.raises(RuntimeError):
+        WriteCoordinator(writer_engine).submit(_add_task("never"))
+
+
+def test_batch_fails_every_caller_when_write_lock_is_unavailable(
+    test_db, writer_engine
+) -> None:
+    @event.listens_for(writer_engine, "connect")
+    def no_busy_wait(dbapi_conn, _connection_record) -> None:
+        dbapi_conn.execute("PRAGMA busy_timeout=0")
+
+    coordinator = WriteCoordinator(writer_engine, max_delay=0.05)
+    coordinator.start()
+    try:
+        with test_db.connect() as holder:
+            holder.exec_driver_sql("BEGIN IMMEDIATE")
+            futures = [coordinator.submit(_add_task(f"task {i}")) for i in range(3)]
+            for future in futures:
+                with pytest.raises(OperationalError, match="locked"):
+                    future.result(timeout=5)
+            holder.rollback()
+
+        assert coordinator.execute(_add_task("after")) == "after"
+    finally:
+        coordinator.stop()
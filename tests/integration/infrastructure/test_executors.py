@@ -0,0 +1,60 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+from app.infrastructure.executors import BoundedExecutor
+from app.infrastructure.metrics import MetricsRegistry
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_executor_bounds_concurrency_and_reports_queue() -> None:
+    metrics = MetricsRegistry()
+    executor = BoundedExecutor("test", max_workers=2, metrics=metrics)
+    running, peak, lock = 0, 0, threading.Lock()
+    queue_depths, queue_waits = [], []
+
+    def work() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    async def scenario() -> None:
+        calls = [asyncio.ensure_future(executor.run(work)) for _ in range(6)]
+        await asyncio.sleep(0.005)
+        queue_depths.append(executor.queue_depth)
+        queue_waits.append(executor.queue_wait)
+        await asyncio.gather(*calls)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    snapshot = metrics.snapshot()
+    assert peak == 2
+    assert queue_depths == [4]
+    assert queue_waits[0] > 0
+    assert executor.queue_wait == 0
+    assert snapshot["executor.test.queue_depth"] == 0
+    assert snapshot["executor.test.in_flight"] == 0
+    assert snapshot["executor.test.wait_seconds"]["count"] == 6
+    assert snapshot["executor.test.wait_seconds"]["sum"] > 0
+
+
+def test_executor_runs_with_callers_context() -> None:
+    executor = BoundedExecutor("context", max_workers=1, metrics=MetricsRegistry())
+
+    async def scenario() -> str:
+        request_id.set("abc")
+        return await executor.run(request_id.get)
+
+    try:
+        assert asyncio.run(scenario()) == "abc"
+    finally:
+        executor.shutdown()
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.executors import BoundedExecutor
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.persistence.cancellation import (
+    CancellationToken,
+    abort_if_cancelled,
+    set_current_token,
+)
+from app.infrastructure.single_flight import CoalescingReader, SingleFlight
+
+
+@pytest.fixture
+def executor() -> BoundedExecutor:
+    executor = BoundedExecutor(
+        "single-flight", max_workers=4, metrics=MetricsRegistry()
+    )
+    yield executor
+    executor.shutdown()
+
+
+class SlowRepository:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+        self.interrupted = False
+
+    def get_by_id(self, item_id: int) -> dict:
+        self.calls += 1
+        self.release.wait(1)
+        return {"id": item_id}
+
+    def get_interruptible(self, item_id: int) -> dict:
+        # Polls the request token the way SQLite's progress handler does.
+        self.calls += 1
+        while not self.release.wait(0.005):
+            if abort_if_cancelled():
+                self.interrupted = True
+                raise RuntimeError("interrupted")
+        return {"id": item_id}
+
+    def get_all(self) -> list:
+        raise RuntimeError("database is locked")
+
+
+def test_identical_concurrent_reads_share_one_call(executor) -> None:
+    repo = SlowRepository()
+    single_flight = SingleFlight()
+
+    async def scenario():
+        readers = [
+            CoalescingReader(executor, single_flight, ("/items/1", ()))
+            for _ in range(5)
+        ]
+        calls = [asyncio.ensure_future(r.run(repo.get_by_id, 1)) for r in readers]
+        await asyncio.sleep(0.01)
+        repo.release.set()
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(scenario())
+
+    assert results == [{"id": 1}] * 5
+    assert repo.calls == 1
+
+
+def test_different_keys_and_later_reads_are_not_coalesced(executor) -> None:
+    repo = SlowRepository()
+    repo.release.set()
+    single_flight = SingleFlight()
+
+    async def scenario():
+        first = CoalescingReader(executor, single_flight, ("/items/1", ()))
+        second = CoalescingReader(executor, single_flight, ("/items/2", ()))
+        await asyncio.gather(
+            first.run(repo.get_by_id, 1), second.run(repo.get_by_id, 2)
+        )
+        await first.run(repo.get_by_id, 1)
+
+    asyncio.run(scenario())
+
+    assert repo.calls == 3
+
+
+def test_errors_are_shared_with_every_caller(executor) -> None:
+    repo = SlowRepository()
+    single_flight = SingleFlight()
+
+    async def scenario():
+        readers = [
+            CoalescingReader(executor, single_flight, ("/items", ())) for _ in range(3)
+        ]
+        return await asyncio.gather(
+            *(r.run(repo.get_all) for r in readers), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_cancelled_leader_does_not_interrupt_followers(executor) -> None:
+    repo = SlowRepository()
+    single_flight = SingleFlight()
+
+    async def read(token: CancellationToken) -> dict:
+        set_current_token(token)
+        reader = CoalescingReader(executor, single_flight, ("/items/1", ()))
+        return await reader.run(repo.get_interruptible, 1)
+
+    async def scenario():
+        leader_token, follower_token = CancellationToken(), CancellationToken()
+        leader = asyncio.ensure_future(read(leader_token))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(read(follower_token))
+        await asyncio.sleep(0.01)
+        leader_token.cancel()
+        leader.cancel()
+        await asyncio.sleep(0.05)
+        repo.release.set()
+        return await follower
+
+    assert asyncio.run(scenario()) == {"id": 1}
+    assert repo.calls == 1
+    assert not repo.interrupted
+
+
+def test_shared_call_is_interrupted_once_every_caller_left(executor) -> None:
+    repo = SlowRepository()
+    single_flight = SingleFlight()
+    reader = CoalescingReader(executor, single_flight, ("/items/1", ()))
+
+    async def scenario():
+        calls = [
+            asyncio.ensure_future(reader.run(repo.get_interruptible, 1))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        for call in calls:
+            call.cancel()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+
+    assert repo.interrupted
@@ -0,0 +1,113 @@
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session
+
+from app import cli
+from app.cli import export_to_directory
+from app.infrastructure.persistence.models.models import ProjectModel, TaskModel
+from app.infrastructure.persistence.snapshot import read_snapshot
+from app.infrastructure.transfer import exporter
+from app.infrastructure.transfer.exporter import (
+    COLUMNS,
+    ColumnarFormat,
+    export_batches,
+    write_columnar,
+)
+from app.infrastructure.transfer.formats import TransferFormat
+from app.infrastructure.transfer.importer import TransferEntity
+
+
+def test_read_snapshot_ignores_later_writes(test_db) -> None:
+    deadline = datetime.now(timezone.utc)
+    with test_db.connect() as connection:
+        # Like the app's engine; without WAL the writer would wait on the reader.
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+    with Session(test_db) as session:
+        session.add(ProjectModel(title="before", deadline=deadline))
+        session.commit()
+
+    with read_snapshot(test_db) as snapshot:
+        first = [
+            r for b in export_batches(TransferEntity.PROJECTS, snapshot, 10) for r in b
+        ]
+        with Session(test_db) as session:
+            session.add(ProjectModel(title="after", deadline=deadline))
+            session.commit()
+        second = [
+            r for b in export_batches(TransferEntity.PROJECTS, snapshot, 10) for r in b
+        ]
+
+    assert [r["title"] for r in first] == [r["title"] for r in second] == ["before"]
+
+
+def test_export_to_directory_writes_one_file_per_entity(test_db, tmp_path) -> None:
+    deadline = datetime.now(timezone.utc)
+    with Session(test_db) as session:
+        project = ProjectModel(title="p", deadline=deadline)
+        session.add(project)
+        session.add_all(
+            TaskModel(title=f"t{i}", deadline=deadline, project_id=project.id)
+            for i in range(3)
+        )
+        session.commit()
+
+    written = export_to_directory(
+        test_db, tmp_path / "dump", TransferFormat.NDJSON, 2, list(TransferEntity)
+    )
+
+    assert written == {TransferEntity.PROJECTS: 1, TransferEntity.TASKS: 3}
+    tasks = (tmp_path / "dump" / "tasks.ndjson").read_text().splitlines()
+    assert sorted(json.loads(line)["title"] for line in tasks) == ["t0", "t1", "t2"]
+
+
+@pytest.mark.parametrize("columnar_format", list(ColumnarFormat))
+def test_write_columnar_round_trips_batches(tmp_path, columnar_format) -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    aware = datetime(2030, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    # SQLite hands back naive datetimes, which are UTC.
+    naive = aware.replace(tzinfo=None)
+    batches = [
+        [
+            {
+                "id": uuid4(),
+                "title": f"p{i}",
+                "deadline": naive if i % 2 else aware,
+                "is_completed": bool(i % 2),
+                "created_at": naive,
+                "updated_at": aware,
+            }
+            for i in range(start, start + 2)
+        ]
+        for start in (0, 2)
+    ]
+    path = tmp_path / f"projects.{columnar_format.value}"
+
+    rows = write_columnar(path, columnar_format, TransferEntity.PROJECTS, batches)
+
+    if columnar_format is ColumnarFormat.PARQUET:
+        table = pytest.importorskip("pyarrow.parquet").read_table(path)
+    else:
+        table = pyarrow.ipc.open_file(path).read_all()
+    assert rows == table.num_rows == 4
+    assert table.column_names == list(COLUMNS[TransferEntity.PROJECTS])
+    assert table.schema.field("deadline").type == pyarrow.timestamp("us", tz="UTC")
+    records = table.to_pylist()
+    assert [r["id"] for r in records] == [str(r["id"]) for b in batches for r in b]
+    assert {r["deadline"] for r in records} == {aware}
+    assert {r["created_at"] for r in records} == {aware}
+    assert [r["is_completed"] for r in records] == [False, True, False, True]
+
+
+def test_export_cli_requires_pyarrow_for_columnar_formats(
+    test_db, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(exporter, "pyarrow", None)
+    monkeypatch.setattr(cli, "get_read_engine", lambda: test_db)
+
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["export", str(tmp_path / "dump"), "--format", "parquet"])
+
+    assert exit_info.value.code == "Writing parquet files requires pyarrow"
@@ -0,0 +1,51 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from sqlmodel import Session, select
+
+from app.cli import import_stream
+from app.infrastructure.persistence.models.models import TaskModel
+from app.infrastructure.transfer.formats import CSVRowParser, TransferFormat
+from app.infrastructure.transfer.importer import TransferEntity
+
+
+def test_csv_parser_handles_rows_split_across_feeds() -> None:
+    text = 'title,description\r\na,"line one\nline ""two"""\r\nb,\n"open,x\n'
+    parser = CSVRowParser()
+
+    rows = [row for char in text for row in parser.feed(char)] + parser.close()
+
+    assert [(row.line, row.values, row.error) for row in rows] == [
+        (2, {"title": "a", "description": 'line one\nline "two"'}, None),
+        (4, {"title": "b", "description": None}, None),
+        (5, None, "Unterminated quoted field"),
+    ]
+
+
+def test_import_stream_writes_chunks_and_reports_errors(test_db) -> None:
+    deadline = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    lines = [json.dumps({"title": f"t{i}", "deadline": deadline}) for i in range(5)]
+    lines.insert(2, json.dumps({"title": "no deadline"}))
+    out, err = io.StringIO(), io.StringIO()
+
+    upload = import_stream(
+        test_db,
+        TransferEntity.TASKS,
+        io.BytesIO("\n".join(lines).encode()),
+        TransferFormat.NDJSON,
+        chunk_size=2,
+        out=out,
+        err=err,
+    )
+
+    assert (upload.rows, upload.imported, upload.failed) == (6, 5, 1)
+    assert json.loads(out.getvalue()) == {
+        "type": "error",
+        "line": 3,
+        "error": "deadline: Field required",
+    }
+    progress = [json.loads(line) for line in err.getvalue().splitlines()]
+    assert [event["rows"] for event in progress] == [2, 4, 6, 6]
+    with Session(test_db) as session:
+        assert len(session.exec(select(TaskModel)).all()) == 5
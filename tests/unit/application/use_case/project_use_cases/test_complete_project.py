@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+from app.application.use_cases.project_use_cases.complete_project import (
+    CompleteProjectUseCase,
+)
+from app.domain.entities.project import Project
+
+
+def test_complete_project_updates_the_existing_project(
+    project_repository: Mock, task_repository: Mock
+) -> None:
+    now = datetime.now(timezone.utc)
+    project = Project(
+        id=uuid4(),
+        title="Project",
+        deadline=now + timedelta(days=30),
+        is_completed=False,
+        created_at=now,
+        updated_at=now,
+    )
+    project_repository.get_by_id.return_value = project
+    project_repository.update.side_effect = lambda p: p
+    task_repository.get_by_project_id.return_value = []
+    use_case = CompleteProjectUseCase(project_repository, task_repository)
+
+    result = use_case.execute(project.id)
+
+    assert result.is_completed is True
+    project_repository.update.assert_called_once_with(project)
+    project_repository.save.assert_not_called()
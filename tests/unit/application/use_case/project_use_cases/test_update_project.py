@@ -8,24 +8,24 @@ from app.application.use_cases.project_use_cases.update_project import (
     UpdateProjectUseCase,
 )
 from app.domain.entities.project import Project
-from app.domain.event_handlers import ProjectDeadlineChangedHandler
+from app.domain.event_bus import EventBus
+from app.domain.events import ProjectDeadlineChangedEvent
 from app.domain.exceptions import NotFoundError, ValidationError
 
 
 @pytest.fixture
-def deadline_handler() -> Mock:
-    return Mock(spec=ProjectDeadlineChangedHandler)
+def event_bus() -> Mock:
+    return Mock(spec=EventBus)
 
 
 @pytest.fixture
 def use_case(
     project_repository: Mock,
-    deadline_handler: Mock,
+    event_bus: Mock,
 ) -> UpdateProjectUseCase:
     return UpdateProjectUseCase(
         project_repository=project_repository,
-        deadline_handler=deadline_handler,
-        auto_adjust_task_deadlines=True,
+        event_bus=event_bus,
     )
 
 
@@ -75,7 +75,7 @@ def test_deadline_in_past_raises_validation_error(
 def test_update_title_only(
     use_case: UpdateProjectUseCase,
     project_repository: Mock,
-    deadline_handler: Mock,
+    event_bus: Mock,
     sample_project: Project,
 ) -> None:
     project_repository.get_by_id.return_value = sample_project
@@ -85,18 +85,22 @@ def test_update_title_only(
 
     project_repository.get_by_id.assert_called_once_with(sample_project.id)
     project_repository.update.assert_called_once_with(sample_project)
-    deadline_handler.handle.assert_not_called()
+    event_bus.collect.assert_not_called()
 
     assert result.id == sample_project.id
     assert result.title == "Updated Title"
 
 
-def test_update_deadline_triggers_handler(
-    use_case: UpdateProjectUseCase,
+def test_update_deadline_publishes_event(
     project_repository: Mock,
-    deadline_handler: Mock,
     sample_project: Project,
 ) -> None:
+    published = []
+    event_bus = EventBus()
+    event_bus.subscribe(ProjectDeadlineChangedEvent, published.append)
+    use_case = UpdateProjectUseCase(
+        project_repository=project_repository, event_bus=event_bus
+    )
     project_repository.get_by_id.return_value = sample_project
     new_deadline = datetime.now(timezone.utc) + timedelta(days=60)
     dto = UpdateProjectDTO(deadline=new_deadline)
@@ -105,10 +109,32 @@ def test_update_deadline_triggers_handler(
 
     project_repository.get_by_id.assert_called_once_with(sample_project.id)
     project_repository.update.assert_called_once_with(sample_project)
-    assert deadline_handler.handle.call_count >= 1
+    assert len(published) == 1
+    assert published[0].project_id == sample_project.id
+    assert published[0].new_deadline == new_deadline
     assert result.deadline == new_deadline
 
 
+def test_subscriber_error_aborts_update(
+    project_repository: Mock,
+    sample_project: Project,
+) -> None:
+    def reject(_event: ProjectDeadlineChangedEvent) -> None:
+        raise ValidationError("Project contains task(s) with later deadline(s)")
+
+    event_bus = EventBus()
+    event_bus.subscribe(ProjectDeadlineChangedEvent, reject)
+    use_case = UpdateProjectUseCase(
+        project_repository=project_repository, event_bus=event_bus
+    )
+    project_repository.get_by_id.return_value = sample_project
+    dto = UpdateProjectDTO(deadline=datetime.now(timezone.utc) + timedelta(days=60))
+
+    with pytest.raises(ValidationError):
+        use_case.execute(dto, sample_project.id)
+    project_repository.update.assert_not_called()
+
+
 def test_update_multiple_fields(
     use_case: UpdateProjectUseCase,
     project_repository: Mock,
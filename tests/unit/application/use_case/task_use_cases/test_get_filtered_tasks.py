@@ -7,6 +7,7 @@ from app.application.dto.task_dto import TaskFilterDTO
 from app.application.use_cases.task_use_cases.get_filtered_tasks import (
     GetFilteredTasksUseCase,
 )
+from app.domain.clock import FixedClock
 from app.domain.entities.task import Task
 
 
@@ -335,3 +336,37 @@ def test_filter_tasks_without_project(
     tasks_without_project = [task for task in result if task.project_id is None]
     assert len(tasks_without_project) == 1
     assert tasks_without_project[0].title == "Task without Project"
+
+
+def test_overdue_evaluated_against_injected_clock(
+    task_repository: Mock,
+    sample_tasks: list[Task],
+) -> None:
+    task_repository.get_all.return_value = sample_tasks
+    clock = FixedClock(datetime.now(timezone.utc) + timedelta(days=20))
+    use_case = GetFilteredTasksUseCase(task_repository=task_repository, clock=clock)
+    filters = TaskFilterDTO(is_overdue=True)
+
+    result = use_case.execute(filters)
+
+    assert len(result) == 3
+    assert all(task.is_overdue and not task.is_completed for task in result)
+
+
+def test_overdue_flag_consistent_without_filter(
+    task_repository: Mock,
+    sample_tasks: list[Task],
+) -> None:
+    task_repository.get_all.return_value = sample_tasks
+    clock = FixedClock(datetime.now(timezone.utc) + timedelta(days=20))
+    use_case = GetFilteredTasksUseCase(task_repository=task_repository, clock=clock)
+
+    result = use_case.execute(TaskFilterDTO())
+
+    assert [task.is_overdue for task in result] == [
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
@@ -367,3 +367,10 @@ def test_validate_deadline_against_project_with_none_deadlines(
     project_id = uuid4()
     task_without_deadline.assign_to_project(project_id, None)
     assert task_without_deadline.project_id == project_id
+
+
+def test_is_overdue_uses_given_now(task: Task) -> None:
+    task.deadline = datetime.now(timezone.utc) + timedelta(days=1)
+
+    assert not task.is_overdue(datetime.now(timezone.utc))
+    assert task.is_overdue(task.deadline + timedelta(seconds=1))
@@ -0,0 +1,139 @@
+from datetime import datetime, timezone, timedelta
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.event_bus import EventBus
+from app.domain.events import DomainEvent, ProjectDeadlineChangedEvent
+
+
+def _deadline_changed(
+    project_id, old_days: int, new_days: int, at: datetime
+) -> ProjectDeadlineChangedEvent:
+    now = datetime.now(timezone.utc)
+    return ProjectDeadlineChangedEvent(
+        occurred_at=at,
+        project_id=project_id,
+        old_deadline=now + timedelta(days=old_days),
+        new_deadline=now + timedelta(days=new_days),
+    )
+
+
+def test_publish_buffers_until_flush() -> None:
+    subscriber = Mock()
+    bus = EventBus()
+    bus.subscribe(ProjectDeadlineChangedEvent, subscriber)
+    event = _deadline_changed(uuid4(), 10, 5, datetime.now(timezone.utc))
+
+    bus.publish(event)
+    subscriber.assert_not_called()
+
+    bus.flush()
+    subscriber.assert_called_once_with(event)
+    assert bus.pending_events() == []
+
+
+def test_subscribers_of_base_type_receive_all_events() -> None:
+    subscriber = Mock()
+    bus = EventBus()
+    bus.subscribe(DomainEvent, subscriber)
+
+    bus.publish(_deadline_changed(uuid4(), 10, 5, datetime.now(timezone.utc)))
+    bus.flush()
+
+    subscriber.assert_called_once()
+
+
+def test_events_for_same_aggregate_within_window_are_coalesced() -> None:
+    subscriber = Mock()
+    bus = EventBus(coalesce_window=timedelta(seconds=1))
+    bus.subscribe(ProjectDeadlineChangedEvent, subscriber)
+    project_id = uuid4()
+    start = datetime.now(timezone.utc)
+    events = [
+        _deadline_changed(project_id, 10, 8, start),
+        _deadline_changed(project_id, 8, 6, start + timedelta(milliseconds=500)),
+        _deadline_changed(project_id, 6, 4, start + timedelta(milliseconds=900)),
+    ]
+
+    for event in events:
+        bus.publish(event)
+    bus.flush()
+
+    subscriber.assert_called_once()
+    (merged,) = subscriber.call_args.args
+    assert merged.old_deadline == events[0].old_deadline
+    assert merged.new_deadline == events[-1].new_deadline
+
+
+def test_events_outside_window_are_not_coalesced() -> None:
+    subscriber = Mock()
+    bus = EventBus(coalesce_window=timedelta(seconds=1))
+    bus.subscribe(ProjectDeadlineChangedEvent, subscriber)
+    project_id = uuid4()
+    start = datetime.now(timezone.utc)
+
+    bus.publish(_deadline_changed(project_id, 10, 8, start))
+    bus.publish(_deadline_changed(project_id, 8, 6, start + timedelta(seconds=2)))
+    bus.publish(_deadline_changed(uuid4(), 8, 6, start + timedelta(seconds=2)))
+    bus.flush()
+
+    assert subscriber.call_count == 3
+
+
+def test_flush_with_now_keeps_unsettled_groups_pending() -> None:
+    subscriber = Mock()
+    window = timedelta(seconds=1)
+    bus = EventBus(coalesce_window=window)
+    bus.subscribe(ProjectDeadlineChangedEvent, subscriber)
+    start = datetime.now(timezone.utc)
+    settled = _deadline_changed(uuid4(), 10, 8, start - 2 * window)
+    recent = _deadline_changed(uuid4(), 10, 8, start)
+    bus.publish(settled)
+    bus.publish(recent)
+
+    bus.flush(now=start)
+
+    subscriber.assert_called_once_with(settled)
+    assert bus.pending_events() == [recent]
+
+
+def test_flush_reraises_subscriber_error_without_callback() -> None:
+    bus = EventBus()
+    bus.subscribe(ProjectDeadlineChangedEvent, Mock(side_effect=ValueError("boom")))
+    bus.publish(_deadline_changed(uuid4(), 10, 5, datetime.now(timezone.utc)))
+
+    with pytest.raises(ValueError):
+        bus.flush()
+
+
+def test_flush_reports_subscriber_error_with_source_events() -> None:
+    on_error = Mock()
+    error = ValueError("boom")
+    bus = EventBus(coalesce_window=timedelta(seconds=1))
+    bus.subscribe(ProjectDeadlineChangedEvent, Mock(side_effect=error))
+    project_id = uuid4()
+    start = datetime.now(timezone.utc)
+    events = [
+        _deadline_changed(project_id, 10, 8, start),
+        _deadline_changed(project_id, 8, 6, start),
+    ]
+    for event in events:
+        bus.publish(event)
+
+    bus.flush(on_error=on_error)
+
+    on_error.assert_called_once_with(events, error)
+
+
+def test_discard_drops_pending_events() -> None:
+    subscriber = Mock()
+    bus = EventBus()
+    bus.subscribe(ProjectDeadlineChangedEvent, subscriber)
+    bus.publish(_deadline_changed(uuid4(), 10, 5, datetime.now(timezone.utc)))
+
+    bus.discard()
+    bus.flush()
+
+    subscriber.assert_not_called()